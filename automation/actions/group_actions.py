@@ -1,7 +1,7 @@
-import pyautogui
 import time
 from automation.automation_config import AutomationSettings
 from automation.exceptions import UIVisibilityError
+from . import ui_helpers
 
 
 def find_and_expand_group(manager, group_name, slots_for_group=None):
@@ -43,6 +43,7 @@ def find_and_expand_group(manager, group_name, slots_for_group=None):
                     manager.group_header_cache[group_name] = header_image
                     manager.vision.log(f"  - Re-locating with newly cached image for precision.")
                     vision_bbox = manager.vision.find_image_box(header_image, region=ocr_region, confidence=0.9)
+                    manager.group_header_positions[group_name] = vision_bbox if vision_bbox else ocr_bbox
                     return vision_bbox if vision_bbox else ocr_bbox
                 manager.vision.log(f"  - Warning: Failed to capture image for group '{group_name}'. Using OCR box.")
             except Exception as e:
@@ -50,6 +51,23 @@ def find_and_expand_group(manager, group_name, slots_for_group=None):
             
             return ocr_bbox
         cached_image = manager.group_header_cache.get(group_name)
+        cached_position = manager.group_header_positions.get(group_name)
+        manager.metrics.record_cache_lookup('group_header_cache', cached_image is not None)
+        
+        if cached_image and cached_position:
+            margin = 10
+            verify_region = (
+                int(cached_position[0] - margin), int(cached_position[1] - margin),
+                int(cached_position[2] + margin * 2), int(cached_position[3] + margin * 2)
+            )
+            manager.vision.log(f"  - Verifying group '{group_name}' at its cached position {verify_region}.")
+            location = manager.vision.find_image_box(cached_image, region=verify_region, confidence=0.95)
+            
+            if location:
+                manager.vision.log(f"  - Verified group '{group_name}' at its cached position.")
+                manager.group_header_positions[group_name] = location
+                return location
+            del manager.group_header_positions[group_name]
         
         if cached_image:
             manager.vision.log(f"  - Attempting to find group '{group_name}' using cached image.")
@@ -57,8 +75,21 @@ def find_and_expand_group(manager, group_name, slots_for_group=None):
             
             if location:
                 manager.vision.log(f"  - Found group '{group_name}' via cached image.")
+                manager.group_header_positions[group_name] = location
                 return location
             manager.vision.log(f"  - Cached image for '{group_name}' not found. Falling back to other methods.")
+        panel_group = manager.panel.find_group(search_names)
+        
+        if panel_group:
+            header_bbox = panel_group['header_bbox']
+            manager.vision.log(f"  - Found group '{group_name}' in the panel model at {header_bbox}.")
+            manager.group_x_positions.append(header_bbox[0])
+            manager.group_header_positions[group_name] = header_bbox
+            header_image = manager.vision.screenshot(region=header_bbox)
+            
+            if header_image:
+                manager.group_header_cache[group_name] = header_image
+            return header_bbox
         manager.vision.log("  - Trying targeted OCR strategy based on group icons.")
         expanded_arrows = manager.vision.find_all_images('group_expanded.png', region=ocr_region, confidence=0.8)
         collapsed_arrows = manager.vision.find_all_images('group_collapsed.png', region=ocr_region, confidence=0.8)
@@ -111,13 +142,20 @@ def find_and_expand_group(manager, group_name, slots_for_group=None):
     
     if not group_header:
         if ocr_region:
-            pyautogui.moveTo(ocr_region[0] + 150, ocr_region[1] + 200, duration=0.2)
+            manager.controller.move_to(ocr_region[0] + 150, ocr_region[1] + 200)
+        
+        unmoved_scrolls = 0
         
         for _ in range(5):
-            manager.controller.scroll(-200); manager._interruptible_sleep(AutomationSettings.SCROLL_DELAY)
+            dy = ui_helpers.scroll_panel(manager, -200, ocr_region)
             group_header = attempt_to_find_header()
             
             if group_header: break
+            unmoved_scrolls = unmoved_scrolls + 1 if dy == 0 else 0
+            
+            if unmoved_scrolls >= 2:
+                manager.vision.log("  - Panel did not move after scrolling. Reached the end of the group list.")
+                break
     
     if not group_header:
         raise UIVisibilityError(f"Could not find group '{group_name}'.")
@@ -130,13 +168,37 @@ def find_and_expand_group(manager, group_name, slots_for_group=None):
     
     if collapsed_arrow:
         manager.controller.click(collapsed_arrow)
-        expanded_arrow = manager._wait_for_element('group_expanded.png', timeout=AutomationSettings.GENERIC_ELEMENT_TIMEOUT, region=arrow_search_region)
+        manager.panel.invalidate_below(collapsed_arrow.y)
+        expanded_arrow = manager._wait_for_element(
+            'group_expanded.png', timeout=AutomationSettings.GENERIC_ELEMENT_TIMEOUT, region=arrow_search_region, latency_key='element_appear'
+        )
         
         if expanded_arrow:
             return group_header, expanded_arrow
     raise UIVisibilityError(f"Cannot determine state of group '{group_name}'.")
 
 
+def verify_group_header(manager, group_name, group_header_coords, margin=10):
+    """
+    Cheaply checks that a group header is still where it was last found by matching its
+    cached image in a small region around it. Returns False if it cannot be confirmed.
+    """
+    cached_image = manager.group_header_cache.get(group_name)
+    
+    if not cached_image:
+        return False
+    verify_region = (
+        int(group_header_coords[0] - margin), int(group_header_coords[1] - margin),
+        int(group_header_coords[2] + margin * 2), int(group_header_coords[3] + margin * 2)
+    )
+    location = manager.vision.find_image_box(cached_image, region=verify_region, confidence=0.95)
+    
+    if not location:
+        manager.vision.log(f"  - Group '{group_name}' is no longer at {group_header_coords}.")
+        return False
+    return True
+
+
 def get_textures_in_group(manager, group_header_coords, group_arrow_coords):
     manager._check_for_stop()
     ocr_region = None
@@ -149,6 +211,11 @@ def get_textures_in_group(manager, group_header_coords, group_arrow_coords):
         ocr_region = (int(ocr_left), int(ocr_top), int(ocr_width), int(ocr_height))
     
     if not ocr_region: ocr_region = manager.vision.app_region
+    model_textures = manager.panel.get_textures(group_header_coords)
+    
+    if model_textures is not None:
+        manager.vision.log(f"  - Panel model lists {len(model_textures)} textures in group.")
+        return [{'texture_item_coords': item_coords} for item_coords in model_textures]
     search_y_start = group_header_coords[1] + group_header_coords[3]
     search_x = group_header_coords[0]
     search_width = 400
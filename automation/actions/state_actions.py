@@ -1,3 +1,7 @@
+from automation.exceptions import UIVisibilityError
+from . import group_actions
+
+
 def compute_new_texture_map_from_ui(manager, slots_data):
     new_map = {}
     slots_by_group = {}
@@ -30,3 +34,26 @@ def compute_new_texture_map_from_ops(manager, old_map, removed_by_group, uploade
             new_map[group_name] = new_order
     manager.vision.log(f"Computed new texture map from operations: {new_map}")
     return new_map
+
+
+def verify_texture_map(manager, texture_map, slots_data):
+    """
+    Cheaply checks a saved texture map against the Creator by comparing the number of
+    textures in each mapped group. Returns False on the first mismatch.
+    """
+    
+    for group_name, slot_ids in sorted(texture_map.items()):
+        manager._check_for_stop()
+        slots_for_group = [s for s in slots_data if s.get('group') == group_name]
+        try:
+            group_header, group_arrow = group_actions.find_and_expand_group(manager, group_name, slots_for_group)
+        except UIVisibilityError as e:
+            manager.vision.log(f"  - Could not verify group '{group_name}': {e}")
+            return False
+        web_textures = group_actions.get_textures_in_group(manager, group_header, group_arrow)
+        
+        if len(web_textures) != len(slot_ids):
+            manager.vision.log(f"  - Group '{group_name}' has {len(web_textures)} textures, but the saved map expects {len(slot_ids)}.")
+            return False
+        manager.vision.log(f"  - Group '{group_name}' matches the saved map ({len(slot_ids)} textures).")
+    return True
@@ -1,10 +1,9 @@
 import time
 import os
-import platform
-import pyperclip
 from PIL import Image
 from automation.automation_config import AutomationSettings
-from automation.exceptions import UIVisibilityError
+from automation.exceptions import AutomationStoppedError, UIVisibilityError
+from automation import form_locator
 from . import group_actions
 
 
@@ -15,24 +14,46 @@ def manage_textures(manager, slots_to_manage):
     if not slots_to_manage:
         manager.vision.log("  - No updated textures to manage in this run. Skipping phase.")
         return uploaded_slots_by_group
-    num_slots_to_manage = len(slots_to_manage)
+    slots_by_group = {}
     
-    for i, slot_data in enumerate(slots_to_manage):
-        is_last_slot = (i == num_slots_to_manage - 1)
+    for slot_data in slots_to_manage:
+        if not (slot_data.get('group') and slot_data.get('image_path')):
+            continue
+        
+        if slot_data['group'] not in slots_by_group:
+            slots_by_group[slot_data['group']] = []
+        slots_by_group[slot_data['group']].append(slot_data)
+    num_slots_to_manage = sum(len(group_slots) for group_slots in slots_by_group.values())
+    slots_processed = 0
+    log_callback = manager.vision.log
+    
+    for group, group_slots in slots_by_group.items():
         manager._check_for_stop()
-        log_callback = manager.vision.log
-        log_callback(f"\nProcessing texture: {slot_data['image_path']}")
+        log_callback(f"\nUploading {len(group_slots)} texture(s) to group '{group}'")
         
-        if slot_data.get('group') and slot_data.get('image_path'):
-            group_header_coords, _ = group_actions.find_and_expand_group(manager, slot_data['group'], [slot_data])
-            
-            if group_header_coords:
+        with manager.tracer.span(group, 'group', action='find'):
+            group_header_coords, _ = group_actions.find_and_expand_group(manager, group, group_slots)
+        
+        if not group_header_coords:
+            continue
+        
+        for slot_data in group_slots:
+            with manager.tracer.span(f"slot {slot_data['slot_id'] + 1}", 'slot', group=group):
+                slots_processed += 1
+                is_last_slot = (slots_processed == num_slots_to_manage)
                 manager._check_for_stop()
+                log_callback(f"\nProcessing texture: {slot_data['image_path']}")
+                
+                if slot_data is not group_slots[0] and not group_actions.verify_group_header(manager, group, group_header_coords):
+                    group_header_coords, _ = group_actions.find_and_expand_group(manager, group, group_slots)
+                start_time = time.monotonic()
                 upload_texture_to_group(manager, group_header_coords, slot_data['image_path'])
                 manager._interruptible_sleep(AutomationSettings.POST_UPLOAD_FINISH_DELAY)
+                manager.record_operation('upload', start_time)
                 manager._check_for_stop()
+                start_time = time.monotonic()
                 apply_texture_settings(manager, slot_data['values'], is_last_slot=is_last_slot)
-                group = slot_data['group']
+                manager.record_operation('settings', start_time)
                 
                 if group not in uploaded_slots_by_group:
                     uploaded_slots_by_group[group] = []
@@ -42,6 +63,7 @@ def manage_textures(manager, slots_to_manage):
 
 def remove_texture(manager, texture_item_coords):
     manager._check_for_stop()
+    start_time = time.monotonic()
     selection_click_point = (texture_item_coords.x, texture_item_coords.y - 10)
     manager.controller.click(selection_click_point)
     more_button_search_region = (
@@ -51,12 +73,14 @@ def remove_texture(manager, texture_item_coords):
         100
     )
     manager.vision.log(f"More Button Search Region: {more_button_search_region}")
-    more_button_coords = manager._wait_for_element('more_button.png', timeout=AutomationSettings.MENU_TIMEOUT, region=more_button_search_region)
+    more_button_coords = manager._wait_for_element(
+        'more_button.png', timeout=AutomationSettings.MENU_TIMEOUT, region=more_button_search_region, latency_key='menu_open'
+    )
     
     if not more_button_coords:
         raise UIVisibilityError(f"Could not find 'more' button for texture at {texture_item_coords}")
-    manager.controller.click(more_button_coords)
-
+    manager.controller.click(more_button_coords, hover=True)
+    
     remove_menu_region = (
         int(more_button_coords.x - 75),
         int(more_button_coords.y - 20),
@@ -68,155 +92,181 @@ def remove_texture(manager, texture_item_coords):
         'remove_button.png',
         timeout=AutomationSettings.MENU_TIMEOUT,
         region=remove_menu_region,
-        cache_key='remove_button_context_menu'
+        cache_key='remove_button_context_menu',
+        latency_key='menu_open'
     )
-
+    
     if not remove_button:
         raise UIVisibilityError(f"Could not find 'remove' button after clicking 'more' at {more_button_coords}")
-
-    manager.controller.click(remove_button)
+    
+    manager.controller.click(remove_button, hover=True)
     confirm_button = manager._wait_for_element(
         'remove_confirm_button.png',
         timeout=AutomationSettings.DIALOG_TIMEOUT,
-        cache_key='remove_confirm_dialog'
+        cache_key='remove_confirm_dialog',
+        latency_key='dialog_open'
     )
     manager.controller.click(confirm_button)
+    manager.record_operation('remove', start_time)
 
 
 def upload_texture_to_group(manager, group_header_coords, image_path):
     manager._check_for_stop()
     manager.vision.log(f"  - Action: Uploading '{image_path}' to group.")
-    search_region = (group_header_coords[0], group_header_coords[1], 400, manager.vision.app_region[3] - group_header_coords[1])
-    upload_button_coords = manager.vision.find_image('group_upload_button.png', region=search_region)
+    upload_button_coords = manager.panel.get_upload_button(group_header_coords)
+    
+    if not upload_button_coords:
+        search_region = (group_header_coords[0], group_header_coords[1], 400, manager.vision.app_region[3] - group_header_coords[1])
+        upload_button_coords = manager.vision.find_image('group_upload_button.png', region=search_region)
     
     if not upload_button_coords:
         raise UIVisibilityError("Could not find group upload button.")
     manager.controller.click(upload_button_coords)
-    choose_file_coords = manager._wait_for_element('choose_file_button.png', timeout=AutomationSettings.CHOOSE_FILE_TIMEOUT)
+    manager.panel.invalidate_below(group_header_coords[1])
+    choose_file_coords = manager._wait_for_element(
+        'choose_file_button.png', timeout=AutomationSettings.CHOOSE_FILE_TIMEOUT, latency_key='choose_file_open'
+    )
     manager.controller.click(choose_file_coords)
     manager._interruptible_sleep(AutomationSettings.POST_UPLOAD_DIALOG_DELAY)
     manager.vision.log(f"  - Waited {AutomationSettings.POST_UPLOAD_DIALOG_DELAY} seconds for dialog to appear.")
     real_path = os.path.realpath(image_path)
     manager.vision.log("  - Using robust clipboard paste for file path.")
-    original_clipboard = None
     try:
-        original_clipboard = pyperclip.paste()
-        manager.vision.log(f"  - Attempting to copy '{real_path}' to clipboard.")
-        pyperclip.copy(real_path)
-        
-        max_wait = 2.0
-        start_time = time.time()
-        while time.time() - start_time < max_wait:
-            if pyperclip.paste() == real_path:
-                manager.vision.log("  - Clipboard content verified.")
-                break
-            manager._interruptible_sleep(0.05)
-        else:
-            raise UIVisibilityError("Failed to verify clipboard content after 2s.")
-
-        paste_key = "command" if platform.system() == "Darwin" else "ctrl"
-        manager.vision.log(f"  - Performing robust paste action (holding '{paste_key}' and pressing 'v').")
-        manager.controller.key_down(paste_key)
-        manager.controller.press('v')
-        manager.controller.key_up(paste_key)
-        manager._interruptible_sleep(AutomationSettings.POST_PASTE_DELAY)
+        manager.controller.paste_text(real_path, post_paste_delay=AutomationSettings.POST_PASTE_DELAY)
         manager.controller.press('enter')
+    except AutomationStoppedError:
+        raise
     except Exception as e:
         manager.vision.log(f"  - Clipboard paste method failed: {e}. Falling back to slower typing method.")
-        manager.controller.write(real_path, interval=0.01)
+        manager.controller.write(real_path, interval=0.01, mode='per_char')
         manager.controller.press('enter')
-    finally:
-        if original_clipboard is not None:
-            pyperclip.copy(original_clipboard)
-            manager.vision.log("  - Original clipboard content restored.")
+
+
+def diff_texture_values(values, defaults):
+    """
+    Returns the keys whose target value differs from the Creator's default for a freshly
+    uploaded texture. Keys missing from the defaults are compared against False (e.g. the
+    flip toggles).
+    """
+    changed = []
+    
+    for key, target_value in values.items():
+        if target_value is None:
+            continue
+        default_value = defaults.get(key)
+        
+        if isinstance(target_value, bool) or default_value is None:
+            if bool(target_value) != bool(default_value):
+                changed.append(key)
+        elif abs(target_value - default_value) >= 1e-4:
+            changed.append(key)
+    return changed
 
 
 def apply_texture_settings(manager, values, is_last_slot=False):
+    """
+    Enters the texture settings that differ from the Creator's defaults. Every upload
+    creates a new texture, so those defaults are what the texture starts with. All input
+    labels are located together in one capture of the settings form; fields the form
+    locator misses fall back to a per-field search. The form locator and the fallbacks
+    share one GENERIC_ELEMENT_TIMEOUT deadline.
+    """
     manager._check_for_stop()
+    changed_keys = diff_texture_values(values, AutomationSettings.DEFAULT_TEXTURE_VALUES)
     last_set_entry_coords = None
     manager.vision.log("  - Action: Applying texture settings.")
     
+    for key in values:
+        if key not in changed_keys:
+            manager.vision.log(f"  - Skipping '{key}' as its value ({values[key]}) is unchanged.")
+    adjust_icon_coords = None
+    
     for panel_icon in ['adjust_panel_icon.png', 'repeat_panel_icon.png']:
         icon_coords = manager._find_image_with_cache(panel_icon, cache_key=panel_icon)
         
         if icon_coords:
+            if panel_icon == 'adjust_panel_icon.png':
+                adjust_icon_coords = icon_coords
             search_region = (int(icon_coords[0] + 50), int(icon_coords[1] - 10), 300, 40)
             collapsed_arrow = manager.vision.find_image('panel_collapsed.png', region=search_region)
             
             if collapsed_arrow:
                 manager.controller.click(collapsed_arrow)
-    param_map = {'size': 'size_input.png', 'angle': 'angle_input.png', 'opacity': 'opacity_input.png'}
+                manager.panel.invalidate_below(collapsed_arrow.y)
+    numeric_keys = [key for key in form_locator.FIELD_TEMPLATES if key in changed_keys]
+    deadline = time.monotonic() + AutomationSettings.GENERIC_ELEMENT_TIMEOUT
+    form = form_locator.locate_settings_form(manager, numeric_keys, anchor_point=adjust_icon_coords) if numeric_keys else {}
     
-    for key, template_name in param_map.items():
-        target_value = values.get(key)
-        default_value = AutomationSettings.DEFAULT_TEXTURE_VALUES.get(key)
-        
-        if target_value is not None and default_value is not None and abs(target_value - default_value) < 1e-4:
-            manager.vision.log(f"  - Skipping '{key}' as its value ({target_value:.3f}) matches the default.")
-            continue
-        _, entry_coords = set_parameter_value(manager, key, template_name, values)
+    for key in numeric_keys:
+        manager._check_for_stop()
         
-        if entry_coords:
-            last_set_entry_coords = entry_coords
-    manager.vision.log("  - Setting X and Y positions with stricter logic...")
-    target_x = values.get('x_position')
-    default_x = AutomationSettings.DEFAULT_TEXTURE_VALUES.get('x_position')
-    x_pos_coords = None
-    
-    if target_x is not None and default_x is not None and abs(target_x - default_x) < 1e-4:
-        manager.vision.log(f"  - Skipping 'x_position' as its value ({target_x:.3f}) matches the default.")
-        x_pos_coords = manager.vision.find_image('x_pos_input.png')
-    else:
-        x_pos_coords, entry_coords = set_parameter_value(manager, 'x_position', 'x_pos_input.png', values)
+        if key in form:
+            entry_coords = enter_parameter_value(manager, key, form[key]['entry'], values)
+        elif key == 'y_position':
+            x_pos_coords = form['x_position']['label'] if 'x_position' in form else manager.vision.find_image('x_pos_input.png')
+            
+            if not x_pos_coords:
+                manager.vision.log("  - Skipping Y position because X position was not found.")
+                continue
+            y_search_region = (int(x_pos_coords[0] - 150), int(x_pos_coords[1] + 5), 300, 75)
+            manager.vision.log(f"y_search_region: {y_search_region}")
+            _, entry_coords = set_parameter_value(
+                manager, key, 'y_pos_input.png', values, region=y_search_region, timeout=deadline - time.monotonic()
+            )
+        else:
+            _, entry_coords = set_parameter_value(
+                manager, key, form_locator.FIELD_TEMPLATES[key], values, timeout=deadline - time.monotonic()
+            )
         
         if entry_coords:
             last_set_entry_coords = entry_coords
     
-    if x_pos_coords:
-        y_search_region = (int(x_pos_coords[0] - 150), int(x_pos_coords[1] + 5), 300, 75)
-        target_y = values.get('y_position')
-        default_y = AutomationSettings.DEFAULT_TEXTURE_VALUES.get('y_position')
-        
-        if target_y is not None and default_y is not None and abs(target_y - default_y) < 1e-4:
-            manager.vision.log(f"  - Skipping 'y_position' as its value ({target_y:.3f}) matches the default.")
-        else:
-            _, entry_coords = set_parameter_value(manager, 'y_position', 'y_pos_input.png', values, region=y_search_region)
-            
-            if entry_coords:
-                last_set_entry_coords = entry_coords
-        manager.vision.log(f"y_search_region: {y_search_region}")
-    else:
-        manager.vision.log("  - Skipping Y position because X position was not found.")
-    
     if is_last_slot:
         if last_set_entry_coords:
             manager.vision.log("  - Applying final click to confirm last input.")
             final_click_point = (last_set_entry_coords[0] - 30, last_set_entry_coords[1])
             manager.controller.click(final_click_point)
+            manager.panel.invalidate_below(final_click_point[1])
         else:
             manager.vision.log("  - No numeric parameters were set for the last slot, skipping final confirmation click.")
     
-    if values.get('h_flip'):
-        manager.controller.click(manager.vision.find_image('h_flip.png'))
-    
-    if values.get('v_flip'):
-        manager.controller.click(manager.vision.find_image('v_flip.png'))
+    for key, template_name in (('h_flip', 'h_flip.png'), ('v_flip', 'v_flip.png')):
+        if key in changed_keys:
+            flip_coords = manager.vision.find_image(template_name)
+            manager.controller.click(flip_coords)
+            
+            if flip_coords:
+                manager.panel.invalidate_below(flip_coords.y)
     
     for key in ['h_repeat', 'v_repeat']:
-        target_value = values.get(key, False)
-        default_value = AutomationSettings.DEFAULT_TEXTURE_VALUES.get(key)
-        
-        if target_value == default_value:
-            manager.vision.log(f"  - Skipping '{key}' as its value ({target_value}) matches the default.")
-        else:
-            set_checkbox_state(manager, key, target_value)
+        if key in changed_keys:
+            set_checkbox_state(manager, key, values.get(key, False))
+
+
+def enter_parameter_value(manager, key, entry_coords, values):
+    """
+    Types a parameter's value into its input at an already located click target.
+    """
+    
+    if key not in values:
+        return None
+    manager.controller.click(entry_coords, clicks=3, interval=0.1)
+    manager.controller.write(f"{values[key]:.3f}")
+    manager.panel.invalidate_below(entry_coords[1])
+    return entry_coords
 
 
-def set_parameter_value(manager, key, template_name, values, region=None):
+def set_parameter_value(manager, key, template_name, values, region=None, timeout=None):
+    """
+    Locates a single parameter's label and types its value into the input to its right.
+    timeout defaults to GENERIC_ELEMENT_TIMEOUT; the label is searched at least once.
+    """
+    
     if key not in values:
         return None, None
+    timeout = AutomationSettings.GENERIC_ELEMENT_TIMEOUT if timeout is None else max(timeout, 0)
     label_coords = manager._wait_for_element(
-        template_name, timeout=AutomationSettings.GENERIC_ELEMENT_TIMEOUT, region=region
+        template_name, timeout=timeout, region=region, latency_key='element_appear'
     )
     
     if label_coords:
@@ -226,9 +276,7 @@ def set_parameter_value(manager, key, template_name, values, region=None):
             right_edge = label_coords[0] + (img_width / 2)
             click_x = right_edge + 5
             click_y = label_coords[1]
-            manager.controller.click((click_x, click_y), clicks=3, interval=0.1)
-            manager.controller.write(f"{values[key]:.3f}")
-            return label_coords, (click_x, click_y)
+            return label_coords, enter_parameter_value(manager, key, (click_x, click_y), values)
         except (IndexError, TypeError, FileNotFoundError):
              manager.vision.log(f"  - Error processing parameter {key}. Could not calculate click position.")
     else:
@@ -258,6 +306,7 @@ def set_checkbox_state(manager, base_name, should_be_checked):
             click_x = right_edge - 5
             click_y = off_coords[1]
             manager.controller.click((click_x, click_y))
+            manager.panel.invalidate_below(click_y)
         except (IndexError, TypeError, FileNotFoundError):
              manager.vision.log(f"  - Error setting checkbox state for '{base_name}'. Could not calculate click position.")
     else:
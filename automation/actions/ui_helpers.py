@@ -2,6 +2,12 @@ import time
 import numpy as np
 from automation.automation_config import AutomationSettings
 from automation.exceptions import UIVisibilityError
+from automation import registration
+from automation.log import get_logger
+logger = get_logger(__name__)
+SETTLE_STRIP_WIDTH = 96
+SETTLE_STRIP_REDUCTION = 4
+SETTLE_CAP_FACTOR = 4
 
 
 def find_image_with_cache(manager, template_name, cache_key, region=None, confidence=0.8):
@@ -12,13 +18,16 @@ def find_image_with_cache(manager, template_name, cache_key, region=None, confid
     
     if cache_key in manager.ui_cache:
         cached_region = manager.ui_cache[cache_key]
-        manager.vision.log(f"  - Searching for '{template_name}' in cached region: {cached_region}")
+        logger.debug("  - Searching for '%s' in cached region: %s", template_name, cached_region)
         location = manager.vision.find_image(template_name, region=cached_region, confidence=confidence)
+        manager.metrics.record_cache_lookup('ui_cache', location is not None)
         
         if location:
             return location
-        manager.vision.log(f"  - Not found in cached region. Searching wider area.")
-    manager.vision.log(f"  - Searching for '{template_name}' in wider region: {region or 'Full Screen'}")
+        logger.debug("  - Not found in cached region. Searching wider area.")
+    else:
+        manager.metrics.record_cache_lookup('ui_cache', False)
+    logger.debug("  - Searching for '%s' in wider region: %s", template_name, region or 'Full Screen')
     location = manager.vision.find_image(template_name, region=region, confidence=confidence)
     
     if location:
@@ -28,13 +37,15 @@ def find_image_with_cache(manager, template_name, cache_key, region=None, confid
             cache_size, cache_size
         )
         manager.ui_cache[cache_key] = new_cached_region
-        manager.vision.log(f"  - Found '{template_name}' and updated cache '{cache_key}' to {new_cached_region}")
+        logger.debug("  - Found '%s' and updated cache '%s' to %s", template_name, cache_key, new_cached_region)
     return location
 
 
 def select_best_group_match(manager, matches):
     """
     Applies heuristics to a list of potential OCR matches to find the best one.
+    Matches that already know whether a group arrow sits next to them (a 'has_arrow'
+    key, e.g. from the panel model) skip the arrow search.
     """
     
     if not matches:
@@ -43,7 +54,7 @@ def select_best_group_match(manager, matches):
     
     if manager.group_x_positions:
         predicted_x = np.median(manager.group_x_positions)
-        manager.vision.log(f"  - Applying heuristics with predicted X-indentation: {predicted_x:.0f}")
+        logger.debug("  - Applying heuristics with predicted X-indentation: %.0f", predicted_x)
     scored_matches = []
     
     for match in matches:
@@ -54,14 +65,19 @@ def select_best_group_match(manager, matches):
             x_diff = abs(bbox[0] - predicted_x)
             penalty = (x_diff / 50.0) * 0.1
             final_score -= penalty
-            manager.vision.log(f"    - Candidate '{match['text']}' at x={bbox[0]}. X-diff penalty: {penalty:.2f}. New score: {final_score:.2f}")
-        arrow_search_region = (int(bbox[0] + bbox[2]), int(bbox[1] - 5), 300, int(bbox[3] + 10))
-        expanded_arrow = manager.vision.find_image('group_expanded.png', region=arrow_search_region, confidence=0.7)
-        collapsed_arrow = manager.vision.find_image('group_collapsed.png', region=arrow_search_region, confidence=0.7)
+            logger.debug("    - Candidate '%s' at x=%s. X-diff penalty: %.2f. New score: %.2f", match['text'], bbox[0], penalty, final_score)
+        has_arrow = match.get('has_arrow')
         
-        if expanded_arrow or collapsed_arrow:
+        if has_arrow is None:
+            arrow_search_region = (int(bbox[0] + bbox[2]), int(bbox[1] - 5), 300, int(bbox[3] + 10))
+            has_arrow = bool(
+                manager.vision.find_image('group_expanded.png', region=arrow_search_region, confidence=0.7) or
+                manager.vision.find_image('group_collapsed.png', region=arrow_search_region, confidence=0.7)
+            )
+        
+        if has_arrow:
             final_score += 0.5
-            manager.vision.log(f"    - Candidate '{match['text']}' has an arrow nearby. Bonus applied. New score: {final_score:.2f}")
+            logger.debug("    - Candidate '%s' has an arrow nearby. Bonus applied. New score: %.2f", match['text'], final_score)
         
         if final_score > 0:
             scored_matches.append({'match': match, 'final_score': final_score})
@@ -79,15 +95,18 @@ def select_best_group_match(manager, matches):
     return best_match_info['match']
 
 
-def wait_for_element(manager, template_name, timeout, start_time, cache_key=None, region=None, confidence=0.8):
+def wait_for_element(manager, template_name, timeout, start_time, cache_key=None, region=None, confidence=0.8, latency_key=None):
     """
     Waits for a UI element to appear by repeatedly searching for it until a timeout is reached.
+    The element is searched at least once, even if the timeout has already run out.
+    If a latency key is given, the time the element took to appear is recorded under it.
     Returns the element's coordinates or raises UIVisibilityError.
     """
-    manager.vision.log(f"  - Waiting up to {timeout}s for '{template_name}' to appear...")
+    manager.vision.log(f"  - Waiting up to {timeout:.2f}s for '{template_name}' to appear...")
     
-    while time.time() - start_time < timeout:
+    while True:
         manager._check_for_stop()
+        manager.metrics.record_wait_iteration(template_name)
         
         if cache_key:
             location = find_image_with_cache(manager, template_name, cache_key, region=region, confidence=confidence)
@@ -95,7 +114,148 @@ def wait_for_element(manager, template_name, timeout, start_time, cache_key=None
             location = manager.vision.find_image(template_name, region=region, confidence=confidence)
         
         if location:
-            manager.vision.log(f"  - Found '{template_name}' after {time.time() - start_time:.2f}s.")
+            elapsed = time.monotonic() - start_time
+            manager.vision.log(f"  - Found '{template_name}' after {elapsed:.2f}s.")
+            manager.metrics.record_wait(elapsed)
+            
+            if latency_key:
+                manager.record_latency(latency_key, elapsed)
             return location
-        time.sleep(0.1)
-    raise UIVisibilityError(f"Timed out after {timeout}s waiting for '{template_name}'.")
+        
+        if time.monotonic() - start_time >= timeout:
+            break
+        manager._interruptible_sleep(0.1)
+    manager.metrics.record_wait(time.monotonic() - start_time)
+    raise UIVisibilityError(f"Timed out after {timeout:.2f}s waiting for '{template_name}'.")
+
+
+
+def scroll_panel(manager, amount, panel_region):
+    """
+    Scrolls the panel and measures the resulting vertical content offset by registering
+    a capture of the panel column taken before the scroll against one taken after it.
+    Cached positions are translated by the measured offset, or dropped if it is unknown.
+    Returns the offset in pixels, or None if it could not be measured.
+    """
+    before_image = manager.vision.screenshot(region=panel_region) if panel_region else None
+    manager.controller.scroll(amount)
+    
+    if before_image is None:
+        manager._interruptible_sleep(AutomationSettings.SCROLL_DELAY)
+        invalidate_cached_positions(manager, panel_region)
+        return None
+    after_image = wait_for_scroll_settle(manager, before_image, panel_region)
+    dy = registration.estimate_vertical_shift(before_image, after_image) if after_image else None
+    
+    if dy is None:
+        manager.vision.log("  - Could not measure scroll offset. Dropping cached panel positions.")
+        invalidate_cached_positions(manager, panel_region)
+        return None
+    manager.vision.log(f"  - Measured scroll offset: {dy}px.")
+    
+    if dy != 0:
+        remap_cached_positions(manager, dy, panel_region)
+    return dy
+
+
+def _settle_strip_region(panel_region):
+    """
+    The narrow vertical strip in the middle of the panel column that is sampled while
+    waiting for a scroll to settle.
+    """
+    left, top, width, height = panel_region
+    strip_width = min(SETTLE_STRIP_WIDTH, width)
+    return (int(left + (width - strip_width) / 2), int(top), int(strip_width), int(height))
+
+
+def _settle_signature(strip_image):
+    return strip_image.reduce(SETTLE_STRIP_REDUCTION).tobytes()
+
+
+def wait_for_scroll_settle(manager, before_image, panel_region, poll_interval=0.05):
+    """
+    Waits after a scroll until two consecutive samples of a downscaled strip of the panel
+    match, for at least SCROLL_DELAY unless the content was seen moving, and at most
+    SETTLE_CAP_FACTOR times SCROLL_DELAY. Records in the timing profile how long the
+    content kept moving (the cap, if it never stopped), so a delay that is too short is
+    learned as well. Returns a capture of the whole panel once settled.
+    """
+    start_time = time.monotonic()
+    cap = max(AutomationSettings.SCROLL_DELAY * SETTLE_CAP_FACTOR, poll_interval * 2)
+    strip_region = _settle_strip_region(panel_region)
+    strip_offset_x = strip_region[0] - panel_region[0]
+    before_strip = before_image.crop((strip_offset_x, 0, strip_offset_x + strip_region[2], before_image.size[1]))
+    previous_signature = _settle_signature(before_strip)
+    last_change = None
+    is_settled = False
+    
+    while True:
+        manager._interruptible_sleep(poll_interval)
+        manager.metrics.record_wait_iteration('scroll_settle')
+        strip = manager.vision.screenshot(region=strip_region)
+        
+        if strip is None:
+            return None
+        signature = _settle_signature(strip)
+        elapsed = time.monotonic() - start_time
+        
+        if signature != previous_signature:
+            last_change = elapsed
+            previous_signature = signature
+        elif last_change is not None or elapsed >= AutomationSettings.SCROLL_DELAY:
+            is_settled = True
+            break
+        
+        if elapsed >= cap:
+            break
+    
+    manager.metrics.record_wait(time.monotonic() - start_time)
+    
+    if not is_settled:
+        manager.vision.log(f"  - Panel was still moving {cap:.2f}s after scrolling.")
+        manager.record_latency('scroll_settle', cap)
+    elif last_change is not None:
+        manager.record_latency('scroll_settle', last_change)
+    return manager.vision.screenshot(region=panel_region)
+
+
+def remap_cached_positions(manager, dy, panel_region):
+    """
+    Translates every cached position inside the panel column by a vertical offset.
+    Positions that scroll out of the panel are dropped.
+    """
+    remapped = 0
+    
+    for cache_key, region in list(manager.ui_cache.items()):
+        if not registration.region_overlaps_column(region, panel_region):
+            continue
+        new_region = registration.shift_region(region, dy)
+        
+        if registration.region_within_rows(new_region, panel_region):
+            manager.ui_cache[cache_key] = new_region
+            remapped += 1
+        else:
+            del manager.ui_cache[cache_key]
+    
+    for group_name, bbox in list(manager.group_header_positions.items()):
+        new_bbox = registration.shift_region(bbox, dy)
+        
+        if registration.region_within_rows(new_bbox, panel_region):
+            manager.group_header_positions[group_name] = new_bbox
+            remapped += 1
+        else:
+            del manager.group_header_positions[group_name]
+    manager.panel.shift(dy)
+    manager.vision.log(f"  - Remapped {remapped} cached positions by {dy}px.")
+
+
+def invalidate_cached_positions(manager, panel_region=None):
+    """
+    Drops cached positions inside the panel column (or all of them if no column is given).
+    """
+    
+    for cache_key, region in list(manager.ui_cache.items()):
+        if panel_region is None or registration.region_overlaps_column(region, panel_region):
+            del manager.ui_cache[cache_key]
+    manager.group_header_positions.clear()
+    manager.panel.invalidate()
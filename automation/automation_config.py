@@ -14,6 +14,16 @@ class AutomationSettings:
     POST_SETTING_APPLIED_DELAY = 0.0
     POST_REMOVAL_DELAY = 0.2
     SCROLL_DELAY = 0.25
+    TEXT_ENTRY_MODE = "bulk"
+    POINTER_MOTION_MODE = "scaled"
+    POINTER_SPEED = 5000
+    POINTER_MAX_MOVE_DURATION = 0.1
+    POINTER_HOVER_DURATION = 0.15
+    MOVE_PAUSE = 0.0
+    CLICK_PAUSE = 0.05
+    KEY_PAUSE = 0.05
+    SCROLL_PAUSE = 0.05
+    RECORD_SESSIONS = 0
     DEFAULT_TEXTURE_VALUES = {
         "size": 0.5, "angle": 0.0, "x_position": 0.5, "y_position": 0.5, "opacity": 1.0,
         "h_repeat": False,
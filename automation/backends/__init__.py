@@ -0,0 +1,5 @@
+from .base import CaptureBackend, CaptureError, InputBackend, Monitor, Point
+from .desktop import MSSCaptureBackend, PyAutoGUIInputBackend
+from .recording import RecordingCaptureBackend, RecordingInputBackend
+from .replay import ReplayCaptureBackend, ReplayInputBackend, ReplayQueryChecker
+from .simulator import CreatorSimulator, SimulatorCaptureBackend, SimulatorInputBackend
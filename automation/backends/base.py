@@ -0,0 +1,71 @@
+from collections import namedtuple
+from ..exceptions import CaptureError
+Point = namedtuple('Point', 'x y')
+Monitor = namedtuple('Monitor', 'x y width height name')
+
+
+class CaptureBackend:
+    """
+    Interface for grabbing screen pixels. Vision captures everything through one of these.
+    """
+    
+    def initialize(self):
+        """
+        Prepares thread-sensitive resources for the calling thread.
+        """
+        pass
+    
+    def grab(self, region=None):
+        """
+        Returns an RGB PIL Image of a (left, top, width, height) region, or of the whole
+        virtual screen if region is None. Raises CaptureError on failure.
+        """
+        raise NotImplementedError
+    
+    def monitors(self):
+        """
+        Returns the connected monitors as Monitor tuples.
+        """
+        raise NotImplementedError
+
+
+class InputBackend:
+    """
+    Interface for synthesizing mouse, keyboard and clipboard input. The Controller sends
+    every input through one of these. Exceptions listed in fail_safe_exceptions abort
+    the run and are never swallowed by fallbacks.
+    """
+    fail_safe_exceptions = ()
+    
+    def position(self):
+        raise NotImplementedError
+    
+    def move_to(self, x, y, duration=0.0):
+        raise NotImplementedError
+    
+    def click(self):
+        raise NotImplementedError
+    
+    def write(self, text):
+        raise NotImplementedError
+    
+    def press(self, key):
+        raise NotImplementedError
+    
+    def key_down(self, key):
+        raise NotImplementedError
+    
+    def key_up(self, key):
+        raise NotImplementedError
+    
+    def scroll(self, amount, x=None, y=None):
+        raise NotImplementedError
+    
+    def hotkey(self, *keys):
+        raise NotImplementedError
+    
+    def get_clipboard(self):
+        raise NotImplementedError
+    
+    def set_clipboard(self, text):
+        raise NotImplementedError
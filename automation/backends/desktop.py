@@ -0,0 +1,113 @@
+import threading
+import mss
+import pyperclip
+import screeninfo
+from PIL import Image
+from ..exceptions import CaptureError, ClipboardError
+from .base import CaptureBackend, InputBackend, Monitor
+
+
+class MSSCaptureBackend(CaptureBackend):
+    """
+    Captures the real screen with MSS, keeping one MSS instance per thread.
+    """
+    
+    def __init__(self, log_callback=print):
+        self.log = log_callback
+        self.thread_local = threading.local()
+    
+    @property
+    def sct(self):
+        """
+        Lazy-loads the MSS screenshot utility instance for the current thread.
+        """
+        
+        if not hasattr(self.thread_local, 'sct') or self.thread_local.sct is None:
+            self.log(f"Initializing MSS for thread {threading.get_ident()}...")
+            try:
+                self.thread_local.sct = mss.mss()
+                self.log("MSS initialized for this thread.")
+            except Exception as e:
+                self.log(f"CRITICAL: Failed to initialize MSS for this thread. Error: {e}")
+                self.thread_local.sct = None
+        return self.thread_local.sct
+    
+    def initialize(self):
+        _ = self.sct
+    
+    def grab(self, region=None):
+        if not self.sct:
+            raise CaptureError("Screenshot utility not initialized.")
+        try:
+            if region:
+                monitor = {'top': int(region[1]), 'left': int(region[0]), 'width': int(region[2]), 'height': int(region[3])}
+            else:
+                monitor = self.sct.monitors[0]
+            sct_img = self.sct.grab(monitor)
+            return Image.frombytes('RGB', sct_img.size, sct_img.bgra, 'raw', 'BGRX')
+        except mss.exception.ScreenShotError as e:
+            raise CaptureError(str(e)) from e
+    
+    def monitors(self):
+        return [Monitor(m.x, m.y, m.width, m.height, m.name) for m in screeninfo.get_monitors()]
+
+
+class PyAutoGUIInputBackend(InputBackend):
+    """
+    Sends real input with pyautogui and uses the system clipboard through pyperclip.
+    pyautogui is imported on first use, so headless backends never need a display.
+    Its global PAUSE is bypassed; the Controller applies its own pauses.
+    """
+    
+    def __init__(self):
+        self._pyautogui = None
+    
+    @property
+    def pyautogui(self):
+        if self._pyautogui is None:
+            import pyautogui
+            self._pyautogui = pyautogui
+        return self._pyautogui
+    
+    @property
+    def fail_safe_exceptions(self):
+        return (self.pyautogui.FailSafeException,)
+    
+    def position(self):
+        return tuple(self.pyautogui.position())
+    
+    def move_to(self, x, y, duration=0.0):
+        self.pyautogui.moveTo(x, y, duration=duration, _pause=False)
+    
+    def click(self):
+        self.pyautogui.click(_pause=False)
+    
+    def write(self, text):
+        self.pyautogui.write(text, _pause=False)
+    
+    def press(self, key):
+        self.pyautogui.press(key, _pause=False)
+    
+    def key_down(self, key):
+        self.pyautogui.keyDown(key, _pause=False)
+    
+    def key_up(self, key):
+        self.pyautogui.keyUp(key, _pause=False)
+    
+    def scroll(self, amount, x=None, y=None):
+        self.pyautogui.scroll(amount, x, y, _pause=False)
+    
+    def hotkey(self, *keys):
+        self.pyautogui.hotkey(*keys, _pause=False)
+    
+    def get_clipboard(self):
+        try:
+            return pyperclip.paste()
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError(str(e)) from e
+    
+    def set_clipboard(self, text):
+        try:
+            pyperclip.copy(text)
+        except pyperclip.PyperclipException as e:
+            raise ClipboardError(str(e)) from e
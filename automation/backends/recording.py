@@ -0,0 +1,79 @@
+from .base import CaptureBackend, InputBackend
+
+
+class RecordingCaptureBackend(CaptureBackend):
+    """
+    Wraps a capture backend and records every grabbed frame on a session recorder.
+    """
+    
+    def __init__(self, backend, recorder):
+        self.backend = backend
+        self.recorder = recorder
+    
+    def initialize(self):
+        self.backend.initialize()
+    
+    def grab(self, region=None):
+        image = self.backend.grab(region)
+        self.recorder.record_frame(region, image)
+        return image
+    
+    def monitors(self):
+        return self.backend.monitors()
+
+
+class RecordingInputBackend(InputBackend):
+    """
+    Wraps an input backend and records every action on a session recorder before
+    performing it.
+    """
+    
+    def __init__(self, backend, recorder):
+        self.backend = backend
+        self.recorder = recorder
+    
+    @property
+    def fail_safe_exceptions(self):
+        return self.backend.fail_safe_exceptions
+    
+    def position(self):
+        return self.backend.position()
+    
+    def move_to(self, x, y, duration=0.0):
+        self.recorder.record_action('move_to', x, y)
+        self.backend.move_to(x, y, duration)
+    
+    def click(self):
+        self.recorder.record_action('click')
+        self.backend.click()
+    
+    def write(self, text):
+        self.recorder.record_action('write', text)
+        self.backend.write(text)
+    
+    def press(self, key):
+        self.recorder.record_action('press', key)
+        self.backend.press(key)
+    
+    def key_down(self, key):
+        self.recorder.record_action('key_down', key)
+        self.backend.key_down(key)
+    
+    def key_up(self, key):
+        self.recorder.record_action('key_up', key)
+        self.backend.key_up(key)
+    
+    def scroll(self, amount, x=None, y=None):
+        self.recorder.record_action('scroll', amount, x, y)
+        self.backend.scroll(amount, x, y)
+    
+    def hotkey(self, *keys):
+        self.recorder.record_action('hotkey', *keys)
+        self.backend.hotkey(*keys)
+    
+    def get_clipboard(self):
+        return self.backend.get_clipboard()
+    
+    def set_clipboard(self, text):
+        self.recorder.record_action('set_clipboard', text)
+        self.backend.set_clipboard(text)
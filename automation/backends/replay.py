@@ -0,0 +1,153 @@
+import threading
+from PIL import Image
+from .base import CaptureBackend, InputBackend, Monitor
+from ..session import to_jsonable
+
+
+class ReplayCaptureBackend(CaptureBackend):
+    """
+    Serves the frames of a recorded session instead of the screen. Frames are handed out
+    in recorded order; a request for a region is matched to the next recorded capture of
+    that region within a short lookahead window. If the run has drifted from the
+    recording, the newest frame that covers the region is cropped instead, and a black
+    frame is returned as a last resort.
+    """
+    LOOKAHEAD = 20
+    
+    def __init__(self, session, log_callback=print):
+        self.session = session
+        self.log = log_callback
+        self.frames = session.events_of_type('frame')
+        self.cursor = 0
+        self.misses = 0
+        self.crops = 0
+    
+    def _covers(self, outer, inner):
+        
+        if outer is None or inner is None:
+            return False
+        return (
+            outer[0] <= inner[0] and outer[1] <= inner[1] and
+            inner[0] + inner[2] <= outer[0] + outer[2] and inner[1] + inner[3] <= outer[1] + outer[3]
+        )
+    
+    def grab(self, region=None):
+        wanted = to_jsonable(region)
+        
+        for i in range(self.cursor, min(self.cursor + self.LOOKAHEAD, len(self.frames))):
+            if self.frames[i]['region'] == wanted:
+                self.cursor = i + 1
+                return self.session.load_frame(self.frames[i]['frame']).copy()
+        
+        for i in range(min(self.cursor, len(self.frames)) - 1, -1, -1):
+            recorded_region = self.frames[i]['region']
+            
+            if self._covers(recorded_region, wanted):
+                self.crops += 1
+                left = wanted[0] - recorded_region[0]
+                top = wanted[1] - recorded_region[1]
+                frame = self.session.load_frame(self.frames[i]['frame'])
+                return frame.crop((left, top, left + wanted[2], top + wanted[3]))
+        self.misses += 1
+        self.log(f"  - Replay: no recorded frame covers region {region}. Serving a black frame.")
+        width, height = (wanted[2], wanted[3]) if wanted else self.monitors()[0][2:4]
+        return Image.new('RGB', (int(width), int(height)))
+    
+    def monitors(self):
+        region = self.session.header.get('app_region') or [0, 0, 1920, 1080]
+        return [Monitor(*region, name='replay')]
+
+
+class ReplayInputBackend(InputBackend):
+    """
+    Accepts input without touching the real mouse or keyboard, and compares each action
+    with the next recorded one. Actions that do not match are counted as divergences.
+    The clipboard is kept in memory.
+    """
+    
+    def __init__(self, session, log_callback=print):
+        self.log = log_callback
+        self.actions = session.events_of_type('action')
+        self.cursor = 0
+        self.divergences = []
+        self.pointer = (0, 0)
+        self.clipboard = ''
+    
+    def _replay(self, name, *args):
+        actual = {'name': name, 'args': to_jsonable(args)}
+        
+        if self.cursor < len(self.actions):
+            expected = self.actions[self.cursor]
+            self.cursor += 1
+            
+            if expected['name'] == actual['name'] and expected['args'] == actual['args']:
+                return
+            expected = {'name': expected['name'], 'args': expected['args']}
+        else:
+            expected = None
+        self.divergences.append({'index': self.cursor - 1, 'expected': expected, 'actual': actual})
+        self.log(f"  - Replay: action {actual} diverges from the recording (expected {expected}).")
+    
+    def position(self):
+        return self.pointer
+    
+    def move_to(self, x, y, duration=0.0):
+        self._replay('move_to', x, y)
+        self.pointer = (x, y)
+    
+    def click(self):
+        self._replay('click')
+    
+    def write(self, text):
+        self._replay('write', text)
+    
+    def press(self, key):
+        self._replay('press', key)
+    
+    def key_down(self, key):
+        self._replay('key_down', key)
+    
+    def key_up(self, key):
+        self._replay('key_up', key)
+    
+    def scroll(self, amount, x=None, y=None):
+        self._replay('scroll', amount, x, y)
+    
+    def hotkey(self, *keys):
+        self._replay('hotkey', *keys)
+    
+    def get_clipboard(self):
+        return self.clipboard
+    
+    def set_clipboard(self, text):
+        self._replay('set_clipboard', text)
+        self.clipboard = text
+
+
+class ReplayQueryChecker:
+    """
+    Stands in for the session recorder during a replay and compares each Vision query
+    result with the next recorded query of the same name.
+    """
+    is_recording = True
+    
+    def __init__(self, session, log_callback=print):
+        self.log = log_callback
+        self.queries = session.events_of_type('query')
+        self.cursor = 0
+        self.checked = 0
+        self.mismatches = []
+        self.query_depth = threading.local()
+    
+    def record_query(self, name, args, kwargs, result):
+        self.checked += 1
+        
+        for i in range(self.cursor, len(self.queries)):
+            if self.queries[i]['name'] == name and self.queries[i]['args'] == to_jsonable(args):
+                self.cursor = i + 1
+                
+                if self.queries[i]['result'] != to_jsonable(result):
+                    self.mismatches.append({'name': name, 'args': to_jsonable(args), 'expected': self.queries[i]['result'], 'actual': to_jsonable(result)})
+                    self.log(f"  - Replay: {name}{tuple(args)} returned {result}, recorded {self.queries[i]['result']}.")
+                return
+        self.mismatches.append({'name': name, 'args': to_jsonable(args), 'expected': None, 'actual': to_jsonable(result)})
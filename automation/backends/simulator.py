@@ -0,0 +1,728 @@
+import hashlib
+import os
+import threading
+import time
+from PIL import Image, ImageDraw, ImageFont
+from automation.automation_config import AutomationSettings
+from .base import CaptureBackend, InputBackend, Monitor
+SCREEN_SIZE = (1600, 1000)
+DESKTOP_COLOR = (40, 40, 40)
+PANEL_COLOR = (114, 114, 114)
+FORM_COLOR = (122, 122, 122)
+SELECTED_COLOR = (96, 137, 173)
+DIALOG_COLOR = (245, 245, 245)
+TEXT_COLOR = (235, 235, 235)
+INPUT_COLOR = (255, 255, 255)
+INPUT_TEXT_COLOR = (30, 30, 30)
+MODIFIER_KEYS = ('ctrl', 'command')
+
+
+def _load_font(size):
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _overlaps(a, b):
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+class CreatorSimulator:
+    """
+    A synthetic Creator texture panel drawn from the template assets. It keeps the state
+    the automation manipulates (groups, their textures, the selected texture's settings,
+    menus and dialogs), renders it into a screen image and reacts to clicks, scrolls and
+    typing the way the real panel does, so whole runs can execute without a display.
+    UI changes triggered by a click (menus, dialogs) appear after ui_latency seconds.
+    """
+    ANCHOR_POS = (20, 10)
+    LIST_LEFT = 20
+    LIST_TOP = 140
+    LIST_WIDTH = 547
+    HEADER_TEXT_X = 85
+    ARROW_X = 380
+    ITEM_LEFT = 90
+    HEADER_HEIGHT = 36
+    ROW_HEIGHT = 48
+    UPLOAD_ROW_HEIGHT = 56
+    SCROLL_PIXELS_PER_UNIT = 0.5
+    FORM_LEFT = 650
+    FORM_TOP = 70
+    FIELD_SPACING = 36
+    NUMERIC_FIELDS = (
+        ('size', 'size_input.png'),
+        ('angle', 'angle_input.png'),
+        ('x_position', 'x_pos_input.png'),
+        ('y_position', 'y_pos_input.png'),
+        ('opacity', 'opacity_input.png'),
+    )
+    MULTI_CLICK_INTERVAL = 0.6
+    
+    def __init__(self, assets_path, groups=None, language='en', ui_latency=0.0, screen_size=SCREEN_SIZE):
+        """
+        groups is a list of {'name', 'expanded', 'textures'} dicts, where textures is a
+        list of image paths already uploaded to the group.
+        """
+        self.assets_path = assets_path
+        self.language = language
+        self.ui_latency = ui_latency
+        self.screen_size = screen_size
+        self.lock = threading.RLock()
+        self.templates = {}
+        self.header_font = _load_font(16)
+        self.input_font = _load_font(14)
+        self.groups = [
+            {
+                'name': g['name'],
+                'expanded': g.get('expanded', False),
+                'textures': [self._new_texture(path) for path in g.get('textures', [])],
+            }
+            for g in (groups or [])
+        ]
+        self.scroll_offset = 0
+        self.selected = None
+        self.adjust_expanded = False
+        self.repeat_expanded = False
+        self.menu_for = None
+        self.menu_target = None
+        self.dialog = None
+        self.upload_group = None
+        self.file_dialog_text = ''
+        self.focused_field = None
+        self.field_buffer = ''
+        self.select_all = False
+        self.pointer = (0, 0)
+        self.modifiers = set()
+        self.clipboard = ''
+        self.last_click = (None, 0.0, 0)
+        self.pending = []
+        self.frame = None
+        self.layout = None
+        self.max_scroll = 0
+    
+    def _template(self, name):
+        """
+        Loads a template as RGB, preferring the localized variant.
+        """
+        
+        if name not in self.templates:
+            base, ext = os.path.splitext(name)
+            path = os.path.join(self.assets_path, f"{base}_{self.language}{ext}")
+            
+            if not os.path.exists(path):
+                path = os.path.join(self.assets_path, name)
+            self.templates[name] = Image.open(path).convert('RGB')
+        return self.templates[name]
+    
+    def _new_texture(self, path):
+        values = dict(AutomationSettings.DEFAULT_TEXTURE_VALUES, h_flip=False, v_flip=False)
+        return {'path': path, 'values': values}
+    
+    def _invalidate(self):
+        self.frame = None
+        self.layout = None
+    
+    def _schedule(self, change):
+        """
+        Applies a UI change after the simulated latency.
+        """
+        
+        if self.ui_latency <= 0:
+            change()
+            self._invalidate()
+        else:
+            self.pending.append((time.monotonic() + self.ui_latency, change))
+    
+    def _apply_due_changes(self):
+        now = time.monotonic()
+        due = [change for due_time, change in self.pending if due_time <= now]
+        
+        if not due:
+            return
+        self.pending = [(due_time, change) for due_time, change in self.pending if due_time > now]
+        
+        for change in due:
+            change()
+        self._invalidate()
+    
+    def snapshot(self):
+        """
+        Returns the panel state as {group name: [{'path', 'values'}, ...]}.
+        """
+        
+        with self.lock:
+            return {
+                g['name']: [{'path': t['path'], 'values': dict(t['values'])} for t in g['textures']]
+                for g in self.groups
+            }
+    
+    def ground_truth(self):
+        """
+        Returns the screen boxes (left, top, width, height) of every fully visible element,
+        for labelling captures: {'templates': {template name: [box, ...]}, 'headers':
+        {group name: text box}}. Selected texture items are listed under
+        'texture_item_selected.png', checkboxes under their current on/off template, and
+        elements hidden under an open menu or dialog are left out.
+        """
+        
+        with self.lock:
+            self.render()
+            layout = self._compute_layout()
+            templates = {}
+            headers = {}
+            overlays = []
+            
+            if self.menu_for is not None and self._menu_box()[0]:
+                overlays.append(self._menu_box()[0])
+            
+            if self.dialog in ('confirm', 'choose'):
+                button_template = 'remove_confirm_button.png' if self.dialog == 'confirm' else 'choose_file_button.png'
+                overlays.append(self._dialog_boxes(button_template)[0])
+            
+            def _add(template_name, box, on_overlay=False):
+                if not on_overlay and any(_overlaps(box, overlay) for overlay in overlays):
+                    return
+                templates.setdefault(template_name, []).append([int(v) for v in box])
+            
+            def _is_visible(box):
+                return self.LIST_TOP <= box[1] and box[1] + box[3] <= layout['list_bottom']
+            anchor = self._template('app_anchor.png')
+            _add('app_anchor.png', (self.ANCHOR_POS[0], self.ANCHOR_POS[1], anchor.width, anchor.height))
+            
+            for item in layout['items']:
+                if item['kind'] == 'header':
+                    arrow_box = self._arrow_box(item)
+                    left, top, right, bottom = self.header_font.getbbox(item['group']['name'])
+                    text_box = (self.HEADER_TEXT_X + left, item['top'] + 9 + top, right - left, bottom - top)
+                    
+                    if _is_visible(arrow_box):
+                        _add('group_expanded.png' if item['group']['expanded'] else 'group_collapsed.png', arrow_box)
+                    
+                    if _is_visible(text_box):
+                        headers[item['group']['name']] = list(text_box)
+                elif item['kind'] == 'texture':
+                    is_selected = item['texture'] is self.selected
+                    bar_box = self._item_bar_box(item)
+                    
+                    if _is_visible(bar_box):
+                        _add('texture_item_selected.png' if is_selected else 'texture_item.png', bar_box)
+                    
+                    if is_selected and _is_visible(self._more_button_box(item)):
+                        _add('more_button.png', self._more_button_box(item))
+                elif _is_visible(self._upload_button_box(item)):
+                    _add('group_upload_button.png', self._upload_button_box(item))
+            
+            if self.selected is not None:
+                form = self._form_layout()
+                icon = self._template('adjust_panel_icon.png')
+                arrow_name = 'panel_expanded.png' if self.adjust_expanded else 'panel_collapsed.png'
+                _add('adjust_panel_icon.png', form['adjust_icon'] + (icon.width, icon.height))
+                _add(arrow_name, form['adjust_arrow'])
+                arrow_name = 'panel_expanded.png' if self.repeat_expanded else 'panel_collapsed.png'
+                _add('repeat_panel_icon.png', form['repeat_icon'] + (icon.width, icon.height))
+                _add(arrow_name, form['repeat_arrow'])
+                
+                for field in form['fields'].values():
+                    _add(field['template'], field['label'])
+                
+                for key, box in form['flips'].items():
+                    _add(f"{key}.png", box)
+                
+                for key, box in form['checkboxes'].items():
+                    _add(f"{key}_{'on' if self.selected['values'].get(key) else 'off'}.png", box)
+            
+            if self.menu_for is not None:
+                _, remove_box = self._menu_box()
+                
+                if remove_box:
+                    _add('remove_button.png', remove_box, on_overlay=True)
+            
+            if self.dialog in ('confirm', 'choose'):
+                _add(button_template, self._dialog_boxes(button_template)[1], on_overlay=True)
+            return {'templates': templates, 'headers': headers}
+    
+    def _compute_layout(self):
+        """
+        Positions every panel element in screen coordinates, taking the scroll offset
+        into account. Only elements inside the visible list area are hit-testable.
+        """
+        
+        if self.layout is not None:
+            return self.layout
+        width, height = self.screen_size
+        list_bottom = height - 10
+        items = []
+        y = self.LIST_TOP - self.scroll_offset
+        
+        for group in self.groups:
+            items.append({'kind': 'header', 'group': group, 'top': y, 'height': self.HEADER_HEIGHT})
+            y += self.HEADER_HEIGHT
+            
+            if not group['expanded']:
+                continue
+            
+            for texture in group['textures']:
+                items.append({'kind': 'texture', 'group': group, 'texture': texture, 'top': y, 'height': self.ROW_HEIGHT})
+                y += self.ROW_HEIGHT
+            items.append({'kind': 'upload', 'group': group, 'top': y, 'height': self.UPLOAD_ROW_HEIGHT})
+            y += self.UPLOAD_ROW_HEIGHT
+        content_height = y + self.scroll_offset - self.LIST_TOP
+        self.max_scroll = max(0, content_height - (list_bottom - self.LIST_TOP))
+        self.layout = {
+            'items': [item for item in items if item['top'] + item['height'] > self.LIST_TOP and item['top'] < list_bottom],
+            'list_bottom': list_bottom,
+        }
+        return self.layout
+    
+    def _arrow_box(self, item):
+        arrow = self._template('group_expanded.png')
+        return (self.ARROW_X - arrow.width // 2, item['top'] + (item['height'] - arrow.height) // 2, arrow.width, arrow.height)
+    
+    def _item_bar_box(self, item):
+        bar = self._template('texture_item.png')
+        return (self.ITEM_LEFT, item['top'] + item['height'] - bar.height, bar.width, bar.height)
+    
+    def _more_button_box(self, item):
+        bar_left, bar_top, bar_width, bar_height = self._item_bar_box(item)
+        more = self._template('more_button.png')
+        center_x = bar_left + bar_width // 2 + 100
+        center_y = bar_top + bar_height // 2 - 24
+        return (center_x - more.width // 2, center_y - more.height // 2, more.width, more.height)
+    
+    def _upload_button_box(self, item):
+        button = self._template('group_upload_button.png')
+        return (self.ITEM_LEFT + 10, item['top'] + (item['height'] - button.height) // 2, button.width, button.height)
+    
+    def _menu_box(self):
+        more_box = self._more_button_for(self.menu_for)
+        
+        if more_box is None:
+            return None, None
+        more_x = more_box[0] + more_box[2] // 2
+        more_y = more_box[1] + more_box[3] // 2
+        remove = self._template('remove_button.png')
+        remove_box = (more_x + 10 - remove.width // 2, more_y + 40 - remove.height // 2, remove.width, remove.height)
+        return (more_x - 45, more_y + 22, 130, 40), remove_box
+    
+    def _more_button_for(self, texture):
+        for item in self._compute_layout()['items']:
+            if item['kind'] == 'texture' and item['texture'] is texture:
+                return self._more_button_box(item)
+        return None
+    
+    def _dialog_boxes(self, button_template):
+        width, height = self.screen_size
+        dialog_box = (width // 2 - 180, height // 2 - 80, 360, 160)
+        button = self._template(button_template)
+        button_box = (width // 2 + 80 - button.width // 2, height // 2 + 40 - button.height // 2, button.width, button.height)
+        return dialog_box, button_box
+    
+    def _form_layout(self):
+        """
+        Positions the settings form of the selected texture: the adjust section with the
+        numeric fields and flip buttons, and the repeat section with its checkboxes.
+        """
+        adjust_icon = self._template('adjust_panel_icon.png')
+        arrow = self._template('panel_expanded.png')
+        icon_x, icon_y = self.FORM_LEFT + 10, self.FORM_TOP
+        form = {
+            'adjust_icon': (icon_x, icon_y),
+            'adjust_arrow': (icon_x + 250, icon_y + (adjust_icon.height - arrow.height) // 2, arrow.width, arrow.height),
+            'fields': {},
+            'flips': {},
+            'checkboxes': {},
+        }
+        y = icon_y + 40
+        
+        if self.adjust_expanded:
+            for key, template_name in self.NUMERIC_FIELDS:
+                label = self._template(template_name)
+                form['fields'][key] = {
+                    'label': (self.FORM_LEFT, y, label.width, label.height),
+                    'input': (self.FORM_LEFT + label.width - 4, y, 100, label.height),
+                    'template': template_name,
+                }
+                y += self.FIELD_SPACING
+            flip = self._template('h_flip.png')
+            form['flips']['h_flip'] = (self.FORM_LEFT + 300, y, flip.width, flip.height)
+            form['flips']['v_flip'] = (self.FORM_LEFT + 340, y, flip.width, flip.height)
+            y += flip.height + 20
+        form['repeat_icon'] = (icon_x, y)
+        form['repeat_arrow'] = (icon_x + 250, y + (adjust_icon.height - arrow.height) // 2, arrow.width, arrow.height)
+        y += 40
+        
+        if self.repeat_expanded:
+            for key in ('h_repeat', 'v_repeat'):
+                checkbox = self._template(f"{key}_off.png")
+                form['checkboxes'][key] = (self.FORM_LEFT, y, checkbox.width, checkbox.height)
+                y += 30
+        return form
+    
+    def render(self):
+        """
+        Returns the current screen as an RGB image.
+        """
+        
+        with self.lock:
+            self._apply_due_changes()
+            
+            if self.frame is None:
+                self.frame = self._draw()
+            return self.frame
+    
+    def _draw(self):
+        width, height = self.screen_size
+        screen = Image.new('RGB', self.screen_size, DESKTOP_COLOR)
+        draw = ImageDraw.Draw(screen)
+        draw.rectangle((self.LIST_LEFT, 0, self.LIST_LEFT + self.LIST_WIDTH - 1, height - 1), fill=PANEL_COLOR)
+        screen.paste(self._template('app_anchor.png'), self.ANCHOR_POS)
+        layout = self._compute_layout()
+        list_image = Image.new('RGB', (self.LIST_WIDTH, height), PANEL_COLOR)
+        list_draw = ImageDraw.Draw(list_image)
+        
+        for item in layout['items']:
+            top = item['top']
+            
+            if item['kind'] == 'header':
+                arrow_name = 'group_expanded.png' if item['group']['expanded'] else 'group_collapsed.png'
+                arrow_box = self._arrow_box(item)
+                list_image.paste(self._template(arrow_name), (arrow_box[0] - self.LIST_LEFT, arrow_box[1]))
+                list_draw.text((self.HEADER_TEXT_X - self.LIST_LEFT, top + 9), item['group']['name'], font=self.header_font, fill=TEXT_COLOR)
+            elif item['kind'] == 'texture':
+                is_selected = item['texture'] is self.selected
+                bar_box = self._item_bar_box(item)
+                
+                if is_selected:
+                    list_draw.rectangle((bar_box[0] - self.LIST_LEFT, top, bar_box[0] + bar_box[2] - self.LIST_LEFT - 1, bar_box[1] - 1), fill=SELECTED_COLOR)
+                digest = hashlib.md5(item['texture']['path'].encode()).digest()
+                list_draw.rectangle((self.ITEM_LEFT - self.LIST_LEFT + 6, top + 6, self.ITEM_LEFT - self.LIST_LEFT + 34, top + 34), fill=tuple(digest[:3]))
+                bar_name = 'texture_item_selected.png' if is_selected else 'texture_item.png'
+                list_image.paste(self._template(bar_name), (bar_box[0] - self.LIST_LEFT, bar_box[1]))
+                
+                if is_selected:
+                    more_box = self._more_button_box(item)
+                    list_image.paste(self._template('more_button.png'), (more_box[0] - self.LIST_LEFT, more_box[1]))
+            else:
+                button_box = self._upload_button_box(item)
+                list_image.paste(self._template('group_upload_button.png'), (button_box[0] - self.LIST_LEFT, button_box[1]))
+        list_bottom = layout['list_bottom']
+        screen.paste(list_image.crop((0, self.LIST_TOP, self.LIST_WIDTH, list_bottom)), (self.LIST_LEFT, self.LIST_TOP))
+        
+        if self.selected is not None:
+            self._draw_form(screen, draw)
+        
+        if self.menu_for is not None:
+            menu_box, remove_box = self._menu_box()
+            
+            if menu_box:
+                draw.rectangle((menu_box[0], menu_box[1], menu_box[0] + menu_box[2], menu_box[1] + menu_box[3]), fill=(255, 255, 255), outline=(200, 200, 200))
+                screen.paste(self._template('remove_button.png'), remove_box[:2])
+        
+        if self.dialog is not None:
+            self._draw_dialog(screen, draw)
+        return screen
+    
+    def _draw_form(self, screen, draw):
+        width, height = self.screen_size
+        draw.rectangle((self.FORM_LEFT - 20, self.FORM_TOP - 20, width - 1, height - 1), fill=FORM_COLOR)
+        form = self._form_layout()
+        arrow_name = 'panel_expanded.png' if self.adjust_expanded else 'panel_collapsed.png'
+        screen.paste(self._template('adjust_panel_icon.png'), form['adjust_icon'])
+        screen.paste(self._template(arrow_name), form['adjust_arrow'][:2])
+        values = self.selected['values']
+        
+        for key, field in form['fields'].items():
+            screen.paste(self._template(field['template']), field['label'][:2])
+            left, top, field_width, field_height = field['input']
+            draw.rectangle((left + 4, top, left + field_width, top + field_height - 1), fill=INPUT_COLOR)
+            text = self.field_buffer if key == self.focused_field else f"{values[key]:.3f}"
+            draw.text((left + 10, top + 3), text, font=self.input_font, fill=INPUT_TEXT_COLOR)
+        
+        for key, box in form['flips'].items():
+            screen.paste(self._template(f"{key}.png"), box[:2])
+        arrow_name = 'panel_expanded.png' if self.repeat_expanded else 'panel_collapsed.png'
+        screen.paste(self._template('repeat_panel_icon.png'), form['repeat_icon'])
+        screen.paste(self._template(arrow_name), form['repeat_arrow'][:2])
+        
+        for key, box in form['checkboxes'].items():
+            state = 'on' if values.get(key) else 'off'
+            screen.paste(self._template(f"{key}_{state}.png"), box[:2])
+    
+    def _draw_dialog(self, screen, draw):
+        width, height = self.screen_size
+        
+        if self.dialog == 'file':
+            box = (width // 2 - 300, height // 2 - 60, 600, 120)
+            draw.rectangle((box[0], box[1], box[0] + box[2], box[1] + box[3]), fill=DIALOG_COLOR, outline=(90, 90, 90))
+            draw.rectangle((box[0] + 20, box[1] + 45, box[0] + box[2] - 20, box[1] + 75), fill=INPUT_COLOR, outline=(120, 120, 120))
+            draw.text((box[0] + 26, box[1] + 52), self.file_dialog_text[-70:], font=self.input_font, fill=INPUT_TEXT_COLOR)
+            return
+        button_template = 'remove_confirm_button.png' if self.dialog == 'confirm' else 'choose_file_button.png'
+        dialog_box, button_box = self._dialog_boxes(button_template)
+        draw.rectangle((dialog_box[0], dialog_box[1], dialog_box[0] + dialog_box[2], dialog_box[1] + dialog_box[3]), fill=DIALOG_COLOR, outline=(90, 90, 90))
+        screen.paste(self._template(button_template), button_box[:2])
+    
+    @staticmethod
+    def _hit(box, point):
+        return box is not None and box[0] <= point[0] < box[0] + box[2] and box[1] <= point[1] < box[1] + box[3]
+    
+    def move_to(self, x, y):
+        with self.lock:
+            self.pointer = (int(x), int(y))
+    
+    def click(self):
+        with self.lock:
+            self._apply_due_changes()
+            now = time.monotonic()
+            last_point, last_time, last_count = self.last_click
+            count = last_count + 1 if last_point == self.pointer and now - last_time <= self.MULTI_CLICK_INTERVAL else 1
+            self.last_click = (self.pointer, now, count)
+            self._handle_click(self.pointer, count)
+            self._invalidate()
+    
+    def _handle_click(self, point, count):
+        if self.dialog == 'file':
+            return
+        
+        if self.dialog == 'confirm':
+            if self._hit(self._dialog_boxes('remove_confirm_button.png')[1], point):
+                self.dialog = None
+                self._remove_texture(self.menu_target)
+            return
+        
+        if self.dialog == 'choose':
+            self.dialog = None
+            
+            if self._hit(self._dialog_boxes('choose_file_button.png')[1], point):
+                self.file_dialog_text = ''
+                self._schedule(lambda: setattr(self, 'dialog', 'file'))
+            return
+        
+        if self.menu_for is not None:
+            _, remove_box = self._menu_box()
+            target = self.menu_for
+            self.menu_for = None
+            
+            if self._hit(remove_box, point):
+                self.menu_target = target
+                self._schedule(lambda: setattr(self, 'dialog', 'confirm'))
+            return
+        field_hit = self._form_hit(point) if self.selected is not None else None
+        
+        if self.focused_field and (field_hit is None or field_hit != ('field', self.focused_field)):
+            self._commit_field()
+        
+        if field_hit is not None:
+            self._handle_form_click(field_hit, count)
+            return
+        self._handle_list_click(point)
+    
+    def _form_hit(self, point):
+        form = self._form_layout()
+        
+        if self._hit(form['adjust_arrow'], point):
+            return ('adjust_arrow', None)
+        
+        if self._hit(form['repeat_arrow'], point):
+            return ('repeat_arrow', None)
+        
+        for key, field in form['fields'].items():
+            if self._hit(field['input'], point):
+                return ('field', key)
+            
+            if self._hit(field['label'], point):
+                return ('label', key)
+        
+        for key, box in form['flips'].items():
+            if self._hit(box, point):
+                return ('flip', key)
+        
+        for key, box in form['checkboxes'].items():
+            if self._hit((box[0] + box[2] - 30, box[1], 30, box[3]), point):
+                return ('checkbox', key)
+        return None
+    
+    def _handle_form_click(self, hit, count):
+        kind, key = hit
+        
+        if kind == 'adjust_arrow':
+            self.adjust_expanded = not self.adjust_expanded
+        elif kind == 'repeat_arrow':
+            self.repeat_expanded = not self.repeat_expanded
+        elif kind == 'field':
+            if self.focused_field != key:
+                self.focused_field = key
+                self.field_buffer = f"{self.selected['values'][key]:.3f}"
+            self.select_all = count >= 3
+        elif kind in ('flip', 'checkbox'):
+            self.selected['values'][key] = not self.selected['values'].get(key, False)
+    
+    def _handle_list_click(self, point):
+        for item in self._compute_layout()['items']:
+            if item['kind'] == 'header':
+                if self._hit(self._arrow_box(item), point):
+                    item['group']['expanded'] = not item['group']['expanded']
+                    return
+            elif item['kind'] == 'texture':
+                texture = item['texture']
+                
+                if texture is self.selected and self._hit(self._more_button_box(item), point):
+                    self._schedule(lambda: setattr(self, 'menu_for', texture))
+                    return
+                
+                if self._hit((self.ITEM_LEFT, item['top'], self._item_bar_box(item)[2], item['height']), point):
+                    self.selected = texture
+                    return
+            elif self._hit(self._upload_button_box(item), point):
+                self.upload_group = item['group']
+                self._schedule(lambda: setattr(self, 'dialog', 'choose'))
+                return
+    
+    def _commit_field(self):
+        try:
+            self.selected['values'][self.focused_field] = float(self.field_buffer)
+        except (TypeError, ValueError):
+            pass
+        self.focused_field = None
+        self.field_buffer = ''
+        self.select_all = False
+    
+    def _remove_texture(self, texture):
+        for group in self.groups:
+            if texture in group['textures']:
+                group['textures'].remove(texture)
+        
+        if self.selected is texture:
+            self.selected = None
+            self.focused_field = None
+    
+    def _finish_upload(self):
+        path = self.file_dialog_text.strip()
+        self.dialog = None
+        self.file_dialog_text = ''
+        
+        if not path or self.upload_group is None:
+            return
+        texture = self._new_texture(path)
+        self.upload_group['textures'].append(texture)
+        self.selected = texture
+    
+    def type_text(self, text):
+        with self.lock:
+            if self.dialog == 'file':
+                self.file_dialog_text += text
+            elif self.focused_field:
+                self.field_buffer = text if self.select_all else self.field_buffer + text
+                self.select_all = False
+            self._invalidate()
+    
+    def press(self, key):
+        with self.lock:
+            if key == 'v' and self.modifiers & set(MODIFIER_KEYS):
+                self.type_text(self.clipboard)
+            elif key == 'enter':
+                if self.dialog == 'file':
+                    self._schedule(self._finish_upload)
+                elif self.focused_field:
+                    self._commit_field()
+            elif key == 'backspace':
+                if self.dialog == 'file':
+                    self.file_dialog_text = self.file_dialog_text[:-1]
+                elif self.focused_field:
+                    self.field_buffer = '' if self.select_all else self.field_buffer[:-1]
+                    self.select_all = False
+            self._invalidate()
+    
+    def key_down(self, key):
+        with self.lock:
+            self.modifiers.add(key)
+    
+    def key_up(self, key):
+        with self.lock:
+            self.modifiers.discard(key)
+    
+    def scroll(self, amount, x=None, y=None):
+        """
+        Scrolls the group list if the pointer is over it. Positive amounts scroll up.
+        """
+        
+        with self.lock:
+            x, y = (x, y) if x is not None and y is not None else self.pointer
+            
+            if not (self.LIST_LEFT <= x < self.LIST_LEFT + self.LIST_WIDTH and self.LIST_TOP <= y):
+                return
+            self._compute_layout()
+            offset = self.scroll_offset - int(amount * self.SCROLL_PIXELS_PER_UNIT)
+            self.scroll_offset = max(0, min(self.max_scroll, offset))
+            self.menu_for = None
+            self._invalidate()
+
+
+class SimulatorCaptureBackend(CaptureBackend):
+    """
+    Captures the screen of a CreatorSimulator. Parts of a region outside the simulated
+    screen are black.
+    """
+    
+    def __init__(self, simulator):
+        self.simulator = simulator
+    
+    def grab(self, region=None):
+        screen = self.simulator.render()
+        
+        if region is None:
+            return screen.copy()
+        left, top, width, height = (int(v) for v in region)
+        return screen.crop((left, top, left + width, top + height))
+    
+    def monitors(self):
+        width, height = self.simulator.screen_size
+        return [Monitor(0, 0, width, height, 'simulator')]
+
+
+class SimulatorInputBackend(InputBackend):
+    """
+    Sends input to a CreatorSimulator instead of the real mouse and keyboard.
+    """
+    
+    def __init__(self, simulator):
+        self.simulator = simulator
+    
+    def position(self):
+        return self.simulator.pointer
+    
+    def move_to(self, x, y, duration=0.0):
+        self.simulator.move_to(x, y)
+    
+    def click(self):
+        self.simulator.click()
+    
+    def write(self, text):
+        self.simulator.type_text(text)
+    
+    def press(self, key):
+        self.simulator.press(key)
+    
+    def key_down(self, key):
+        self.simulator.key_down(key)
+    
+    def key_up(self, key):
+        self.simulator.key_up(key)
+    
+    def scroll(self, amount, x=None, y=None):
+        self.simulator.scroll(amount, x, y)
+    
+    def hotkey(self, *keys):
+        for key in keys[:-1]:
+            self.simulator.key_down(key)
+        self.simulator.press(keys[-1])
+        
+        for key in reversed(keys[:-1]):
+            self.simulator.key_up(key)
+    
+    def get_clipboard(self):
+        return self.simulator.clipboard
+    
+    def set_clipboard(self, text):
+        self.simulator.clipboard = text
@@ -1,17 +1,32 @@
-import pyautogui
+import math
 import time
-from .exceptions import AutomationStoppedError
+import platform
+from .sleeper import Sleeper
+from .backends import PyAutoGUIInputBackend
+from .exceptions import AutomationStoppedError, ClipboardError
+from .tracing import traced
+TEXT_ENTRY_MODES = ('bulk', 'paste', 'per_char')
+MOTION_MODES = ('instant', 'scaled', 'fixed')
 
 
 class Controller:
     """
     Handles all mouse and keyboard simulation.
     """
-    def __init__(self):
+    def __init__(self, input_backend=None):
+        self.input_backend = input_backend or PyAutoGUIInputBackend()
         self.action_delay = 0.1
         self.action_region = None
         self.log = print
         self.stop_event = None
+        self.sleeper = Sleeper()
+        self.tracer = None
+        self.text_entry_mode = 'bulk'
+        self.motion_mode = 'fixed'
+        self.pointer_speed = 5000.0
+        self.max_move_duration = 0.1
+        self.hover_duration = 0.0
+        self.action_pauses = {'move': 0.1, 'click': 0.1, 'key': 0.1, 'scroll': 0.1}
     
     def _check_stop(self):
         if self.stop_event and self.stop_event.is_set():
@@ -21,19 +36,48 @@ class Controller:
         """
         A sleep that can be interrupted by the stop event.
         """
+        self._check_stop()
+        self.sleeper.sleep(duration)
+        self._check_stop()
+    
+    def _pause(self, action_type):
+        """
+        Waits the configured pause after a raw input call of the given type. This replaces
+        pyautogui's global PAUSE, which the input backend bypasses on every call.
+        """
+        self._interruptible_sleep(self.action_pauses.get(action_type, 0.0))
+    
+    def _move_duration(self, x, y):
+        """
+        The duration of a pointer move under the motion policy: 'instant' warps, 'scaled'
+        grows with the distance up to max_move_duration, and 'fixed' always animates for
+        max_move_duration.
+        """
         
-        if duration <= 0:
-            return
-        end_time = time.time() + duration
+        if self.motion_mode == 'instant':
+            return 0.0
         
-        while time.time() < end_time:
-            self._check_stop()
-            remaining = end_time - time.time()
-            
-            if remaining > 0:
-                time.sleep(min(0.05, remaining))
+        if self.motion_mode == 'scaled':
+            current_x, current_y = self.input_backend.position()
+            distance = math.hypot(x - current_x, y - current_y)
+            return min(self.max_move_duration, distance / self.pointer_speed) if self.pointer_speed > 0 else 0.0
+        return self.max_move_duration
     
-    def click(self, coords, clicks=1, interval=0.1):
+    @traced('input')
+    def move_to(self, x, y, hover=False):
+        """
+        Moves the pointer under the motion policy. With hover, the pointer rests on the
+        target for at least hover_duration, for elements that react to hovering.
+        """
+        self._check_stop()
+        self.input_backend.move_to(x, y, duration=self._move_duration(x, y))
+        self._pause('move')
+        
+        if hover:
+            self._interruptible_sleep(self.hover_duration)
+    
+    @traced('input')
+    def click(self, coords, clicks=1, interval=0.1, hover=False):
         """
         Moves to coordinates and clicks, checking for stop event between clicks.
         """
@@ -43,68 +87,136 @@ class Controller:
             return
         x, y = coords
         self.log(f"  - Clicking at ({x}, {y}) {clicks} time(s)")
-        pyautogui.moveTo(x, y, duration=0.1)
-        self._check_stop()
+        self.move_to(x, y, hover=hover)
         
         for i in range(clicks):
-            pyautogui.click()
+            self.input_backend.click()
             self._check_stop()
             
             if i < clicks - 1:
                 self._interruptible_sleep(interval)
+        self._pause('click')
         self._interruptible_sleep(self.action_delay)
     
-    def write(self, text, interval=0.01):
+    @traced('input')
+    def write(self, text, interval=0.01, mode=None):
         """
-        Types a string of text, checking for stop event between characters.
+        Types a string of text. In 'bulk' mode the whole string is sent in a single input
+        call, in 'paste' mode it is pasted through the clipboard, and in 'per_char' mode
+        each character is typed separately with a stop check in between. Bulk and paste
+        entry fall back to typing per character if they fail.
         """
-        self.log(f"  - Typing: '{text[:30]}...'")
+        mode = mode or self.text_entry_mode
+        self.log(f"  - Typing ({mode}): '{text[:30]}...'")
+        
+        if mode not in TEXT_ENTRY_MODES:
+            self.log(f"  - Unknown text entry mode '{mode}'. Typing per character.")
+        elif mode == 'bulk':
+            self._check_stop()
+            try:
+                self.input_backend.write(text)
+                self._pause('key')
+                self._interruptible_sleep(self.action_delay)
+                return
+            except self.input_backend.fail_safe_exceptions:
+                raise
+            except Exception as e:
+                self.log(f"  - Bulk text entry failed: {e}. Typing per character.")
+        elif mode == 'paste':
+            try:
+                self.paste_text(text)
+                return
+            except ClipboardError as e:
+                self.log(f"  - Pasting text failed: {e}. Typing per character.")
         
         for char in text:
             self._check_stop()
-            pyautogui.write(char)
+            self.input_backend.write(char)
             
             if interval > 0:
                 self._interruptible_sleep(interval)
+        self._pause('key')
         self._interruptible_sleep(self.action_delay)
     
+    @traced('input')
+    def paste_text(self, text, verify_timeout=2.0, post_paste_delay=0.1):
+        """
+        Pastes text through the clipboard by holding the paste modifier and pressing 'v',
+        restoring the previous clipboard contents afterwards.
+        Raises ClipboardError if the clipboard could not be verified to hold the text.
+        """
+        original_clipboard = None
+        try:
+            original_clipboard = self.input_backend.get_clipboard()
+            self.log(f"  - Attempting to copy '{text[:30]}' to clipboard.")
+            self.input_backend.set_clipboard(text)
+            start_time = time.monotonic()
+            
+            while self.input_backend.get_clipboard() != text:
+                if time.monotonic() - start_time >= verify_timeout:
+                    raise ClipboardError(f"Failed to verify clipboard content after {verify_timeout}s.")
+                self._interruptible_sleep(0.05)
+            self.log("  - Clipboard content verified.")
+            paste_key = "command" if platform.system() == "Darwin" else "ctrl"
+            self.log(f"  - Performing robust paste action (holding '{paste_key}' and pressing 'v').")
+            self.key_down(paste_key)
+            try:
+                self.press('v')
+            finally:
+                self.key_up(paste_key)
+            self._interruptible_sleep(post_paste_delay)
+        finally:
+            if original_clipboard is not None:
+                self.input_backend.set_clipboard(original_clipboard)
+                self.log("  - Original clipboard content restored.")
+    
+    @traced('input')
     def press(self, key):
         """
         Presses a single key.
         """
         self.log(f"  - Pressing key: '{key}'")
         self._check_stop()
-        pyautogui.press(key)
+        self.input_backend.press(key)
+        self._pause('key')
         self._interruptible_sleep(self.action_delay)
     
+    @traced('input')
     def key_down(self, key):
         """
         Presses and holds a key down.
         """
         self.log(f"  - Key down: '{key}'")
-        pyautogui.keyDown(key)
+        self.input_backend.key_down(key)
+        self._pause('key')
     
+    @traced('input')
     def key_up(self, key):
         """
         Releases a key.
         """
         self.log(f"  - Key up: '{key}'")
-        pyautogui.keyUp(key)
+        self.input_backend.key_up(key)
+        self._pause('key')
     
+    @traced('input')
     def scroll(self, amount, x=None, y=None):
         """
         Scrolls the mouse wheel.
         """
         self.log(f"  - Scrolling by {amount} units.")
         self._check_stop()
-        pyautogui.scroll(amount, x, y)
+        self.input_backend.scroll(amount, x, y)
+        self._pause('scroll')
         self._interruptible_sleep(self.action_delay)
     
+    @traced('input')
     def hotkey(self, *args):
         """
         Presses multiple keys simultaneously (e.g., for shortcuts like Ctrl+V).
         """
         self.log(f"  - Pressing hotkey: '{'+'.join(args)}'")
         self._check_stop()
-        pyautogui.hotkey(*args)
+        self.input_backend.hotkey(*args)
+        self._pause('key')
         self._interruptible_sleep(self.action_delay)
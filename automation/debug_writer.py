@@ -0,0 +1,75 @@
+import os
+import queue
+import threading
+import cv2
+
+
+class DebugImageWriter:
+    """
+    Writes debug images on a background thread so debug mode barely slows the automation.
+    Images are queued without copying (callers must not modify them afterwards), saved with
+    fast PNG compression into a subfolder per run, and dropped when the queue is full.
+    """
+    MAX_QUEUE_SIZE = 64
+    PNG_COMPRESSION = 1
+    
+    def __init__(self, base_dir, log_callback=print):
+        self.base_dir = base_dir
+        self.run_dir = base_dir
+        self.log = log_callback
+        self.queue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self.dropped = 0
+        self.written = 0
+        self.thread = None
+        self.lock = threading.Lock()
+    
+    def start_run(self, run_name):
+        """
+        Directs following images into a subfolder for the run.
+        """
+        self.run_dir = os.path.join(self.base_dir, run_name)
+        self.dropped = 0
+        self.written = 0
+    
+    def finish_run(self):
+        """
+        Logs how many images were written and dropped during the run.
+        """
+        
+        if self.written or self.dropped:
+            self.log(f"Debug images: {self.written} written, {self.dropped} dropped, in {self.run_dir}")
+    
+    def submit(self, filename, image):
+        """
+        Queues a PIL image or a NumPy (OpenCV) array to be written as filename in the
+        current run folder. Returns False if the image was dropped.
+        """
+        self._ensure_thread()
+        try:
+            self.queue.put_nowait((os.path.join(self.run_dir, filename), image))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+    
+    def _ensure_thread(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._worker, name="DebugImageWriter", daemon=True)
+                self.thread.start()
+    
+    def _worker(self):
+        while True:
+            path, image = self.queue.get()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                
+                if hasattr(image, 'save'):
+                    image.save(path, compress_level=self.PNG_COMPRESSION)
+                else:
+                    cv2.imwrite(path, image, [cv2.IMWRITE_PNG_COMPRESSION, self.PNG_COMPRESSION])
+                self.written += 1
+            except Exception as e:
+                self.log(f"  - Could not write debug image {path}: {e}")
+            finally:
+                self.queue.task_done()
@@ -17,3 +17,18 @@ class FastApplyError(Exception):
     Custom exception for when Fast Apply cannot proceed safely.
     """
     pass
+
+
+class ClipboardError(Exception):
+    """
+    Custom exception for when text cannot be placed on the clipboard for pasting.
+    """
+    pass
+
+
+
+class CaptureError(Exception):
+    """
+    Custom exception for when the screen (or a replayed session) cannot be captured.
+    """
+    pass
@@ -0,0 +1,107 @@
+import time
+from automation.automation_config import AutomationSettings
+FIELD_TEMPLATES = {
+    'size': 'size_input.png',
+    'angle': 'angle_input.png',
+    'opacity': 'opacity_input.png',
+    'x_position': 'x_pos_input.png',
+    'y_position': 'y_pos_input.png',
+}
+BELOW_CONSTRAINTS = {
+    'y_position': ('x_position', 75),
+}
+SAME_ROW_TOLERANCE = 10
+
+
+def settings_form_region(manager, anchor_point=None):
+    """
+    The part of the window that holds the texture settings form: the column below the
+    adjust panel icon, or the whole app region if the icon was not found.
+    """
+    app_region = manager.vision.app_region
+    
+    if not app_region or not anchor_point:
+        return app_region
+    app_bottom = app_region[1] + app_region[3]
+    
+    if app_bottom - anchor_point[1] <= 0:
+        return app_region
+    return (int(anchor_point[0] - 50), int(anchor_point[1] - 10), 450, int(app_bottom - anchor_point[1] + 10))
+
+
+def _resolve_fields(candidates_by_key):
+    """
+    Picks one label per field. Unconstrained fields take their best match; a field that
+    must sit below another (e.g. Y below X) takes its best match in that band. A label
+    row already claimed by another field is never reused.
+    """
+    resolved = {}
+    
+    def _is_free(point):
+        return all(abs(point.y - other['point'].y) > SAME_ROW_TOLERANCE for other in resolved.values())
+    ordered_keys = [k for k in candidates_by_key if k not in BELOW_CONSTRAINTS]
+    ordered_keys += [k for k in candidates_by_key if k in BELOW_CONSTRAINTS]
+    
+    for key in ordered_keys:
+        for candidate in candidates_by_key[key]:
+            point = candidate['point']
+            
+            if not _is_free(point):
+                continue
+            
+            if key in BELOW_CONSTRAINTS:
+                anchor_key, max_distance = BELOW_CONSTRAINTS[key]
+                anchor = resolved.get(anchor_key)
+                
+                if not anchor or not (anchor['point'].y < point.y <= anchor['point'].y + max_distance):
+                    continue
+            resolved[key] = candidate
+            break
+    return resolved
+
+
+def locate_settings_form(manager, keys, anchor_point=None, timeout=None):
+    """
+    Locates the labels of the requested settings fields in one capture of the settings
+    form and returns {key: {'label': point, 'entry': (x, y)}}, where entry is the click
+    target of the field's input. Fields that must be ordered relative to another field
+    pull that field into the search as well. Recaptures until every field is found or
+    the timeout expires, widening the search to the whole app region after a miss,
+    and returns whatever was found.
+    """
+    timeout = AutomationSettings.GENERIC_ELEMENT_TIMEOUT if timeout is None else timeout
+    search_keys = list(keys)
+    
+    for key in keys:
+        if key in BELOW_CONSTRAINTS and BELOW_CONSTRAINTS[key][0] not in search_keys:
+            search_keys.append(BELOW_CONSTRAINTS[key][0])
+    template_names = [FIELD_TEMPLATES[key] for key in search_keys]
+    start_time = time.monotonic()
+    region = settings_form_region(manager, anchor_point)
+    
+    while True:
+        manager._check_for_stop()
+        manager.metrics.record_wait_iteration('settings_form')
+        matches = manager.vision.match_templates(template_names, region=region)
+        resolved = _resolve_fields({key: matches[FIELD_TEMPLATES[key]] for key in search_keys})
+        
+        if all(key in resolved for key in keys):
+            manager.record_latency('element_appear', time.monotonic() - start_time)
+            break
+        
+        if time.monotonic() - start_time >= timeout:
+            break
+        region = manager.vision.app_region
+        manager._interruptible_sleep(0.1)
+    manager.metrics.record_wait(time.monotonic() - start_time)
+    form = {}
+    
+    for key, candidate in resolved.items():
+        label = candidate['point']
+        entry_x = label.x + candidate['width'] / 2 + 5
+        form[key] = {'label': label, 'entry': (entry_x, label.y)}
+    missing = [key for key in keys if key not in form]
+    
+    if missing:
+        manager.vision.log(f"  - Form locator could not find: {missing}")
+    return form
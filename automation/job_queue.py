@@ -0,0 +1,60 @@
+import threading
+from collections import deque
+
+
+class ApplyJobQueue:
+    """
+    The queue of apply jobs waiting for the automation worker. Jobs run in the order
+    they were queued; a job identical to one still waiting is coalesced into it, and
+    all waiting jobs can be cancelled at once (on an emergency stop).
+    """
+    
+    def __init__(self):
+        self.jobs = deque()
+        self.condition = threading.Condition()
+        self.is_closed = False
+    
+    def put(self, job, key=None):
+        """
+        Queues a job. Returns False if it was coalesced into an identical job (same key)
+        that is still waiting.
+        """
+        
+        with self.condition:
+            if key is not None and any(queued_key == key for queued_key, _ in self.jobs):
+                return False
+            self.jobs.append((key, job))
+            self.condition.notify()
+            return True
+    
+    def get(self):
+        """
+        Waits for the next job and returns it, or None once the queue is closed.
+        """
+        
+        with self.condition:
+            while not self.jobs and not self.is_closed:
+                self.condition.wait()
+            
+            if self.is_closed:
+                return None
+            return self.jobs.popleft()[1]
+    
+    def cancel_pending(self):
+        """
+        Drops every waiting job. Returns how many were dropped.
+        """
+        
+        with self.condition:
+            count = len(self.jobs)
+            self.jobs.clear()
+            return count
+    
+    def close(self):
+        with self.condition:
+            self.is_closed = True
+            self.condition.notify_all()
+    
+    def __len__(self):
+        with self.condition:
+            return len(self.jobs)
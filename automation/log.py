@@ -0,0 +1,85 @@
+import logging
+ROOT_LOGGER_NAME = 'automation'
+DEFAULT_LEVELS = {ROOT_LOGGER_NAME: 'INFO'}
+VERBOSE_LOGGERS = (
+    'automation.vision', 'automation.ocr', 'automation.panel_model', 'automation.actions.ui_helpers',
+)
+
+
+class CallbackHandler(logging.Handler):
+    """
+    Forwards records from the automation loggers to the log callbacks of the current
+    run: DEBUG records to the verbose callback, everything else to the main one.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.log_callback = print
+        self.verbose_log_callback = print
+        self.setFormatter(logging.Formatter('%(message)s'))
+    
+    def emit(self, record):
+        try:
+            message = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        
+        if record.levelno < logging.INFO:
+            self.verbose_log_callback(message)
+        else:
+            self.log_callback(message)
+
+
+handler = CallbackHandler()
+
+
+def get_logger(name):
+    """
+    Returns the logger for an automation module. Messages are only formatted when the
+    logger's level lets them through, so debug chatter costs a level check when off.
+    """
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    
+    if handler not in root.handlers:
+        root.addHandler(handler)
+        root.propagate = False
+        set_levels(DEFAULT_LEVELS)
+    return logging.getLogger(name)
+
+
+def set_callbacks(log_callback, verbose_log_callback=None):
+    handler.log_callback = log_callback
+    handler.verbose_log_callback = verbose_log_callback or log_callback
+
+
+def set_level(name, level):
+    """
+    Sets the level ('DEBUG', 'INFO', ... or a number) of an automation logger at runtime.
+    Modules without their own level inherit it from their parent package.
+    """
+    
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level: {level}")
+    logging.getLogger(name).setLevel(level)
+
+
+def set_levels(levels):
+    """
+    Applies {logger name: level} overrides, e.g. from the config file.
+    """
+    
+    for name, level in levels.items():
+        set_level(name, level)
+
+
+def set_verbose(enabled):
+    """
+    Turns the per-search debug chatter of the Vision, OCR and panel modules on or off.
+    """
+    
+    for name in VERBOSE_LOGGERS:
+        set_level(name, 'DEBUG' if enabled else logging.NOTSET)
@@ -0,0 +1,159 @@
+import os
+import json
+import threading
+from .tracing import prune_old_files
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class RunMetrics:
+    """
+    Counts the work done during a run: screenshots and pixels captured, template matches
+    per template and scale, OCR calls, cache hit rates and wait-loop iterations, plus
+    fixed-bucket latency histograms of OCR calls, template matches and waits. Summarized
+    on the console and saved as JSON after each run; only the newest files are kept.
+    """
+    MAX_METRICS_FILES = 40
+    
+    def __init__(self, metrics_dir='metrics', log_callback=print):
+        self.metrics_dir = metrics_dir
+        self.log = log_callback
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """
+        Clears all counters, at the start of a run.
+        """
+        
+        with self.lock:
+            self.counters = {}
+            self.template_matches = {}
+            self.cache_lookups = {}
+            self.ocr_latencies = []
+            self.wait_iterations = {}
+            self.latency_histograms = {}
+    
+    def record_screenshot(self, width, height):
+        with self.lock:
+            self.counters['screenshots'] = self.counters.get('screenshots', 0) + 1
+            self.counters['pixels_captured'] = self.counters.get('pixels_captured', 0) + int(width) * int(height)
+    
+    def record_template_match(self, template_name, scale=1.0, latency=None):
+        """
+        Counts one template match for a template at a scale, and its latency if given.
+        """
+        
+        with self.lock:
+            scales = self.template_matches.setdefault(template_name, {})
+            key = f"{scale:.2f}"
+            scales[key] = scales.get(key, 0) + 1
+            
+            if latency is not None:
+                self._add_to_histogram('template_match', latency)
+    
+    def record_ocr(self, latency):
+        with self.lock:
+            self.ocr_latencies.append(latency)
+            self._add_to_histogram('ocr', latency)
+    
+    def record_wait(self, latency):
+        """
+        Records how long a wait loop waited, whether or not its element appeared.
+        """
+        
+        with self.lock:
+            self._add_to_histogram('wait', latency)
+    
+    def _add_to_histogram(self, kind, latency):
+        histogram = self.latency_histograms.setdefault(kind, [0] * (len(LATENCY_BUCKETS) + 1))
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if latency <= bound), len(LATENCY_BUCKETS))
+        histogram[bucket] += 1
+    
+    def record_cache_lookup(self, cache_name, hit):
+        with self.lock:
+            lookups = self.cache_lookups.setdefault(cache_name, {'hits': 0, 'misses': 0})
+            lookups['hits' if hit else 'misses'] += 1
+    
+    def record_wait_iteration(self, wait_name):
+        with self.lock:
+            self.wait_iterations[wait_name] = self.wait_iterations.get(wait_name, 0) + 1
+    
+    def get_summary(self):
+        """
+        Returns all metrics of the run as a JSON-serializable dict.
+        """
+        
+        with self.lock:
+            ocr_latencies = sorted(self.ocr_latencies)
+            summary = {
+                'counters': dict(self.counters),
+                'template_matches': {name: dict(scales) for name, scales in self.template_matches.items()},
+                'template_match_total': sum(sum(scales.values()) for scales in self.template_matches.values()),
+                'ocr': {
+                    'calls': len(ocr_latencies),
+                    'total_seconds': round(sum(ocr_latencies), 3),
+                    'median_seconds': round(ocr_latencies[len(ocr_latencies) // 2], 3) if ocr_latencies else None,
+                    'max_seconds': round(ocr_latencies[-1], 3) if ocr_latencies else None,
+                },
+                'caches': {},
+                'wait_iterations': dict(self.wait_iterations),
+                'latency_histograms': {
+                    kind: self._format_histogram(histogram) for kind, histogram in self.latency_histograms.items()
+                },
+            }
+            
+            for cache_name, lookups in self.cache_lookups.items():
+                total = lookups['hits'] + lookups['misses']
+                summary['caches'][cache_name] = dict(lookups, hit_rate=round(lookups['hits'] / total, 3) if total else None)
+        return summary
+    
+    @staticmethod
+    def _format_histogram(histogram):
+        """
+        Labels the bucket counts of a histogram by their upper bound in seconds.
+        """
+        labels = [f"<={bound:g}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]:g}s"]
+        return {'count': sum(histogram), 'buckets': dict(zip(labels, histogram))}
+    
+    def format_summary(self):
+        """
+        Returns short console lines summarizing the run.
+        """
+        summary = self.get_summary()
+        counters = summary['counters']
+        ocr = summary['ocr']
+        lines = [
+            "Run metrics:",
+            f"  - Screenshots: {counters.get('screenshots', 0)} ({counters.get('pixels_captured', 0) / 1e6:.1f} MP captured)",
+            f"  - Template matches: {summary['template_match_total']} across {len(summary['template_matches'])} templates",
+            f"  - OCR: {ocr['calls']} calls, {ocr['total_seconds']:.2f}s total",
+        ]
+        
+        for cache_name, lookups in summary['caches'].items():
+            hit_rate = f"{lookups['hit_rate']:.0%}" if lookups['hit_rate'] is not None else "n/a"
+            lines.append(f"  - {cache_name}: {lookups['hits']} hits, {lookups['misses']} misses ({hit_rate})")
+        
+        if summary['wait_iterations']:
+            waits = ", ".join(f"{name} {count}" for name, count in summary['wait_iterations'].items())
+            lines.append(f"  - Wait-loop iterations: {waits}")
+        
+        for kind, histogram in summary['latency_histograms'].items():
+            buckets = ", ".join(f"{label} {count}" for label, count in histogram['buckets'].items() if count)
+            lines.append(f"  - {kind} latency ({histogram['count']}): {buckets}")
+        return lines
+    
+    def export(self, run_name):
+        """
+        Writes the run's metrics to metrics_dir/<run_name>.json and prunes old metrics
+        files. Returns the path or None.
+        """
+        path = os.path.join(self.metrics_dir, f"{run_name}.json")
+        try:
+            os.makedirs(self.metrics_dir, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(self.get_summary(), f, indent=4)
+        except IOError as e:
+            self.log(f"Error: Could not save run metrics to {path}. Error: {e}")
+            return None
+        prune_old_files(self.metrics_dir, '.json', self.MAX_METRICS_FILES)
+        return path
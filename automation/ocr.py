@@ -1,7 +1,12 @@
+import logging
+import time
 import threading
 import easyocr
 import numpy as np
 from difflib import SequenceMatcher
+from .tracing import traced
+from .log import get_logger
+logger = get_logger(__name__)
 
 
 def _contains_cjk(text):
@@ -16,6 +21,26 @@ def _contains_cjk(text):
     )
 
 
+def score_text_match(text_to_find, text, similarity_threshold=0.6):
+    """
+    Scores how well a piece of OCR text matches the text being searched for.
+    Returns (score, similarity), with score None if the text is not a candidate at all.
+    """
+    is_substring = text_to_find.lower() in text.lower()
+    similarity = SequenceMatcher(None, text_to_find.lower(), text.lower()).ratio()
+    
+    if not is_substring and similarity < similarity_threshold:
+        return None, similarity
+    
+    if text_to_find.lower() == text.lower():
+        score = 1.0
+    elif is_substring:
+        score = 0.95 - (len(text) - len(text_to_find)) * 0.05
+    else:
+        score = similarity * 0.9
+    return score, similarity
+
+
 class OCR:
     """
     Handles all Optical Character Recognition tasks using EasyOCR.
@@ -24,6 +49,8 @@ class OCR:
     def __init__(self):
         self.log = print
         self.thread_local = threading.local()
+        self.tracer = None
+        self.metrics = None
     
     @property
     def reader(self):
@@ -49,6 +76,18 @@ class OCR:
                     self.thread_local.reader = None
         return self.thread_local.reader
     
+    def _readtext(self, image_np):
+        """
+        Runs the OCR reader on an image, recording the call's latency in the run metrics.
+        """
+        start_time = time.monotonic()
+        try:
+            return self.reader.readtext(image_np)
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_ocr(time.monotonic() - start_time)
+    
+    @traced('ocr')
     def get_text_from_image(self, image_np):
         """
         Reads all text from a given NumPy image array.
@@ -58,12 +97,39 @@ class OCR:
             self.log("OCR reader not available.")
             return ""
         try:
-            result = self.reader.readtext(image_np)
+            result = self._readtext(image_np)
             return " ".join([item[1] for item in result])
         except Exception as e:
             self.log(f"An error occurred during OCR text extraction: {e}")
             return ""
     
+    @traced('ocr')
+    def read_text_boxes(self, image_np, region_offset=(0, 0)):
+        """
+        Reads all text from a NumPy image array in one pass and returns each text item
+        with its bounding box (left, top, width, height), adjusted by the region offset.
+        """
+        
+        if not self.reader:
+            self.log("OCR reader not available.")
+            return []
+        try:
+            results = self._readtext(image_np)
+        except Exception as e:
+            self.log(f"An error occurred during OCR text extraction: {e}")
+            return []
+        text_boxes = []
+        
+        for (bbox, text, prob) in results:
+            (tl, tr, br, bl) = bbox
+            left = int(tl[0] + region_offset[0])
+            top = int(tl[1] + region_offset[1])
+            width = int(tr[0] - tl[0])
+            height = int(bl[1] - tl[1])
+            text_boxes.append({'bbox': (left, top, width, height), 'text': text, 'prob': prob})
+        return text_boxes
+    
+    @traced('ocr')
     def find_text_in_image(self, image_np, text_to_find, region_offset=(0, 0)):
         """
         Finds all occurrences of text in a NumPy image array and returns their
@@ -73,31 +139,23 @@ class OCR:
         if not self.reader:
             self.log("OCR reader not available.")
             return [], []
-        results = self.reader.readtext(image_np)
+        results = self._readtext(image_np)
         all_found_texts = [item[1] for item in results]
         
         if all_found_texts:
-            self.log(f"  - OCR found text candidates: [{', '.join(all_found_texts)}]")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  - OCR found text candidates: [%s]", ', '.join(all_found_texts))
         else:
-            self.log("  - OCR found no text in the region.")
+            logger.debug("  - OCR found no text in the region.")
         potential_matches = []
         non_candidates = []
-        SIMILARITY_THRESHOLD = 0.6
         
         for (bbox, text, prob) in results:
-            is_substring = text_to_find.lower() in text.lower()
-            similarity = SequenceMatcher(None, text_to_find.lower(), text.lower()).ratio()
+            score, similarity = score_text_match(text_to_find, text)
             
-            if is_substring or similarity >= SIMILARITY_THRESHOLD:
-                if text_to_find.lower() == text.lower():
-                    score = 1.0
-                elif is_substring:
-                    score = 0.95 - (len(text) - len(text_to_find)) * 0.05
-                else:
-                    score = similarity * 0.9
-                
+            if score is not None:
                 if score > 0.5:
-                    self.log(f"  - Found potential match '{text}' for '{text_to_find}' (Similarity: {similarity:.2f}, Score: {score:.2f})")
+                    logger.debug("  - Found potential match '%s' for '%s' (Similarity: %.2f, Score: %.2f)", text, text_to_find, similarity, score)
                     (tl, tr, br, bl) = bbox
                     left = int(tl[0] + region_offset[0])
                     top = int(tl[1] + region_offset[1])
@@ -0,0 +1,116 @@
+import json
+import os
+import threading
+
+
+class OperationHistory:
+    """
+    Keeps a rolling record of how long each kind of automation operation took on this
+    machine, persisted between sessions, so plans can be costed from real latencies.
+    """
+    MAX_SAMPLES = 50
+    
+    def __init__(self, history_path='operation_history.json', log_callback=print):
+        self.history_path = history_path
+        self.log = log_callback
+        self.samples = {}
+        self.lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        """
+        Loads recorded samples from the JSON file, ignoring a missing or corrupt file.
+        """
+        
+        if not os.path.exists(self.history_path):
+            return
+        try:
+            with open(self.history_path, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+        
+        with self.lock:
+            self.samples = {
+                op: [float(v) for v in values][-self.MAX_SAMPLES:]
+                for op, values in data.items() if isinstance(values, list)
+            }
+    
+    def save(self):
+        """
+        Saves the recorded samples to the JSON file.
+        """
+        
+        with self.lock:
+            data = {op: list(values) for op, values in self.samples.items()}
+        try:
+            with open(self.history_path, 'w') as f:
+                json.dump(data, f, indent=4)
+        except IOError as e:
+            self.log(f"Error: Could not save operation history to {self.history_path}. Error: {e}")
+    
+    def record(self, operation, duration):
+        """
+        Records one observed duration (in seconds) for an operation.
+        """
+        
+        with self.lock:
+            values = self.samples.setdefault(operation, [])
+            values.append(round(float(duration), 4))
+            
+            if len(values) > self.MAX_SAMPLES:
+                del values[:-self.MAX_SAMPLES]
+    
+    def estimate(self, operation):
+        """
+        Returns the median recorded duration for an operation, or None if it was never seen.
+        """
+        
+        with self.lock:
+            values = sorted(self.samples.get(operation, []))
+        
+        if not values:
+            return None
+        middle = len(values) // 2
+        
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+    
+    def percentile(self, operation, q):
+        """
+        Returns the q-th percentile (0-100) of the recorded durations for an operation,
+        interpolating between samples, or None if it was never seen.
+        """
+        
+        with self.lock:
+            values = sorted(self.samples.get(operation, []))
+        
+        if not values:
+            return None
+        rank = (len(values) - 1) * q / 100.0
+        lower = int(rank)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+    
+    def count(self, operation):
+        """
+        Returns the number of recorded samples for an operation.
+        """
+        
+        with self.lock:
+            return len(self.samples.get(operation, []))
+    
+    def get_costs(self, defaults):
+        """
+        Returns per-operation cost estimates, using recorded medians where available
+        and the given defaults otherwise.
+        """
+        costs = dict(defaults)
+        
+        for operation in defaults:
+            estimate = self.estimate(operation)
+            
+            if estimate is not None:
+                costs[operation] = estimate
+        return costs
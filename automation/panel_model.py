@@ -0,0 +1,314 @@
+from .ocr import score_text_match
+from .log import get_logger
+logger = get_logger(__name__)
+
+
+class PanelModel:
+    """
+    A scene graph of the Creator's texture panel, built from a single capture.
+    Holds every group arrow (with its OCR'd header text), upload button and texture item
+    currently visible, so actions can query the model instead of searching the screen.
+    The model is updated incrementally: scrolling translates it, and clicks that change
+    the layout only invalidate the part of the panel below the click. Header text is
+    OCR'd only when a query needs it, so lookups by position cost template matches only.
+    """
+    HEADER_ROW_TOLERANCE = 15
+    RESCAN_MARGIN = 30
+    MIN_CONFIDENT_SCORE = 0.9
+    TEXTURE_COLUMN_WIDTH = 400
+    
+    def __init__(self, manager):
+        self.manager = manager
+        self.region = None
+        self.header_column = None
+        self.arrows = []
+        self.upload_buttons = []
+        self.texture_items = []
+        self.text_boxes = []
+        self.unread_headers = []
+        self.is_scanned = False
+        self.dirty_from_y = None
+    
+    def _compute_regions(self):
+        """
+        Derives the panel and header column regions from the app anchor, using the
+        same geometry as the group and texture searches.
+        """
+        anchor_box = self.manager.anchor_box
+        app_region = self.manager.vision.app_region
+        
+        if not anchor_box or not app_region:
+            return None, None
+        panel_top = anchor_box.top + anchor_box.height
+        panel_region = (
+            int(anchor_box.left), int(panel_top),
+            int(anchor_box.width * 2.5), int(app_region[3] - panel_top)
+        )
+        header_left = anchor_box.left + anchor_box.width * 0.25
+        header_top = anchor_box.top + anchor_box.height * 3
+        header_column = (
+            int(header_left), int(header_top),
+            int(anchor_box.width * 1.5), int(app_region[3] - header_top)
+        )
+        return panel_region, header_column
+    
+    def invalidate(self):
+        """
+        Discards the whole model. The next query triggers a full scan.
+        """
+        self.arrows = []
+        self.upload_buttons = []
+        self.texture_items = []
+        self.text_boxes = []
+        self.unread_headers = []
+        self.is_scanned = False
+        self.dirty_from_y = None
+    
+    def invalidate_below(self, y):
+        """
+        Marks everything at or below a screen y coordinate as stale, e.g. after a click
+        that expanded a group or added/removed a texture.
+        """
+        
+        if not self.is_scanned:
+            return
+        y = int(y)
+        self.dirty_from_y = y if self.dirty_from_y is None else min(self.dirty_from_y, y)
+    
+    def shift(self, dy):
+        """
+        Translates the model by a measured vertical scroll offset. Elements that leave
+        the panel are dropped, and the newly revealed band is marked as stale.
+        """
+        
+        if not self.is_scanned or not self.region or dy == 0:
+            return
+        
+        if dy > 0:
+            self.invalidate()
+            return
+        top = self.region[1]
+        bottom = self.region[1] + self.region[3]
+        
+        def _shift_points(points):
+            return [p._replace(y=p.y + dy) for p in points if top <= p.y + dy < bottom]
+        self.arrows = [
+            dict(arrow, point=arrow['point']._replace(y=arrow['point'].y + dy))
+            for arrow in self.arrows if top <= arrow['point'].y + dy < bottom
+        ]
+        self.upload_buttons = _shift_points(self.upload_buttons)
+        self.texture_items = _shift_points(self.texture_items)
+        self.text_boxes = [
+            dict(box, bbox=(box['bbox'][0], box['bbox'][1] + dy, box['bbox'][2], box['bbox'][3]))
+            for box in self.text_boxes if top <= box['bbox'][1] + dy < bottom
+        ]
+        self.unread_headers = [
+            dict(header, band=(header['band'][0], header['band'][1] + dy, header['band'][2], header['band'][3]),
+                 cutoff_y=header['cutoff_y'] + dy)
+            for header in self.unread_headers
+        ]
+        
+        if self.dirty_from_y is not None:
+            self.dirty_from_y += dy
+        self.invalidate_below(bottom + dy)
+    
+    def ensure_fresh(self):
+        """
+        Scans the panel if the model is empty, or rescans only its stale band.
+        Returns True if the model is usable.
+        """
+        
+        if not self.is_scanned:
+            return self.scan()
+        
+        if self.dirty_from_y is not None:
+            return self.scan(from_y=self.dirty_from_y)
+        return True
+    
+    def scan(self, from_y=None):
+        """
+        Captures the panel (or the band below from_y) once and detects all arrows,
+        headers, upload buttons and texture items in that single frame.
+        """
+        vision = self.manager.vision
+        self.region, self.header_column = self._compute_regions()
+        
+        if not self.region or self.region[3] <= 0:
+            self.invalidate()
+            return False
+        left, top, width, height = self.region
+        bottom = top + height
+        band_top = top
+        
+        if from_y is not None and self.is_scanned:
+            band_top = max(top, int(from_y) - self.RESCAN_MARGIN)
+        
+        if band_top >= bottom:
+            self.dirty_from_y = None
+            return True
+        band = (left, band_top, width, bottom - band_top)
+        logger.debug("  - Panel model: scanning band %s.", band)
+        frame = vision.screenshot(region=band)
+        
+        if frame is None:
+            self.invalidate()
+            return False
+        self.arrows = [a for a in self.arrows if a['point'].y < band_top]
+        self.upload_buttons = [p for p in self.upload_buttons if p.y < band_top]
+        self.texture_items = [p for p in self.texture_items if p.y < band_top]
+        self.text_boxes = [b for b in self.text_boxes if b['bbox'][1] < band_top]
+        
+        for header in self.unread_headers:
+            header['cutoff_y'] = min(header['cutoff_y'], band_top)
+        header_left, _, header_width, _ = self.header_column
+        
+        for template_name, is_expanded in (('group_expanded.png', True), ('group_collapsed.png', False)):
+            for point in vision.find_all_images(template_name, region=band, confidence=0.8, haystack_image=frame):
+                if header_left <= point.x < header_left + header_width:
+                    self.arrows.append({'point': point, 'expanded': is_expanded})
+        self.arrows.sort(key=lambda a: a['point'].y)
+        self.upload_buttons.extend(vision.find_all_images('group_upload_button.png', region=band, confidence=0.8, haystack_image=frame))
+        self.upload_buttons.sort(key=lambda p: p.y)
+        
+        for template_name in ('texture_item.png', 'texture_item_selected.png'):
+            self.texture_items.extend(vision.find_all_images(template_name, region=band, confidence=0.99, haystack_image=frame))
+        self.texture_items.sort(key=lambda p: p.y)
+        crop_left = max(0, header_left - left)
+        crop_right = min(width, header_left - left + header_width)
+        
+        if crop_right > crop_left:
+            header_frame = frame.crop((crop_left, 0, crop_right, frame.size[1]))
+            header_band = (left + crop_left, band_top, crop_right - crop_left, bottom - band_top)
+            self.unread_headers.append({'frame': header_frame, 'band': header_band, 'cutoff_y': bottom})
+        self.is_scanned = True
+        self.dirty_from_y = None
+        logger.debug("  - Panel model: %s groups, %s upload buttons, %s texture items.", len(self.arrows), len(self.upload_buttons), len(self.texture_items))
+        return True
+    
+    def _read_headers(self):
+        """
+        OCRs the header column of the bands scanned since the last read. Text that has
+        since scrolled out of the panel or been invalidated is dropped.
+        """
+        top = self.region[1]
+        
+        for header in self.unread_headers:
+            boxes = self.manager.vision.read_text_boxes(header['band'], haystack_image=header['frame'])
+            self.text_boxes.extend(box for box in boxes if top <= box['bbox'][1] < header['cutoff_y'])
+        self.unread_headers = []
+    
+    def _header_for_arrow(self, arrow_point):
+        """
+        Collects the OCR text boxes on the same row as an arrow and to its left.
+        Returns (text, bbox) or (None, None).
+        """
+        row_boxes = [
+            box for box in self.text_boxes
+            if abs((box['bbox'][1] + box['bbox'][3] / 2) - arrow_point.y) <= self.HEADER_ROW_TOLERANCE
+            and box['bbox'][0] + box['bbox'][2] <= arrow_point.x + 5
+        ]
+        
+        if not row_boxes:
+            return None, None
+        row_boxes.sort(key=lambda b: b['bbox'][0])
+        text = " ".join(b['text'] for b in row_boxes)
+        left = min(b['bbox'][0] for b in row_boxes)
+        top = min(b['bbox'][1] for b in row_boxes)
+        right = max(b['bbox'][0] + b['bbox'][2] for b in row_boxes)
+        bottom = max(b['bbox'][1] + b['bbox'][3] for b in row_boxes)
+        return text, (left, top, right - left, bottom - top)
+    
+    def get_groups(self, read_headers=True):
+        """
+        Returns the visible groups in panel order, each with its header text and bbox,
+        arrow point and state, upload button and the vertical extent it occupies.
+        Without read_headers, the header text and bbox are left as None and no OCR runs.
+        """
+        
+        if not self.ensure_fresh():
+            return []
+        
+        if read_headers:
+            self._read_headers()
+        panel_bottom = self.region[1] + self.region[3]
+        groups = []
+        
+        for i, arrow in enumerate(self.arrows):
+            point = arrow['point']
+            next_y = self.arrows[i + 1]['point'].y if i + 1 < len(self.arrows) else None
+            extent_bottom = next_y if next_y is not None else panel_bottom
+            text, header_bbox = self._header_for_arrow(point) if read_headers else (None, None)
+            upload_button = next((p for p in self.upload_buttons if point.y < p.y < extent_bottom), None)
+            groups.append({
+                'text': text,
+                'header_bbox': header_bbox,
+                'arrow': point,
+                'expanded': arrow['expanded'],
+                'upload_button': upload_button,
+                'top': point.y,
+                'bottom': extent_bottom,
+                'is_complete': upload_button is not None or next_y is not None,
+            })
+        return groups
+    
+    def find_group(self, search_names):
+        """
+        Finds the visible group whose header text best matches one of the search names.
+        Confident matches are ranked by the same heuristics as the OCR searches; ambiguous
+        ones are left to those searches.
+        """
+        matches = []
+        
+        for group in self.get_groups():
+            if not group['text'] or not group['header_bbox']:
+                continue
+            
+            for name in search_names:
+                score, _ = score_text_match(name, group['text'])
+                
+                if score is not None and score >= self.MIN_CONFIDENT_SCORE:
+                    matches.append({
+                        'text': group['text'], 'bbox': group['header_bbox'], 'score': score,
+                        'has_arrow': True, 'group': group
+                    })
+        best_match = self.manager._select_best_group_match(matches)
+        
+        if not best_match:
+            return None
+        self.manager.vision.log(f"  - Panel model matched header '{best_match['text']}' (score: {best_match['score']:.2f}).")
+        return best_match['group']
+    
+    def find_group_at(self, header_bbox):
+        """
+        Returns the group whose arrow sits on the row of a header bbox, if any.
+        """
+        row_y = header_bbox[1] + header_bbox[3] / 2
+        
+        for group in self.get_groups(read_headers=False):
+            if abs(group['arrow'].y - row_y) <= self.HEADER_ROW_TOLERANCE and group['arrow'].x > header_bbox[0]:
+                return group
+        return None
+    
+    def get_textures(self, header_bbox):
+        """
+        Returns the texture item points of the expanded group at a header bbox, bounded by
+        its upload button or the next group. Returns None if the model cannot answer.
+        """
+        group = self.find_group_at(header_bbox)
+        
+        if not group or not group['expanded'] or not group['is_complete']:
+            return None
+        bottom = group['upload_button'].y - 20 if group['upload_button'] else group['bottom']
+        top = header_bbox[1] + header_bbox[3]
+        left = header_bbox[0]
+        return [
+            p for p in self.texture_items
+            if top <= p.y < bottom and left <= p.x < left + self.TEXTURE_COLUMN_WIDTH
+        ]
+    
+    def get_upload_button(self, header_bbox):
+        """
+        Returns the upload button of the group at a header bbox, if the model knows it.
+        """
+        group = self.find_group_at(header_bbox)
+        return group['upload_button'] if group else None
@@ -0,0 +1,209 @@
+DEFAULT_OPERATION_COSTS = {
+    'scan': 2.0,
+    'remove': 4.0,
+    'upload': 5.0,
+    'settings': 3.0,
+}
+
+
+def _target_order(slots_data, group_name, old_order):
+    """
+    The per-group order a Full Apply would produce: the group's slots in slot order.
+    Ignored slots that were never part of the group cannot be placed by the automation
+    and are left out.
+    """
+    order = []
+    
+    for s in sorted(slots_data, key=lambda x: x['slot_id']):
+        if s.get('group') != group_name or s['mode'] not in ['Managed', 'Ignored']:
+            continue
+        
+        if s['mode'] == 'Ignored' and s['slot_id'] not in old_order:
+            continue
+        order.append(s['slot_id'])
+    return order
+
+
+def _is_subsequence(items, sequence):
+    iterator = iter(sequence)
+    return all(item in iterator for item in items)
+
+
+def _plan_cost(num_removals, num_uploads, costs):
+    scan_cost = costs['scan'] if num_removals else 0.0
+    return scan_cost + num_removals * costs['remove'] + num_uploads * (costs['upload'] + costs['settings'])
+
+
+def plan_group(group_name, old_order, slots_data, costs):
+    """
+    Computes the cheapest sequence of removals and uploads that turns a group's current
+    texture order into its target order. Uploads always append to the end of a group, so
+    an order-preserving plan keeps a prefix of the target order and removes and uploads
+    every texture after it. The legacy plan (remove changed textures, append them again)
+    is always a candidate too; the cheapest plan wins, and an order-preserving plan only
+    wins ties. Groups without any updated, new or moved-out texture are left untouched.
+    
+    Updating the first of three textures removes and re-uploads only that texture:
+    
+    >>> slots = [{'slot_id': i, 'group': 'G', 'mode': 'Managed', 'image_path': f'{i}.png', 'is_updated': i == 0} for i in range(3)]
+    >>> plan = plan_group('G', [0, 1, 2], slots, DEFAULT_OPERATION_COSTS)
+    >>> plan['remove'], plan['upload'], plan['cost'], plan['order_exact']
+    ([0], [0], 14.0, False)
+    
+    Updating the middle one does the same:
+    
+    >>> slots[0]['is_updated'], slots[1]['is_updated'] = False, True
+    >>> plan = plan_group('G', [0, 1, 2], slots, DEFAULT_OPERATION_COSTS)
+    >>> plan['remove'], plan['upload'], plan['cost']
+    ([1], [1], 14.0)
+    """
+    slots_by_id = {s['slot_id']: s for s in slots_data}
+    target = _target_order(slots_data, group_name, old_order)
+    
+    def must_upload(slot_id):
+        slot = slots_by_id.get(slot_id)
+        return slot is not None and slot['mode'] == 'Managed' and slot.get('is_updated', False)
+    
+    def can_upload(slot_id):
+        slot = slots_by_id.get(slot_id)
+        return slot is not None and slot['mode'] == 'Managed' and bool(slot.get('image_path'))
+    
+    needs_changes = (
+        any(slot_id not in target or must_upload(slot_id) for slot_id in old_order) or
+        any(slot_id not in old_order for slot_id in target)
+    )
+    
+    if not needs_changes:
+        return {
+            'group': group_name, 'old_order': list(old_order), 'target': target,
+            'keep': list(old_order), 'remove': [], 'upload': [], 'cost': 0.0,
+            'order_exact': list(old_order) == target,
+        }
+    removals = [slot_id for slot_id in old_order if slot_id not in target or must_upload(slot_id)]
+    kept = [slot_id for slot_id in old_order if slot_id not in removals]
+    uploads = [slot_id for slot_id in target if slot_id not in kept and can_upload(slot_id)]
+    candidates = [{
+        'keep': kept, 'remove': removals, 'upload': uploads,
+        'cost': _plan_cost(len(removals), len(uploads), costs),
+        'order_exact': kept + uploads == target,
+    }]
+    
+    for k in range(len(target), -1, -1):
+        kept = target[:k]
+        uploads = target[k:]
+        
+        if any(must_upload(slot_id) for slot_id in kept) or not _is_subsequence(kept, old_order):
+            continue
+        
+        if not all(can_upload(slot_id) for slot_id in uploads):
+            continue
+        removals = [slot_id for slot_id in old_order if slot_id not in kept]
+        candidates.append({
+            'keep': kept, 'remove': removals, 'upload': uploads,
+            'cost': _plan_cost(len(removals), len(uploads), costs), 'order_exact': True,
+        })
+    best = min(candidates, key=lambda plan: (plan['cost'], not plan['order_exact']))
+    best['group'] = group_name
+    best['old_order'] = list(old_order)
+    best['target'] = target
+    return best
+
+
+def plan_fast_apply(old_texture_map, slots_data, costs=None):
+    """
+    Builds an explicit Fast Apply plan from the previous texture map and the current slots.
+    Returns a dict with the per-group plans, the slot ids to remove per group, the slot ids
+    to upload in execution order and the estimated total cost in seconds.
+    """
+    costs = dict(DEFAULT_OPERATION_COSTS, **(costs or {}))
+    group_names = set(old_texture_map.keys())
+    group_names.update(s['group'] for s in slots_data if s.get('group') and s['mode'] == 'Managed')
+    group_plans = {}
+    
+    for group_name in sorted(group_names):
+        group_plan = plan_group(group_name, old_texture_map.get(group_name, []), slots_data, costs)
+        
+        if group_plan['remove'] or group_plan['upload']:
+            group_plans[group_name] = group_plan
+    uploads = []
+    
+    for s in sorted(slots_data, key=lambda x: x['slot_id']):
+        group_plan = group_plans.get(s.get('group'))
+        
+        if group_plan and s['slot_id'] in group_plan['upload']:
+            uploads.append(s['slot_id'])
+    return {
+        'groups': group_plans,
+        'removals': {name: p['remove'] for name, p in group_plans.items() if p['remove']},
+        'uploads': uploads,
+        'cost': sum(p['cost'] for p in group_plans.values()),
+    }
+
+
+def describe_plan(plan):
+    """
+    Returns human-readable log lines describing a plan.
+    """
+    lines = []
+    
+    if not plan['groups']:
+        lines.append("  - Plan is empty: nothing to remove or upload.")
+        return lines
+    
+    for group_name, group_plan in plan['groups'].items():
+        keep = [slot_id + 1 for slot_id in group_plan['keep']]
+        remove = [slot_id + 1 for slot_id in group_plan['remove']]
+        upload = [slot_id + 1 for slot_id in group_plan['upload']]
+        order_note = "" if group_plan['order_exact'] else " (slot order cannot be preserved)"
+        lines.append(
+            f"  - Group '{group_name}': keep slots {keep or 'none'}, remove {remove or 'none'}, "
+            f"upload {upload or 'none'} (est. {group_plan['cost']:.1f}s){order_note}"
+        )
+    lines.append(f"  - Estimated total: {plan['cost']:.1f}s")
+    return lines
+
+
+def plan_full_apply(old_texture_map, slots_data, costs=None):
+    """
+    Estimates the operations of a Full Apply without scanning the screen. Every group with
+    slots is scanned, every texture not kept by an Ignored slot is removed and every
+    Managed slot is uploaded. Groups without a known previous map are assumed to hold one
+    texture per Managed slot.
+    """
+    costs = dict(DEFAULT_OPERATION_COSTS, **(costs or {}))
+    slots_by_group = {}
+    
+    for s in sorted(slots_data, key=lambda x: x['slot_id']):
+        if s.get('group'):
+            if s['group'] not in slots_by_group:
+                slots_by_group[s['group']] = []
+            slots_by_group[s['group']].append(s)
+    group_plans = {}
+    
+    for group_name, group_slots in sorted(slots_by_group.items()):
+        ignored = [s['slot_id'] for s in group_slots if s['mode'] == 'Ignored']
+        managed = [s['slot_id'] for s in group_slots if s['mode'] == 'Managed']
+        
+        if group_name in old_texture_map:
+            removals = [slot_id for slot_id in old_texture_map[group_name] if slot_id not in ignored]
+        else:
+            removals = list(managed)
+        group_plans[group_name] = {
+            'group': group_name, 'old_order': list(old_texture_map.get(group_name, [])),
+            'target': ignored + managed, 'keep': ignored, 'remove': removals, 'upload': managed,
+            'cost': costs['scan'] + len(removals) * costs['remove'] + len(managed) * (costs['upload'] + costs['settings']),
+            'order_exact': True,
+        }
+    return {
+        'groups': group_plans,
+        'removals': {name: p['remove'] for name, p in group_plans.items() if p['remove']},
+        'uploads': [slot_id for p in group_plans.values() for slot_id in p['upload']],
+        'cost': sum(p['cost'] for p in group_plans.values()),
+    }
+
+
+def count_operations(plan):
+    """
+    Returns (number of removals, number of uploads) in a plan.
+    """
+    return sum(len(r) for r in plan['removals'].values()), len(plan['uploads'])
@@ -0,0 +1,130 @@
+import os
+import cProfile
+import pstats
+import threading
+
+
+class RunProfiler:
+    """
+    Profiles automation runs with cProfile when enabled. The run itself is profiled on
+    the automation worker; the Tk main thread can be profiled alongside it. Each profile
+    is saved as a .prof file (readable with pstats or snakeviz) and its top cumulative
+    hotspots are summarized on the console.
+    """
+    MAX_PROFILE_FILES = 40
+    HOTSPOT_COUNT = 15
+    
+    def __init__(self, profile_dir='profiles', log_callback=print):
+        self.profile_dir = profile_dir
+        self.log = log_callback
+        self.enabled = False
+        self.profile_main_thread = False
+        self.lock = threading.Lock()
+        self.run_profile = None
+        self.main_thread_profile = None
+        self.last_run_name = None
+    
+    def start_run(self):
+        """
+        Starts profiling the calling thread for a run, if profiling is enabled.
+        """
+        
+        if not self.enabled:
+            return False
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            self.log(f"Warning: Could not start the run profiler: {e}")
+            return False
+        self.run_profile = profile
+        return True
+    
+    def finish_run(self, run_name):
+        """
+        Stops the run profile, saves it as <run_name>.prof and logs its hotspots.
+        Returns the file path, or None if the run was not profiled.
+        """
+        profile = self.run_profile
+        
+        if profile is None:
+            return None
+        profile.disable()
+        self.run_profile = None
+        self.last_run_name = run_name
+        return self._save(profile, run_name, "Run profile")
+    
+    def start_main_thread(self):
+        """
+        Starts profiling the Tk main thread. Must be called from that thread.
+        """
+        
+        if not (self.enabled and self.profile_main_thread) or self.main_thread_profile is not None:
+            return False
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            self.log(f"Warning: Could not profile the UI thread: {e}")
+            return False
+        self.main_thread_profile = profile
+        return True
+    
+    def finish_main_thread(self):
+        """
+        Stops the Tk main thread profile and saves it next to the last run's profile as
+        <run_name>_ui.prof. Must be called from the Tk main thread.
+        """
+        profile = self.main_thread_profile
+        
+        if profile is None:
+            return None
+        profile.disable()
+        self.main_thread_profile = None
+        return self._save(profile, f"{self.last_run_name or 'run'}_ui", "UI thread profile")
+    
+    def _save(self, profile, name, title):
+        path = os.path.join(self.profile_dir, f"{name}.prof")
+        
+        with self.lock:
+            try:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                profile.dump_stats(path)
+            except (IOError, OSError) as e:
+                self.log(f"Error: Could not save profile to {path}. Error: {e}")
+                return None
+            self._prune()
+        
+        for line in self.format_hotspots(profile, title):
+            self.log(line)
+        self.log(f"{title} saved to {path}")
+        return path
+    
+    def format_hotspots(self, profile, title="Profile"):
+        """
+        Returns console lines listing the functions with the highest cumulative time.
+        """
+        stats = pstats.Stats(profile).stats
+        total_seconds = max((entry[3] for entry in stats.values()), default=0.0)
+        hotspots = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:self.HOTSPOT_COUNT]
+        lines = [f"{title}: top {len(hotspots)} cumulative hotspots ({total_seconds:.2f}s profiled):"]
+        
+        for (filename, line_number, function_name), (_, call_count, own_seconds, cumulative_seconds, _) in hotspots:
+            location = f"{os.path.basename(filename)}:{line_number}" if line_number else filename
+            lines.append(
+                f"  - {cumulative_seconds:7.3f}s cum, {own_seconds:7.3f}s self, {call_count:6d} calls  "
+                f"{function_name} ({location})"
+            )
+        return lines
+    
+    def _prune(self):
+        try:
+            profiles = sorted(
+                (os.path.join(self.profile_dir, name) for name in os.listdir(self.profile_dir) if name.endswith('.prof')),
+                key=os.path.getmtime
+            )
+            
+            for old_path in profiles[:-self.MAX_PROFILE_FILES]:
+                os.remove(old_path)
+        except OSError:
+            pass
@@ -0,0 +1,73 @@
+import cv2
+import numpy as np
+
+
+def _prepare_frame(image):
+    """
+    Converts a PIL Image or NumPy array into a single-channel float32 array
+    suitable for phase correlation.
+    """
+    frame = np.asarray(image)
+    
+    if frame.ndim == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    return frame.astype(np.float32)
+
+
+def estimate_shift(before_image, after_image):
+    """
+    Estimates the translation of the content between two captures of the same region
+    using phase correlation. Returns ((dx, dy), response), where a negative dy means the
+    content moved up between the captures.
+    """
+    before = _prepare_frame(before_image)
+    after = _prepare_frame(after_image)
+    
+    if before.shape != after.shape or before.shape[0] < 8 or before.shape[1] < 8:
+        return None, 0.0
+    window = cv2.createHanningWindow((before.shape[1], before.shape[0]), cv2.CV_32F)
+    (dx, dy), response = cv2.phaseCorrelate(before, after, window)
+    return (dx, dy), response
+
+
+def estimate_vertical_shift(before_image, after_image, min_response=0.1, max_horizontal_drift=2.0):
+    """
+    Estimates the vertical scroll offset between two captures of a panel column.
+    Returns the offset in whole pixels, or None if the frames are not reliably related
+    (low correlation response or an unexpected horizontal movement).
+    """
+    shift, response = estimate_shift(before_image, after_image)
+    
+    if shift is None or response < min_response:
+        return None
+    dx, dy = shift
+    
+    if abs(dx) > max_horizontal_drift:
+        return None
+    return int(round(dy))
+
+
+def shift_region(region, dy):
+    """
+    Translates a (left, top, width, height) region vertically.
+    """
+    left, top, width, height = region
+    return (int(left), int(top + dy), int(width), int(height))
+
+
+def region_overlaps_column(region, column_region):
+    """
+    Checks whether a region horizontally overlaps a column region.
+    """
+    left, _, width, _ = region
+    col_left, _, col_width, _ = column_region
+    return left < col_left + col_width and col_left < left + width
+
+
+def region_within_rows(region, column_region):
+    """
+    Checks whether a region lies vertically within a column region.
+    """
+    _, top, _, height = region
+    _, col_top, _, col_height = column_region
+    return top >= col_top and top + height <= col_top + col_height
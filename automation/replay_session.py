@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import sys
+from pyscreeze import Box
+from automation.session import Session
+from automation.backends import ReplayCaptureBackend, ReplayInputBackend, ReplayQueryChecker
+from automation.workflows import WorkflowManager
+
+
+def replay_session(session_path, assets_path, log_callback=print):
+    """
+    Runs the job recorded in a session file against its recorded frames, without a
+    screen, mouse or keyboard. Returns a report comparing the replay with the recording.
+    """
+    session = Session(session_path)
+    header = session.header
+    capture_backend = ReplayCaptureBackend(session, log_callback)
+    input_backend = ReplayInputBackend(session, log_callback)
+    manager = WorkflowManager(assets_path, capture_backend=capture_backend, input_backend=input_backend)
+    query_checker = ReplayQueryChecker(session, log_callback)
+    manager.vision.session_recorder = query_checker
+    manager.set_language(header.get('language', 'en'))
+    manager.set_log_callbacks(log_callback)
+    manager.vision.initialize_dependencies()
+    
+    if header.get('anchor_box'):
+        manager.anchor_box = Box(*header['anchor_box'])
+    
+    if header.get('app_region'):
+        manager.vision.app_region = tuple(header['app_region'])
+        manager.controller.action_region = manager.vision.app_region
+    try:
+        status, texture_map = manager.run(
+            header['slots_data'], header['texture_map'], header['is_full_run'], log_callback,
+            verify_texture_map=header.get('verify_texture_map', False)
+        )
+    finally:
+        session.close()
+    recorded_status, recorded_map = session.result if session.result else (None, None)
+    return {
+        'session': session_path,
+        'status': status,
+        'recorded_status': recorded_status,
+        'texture_map_matches': json.loads(json.dumps(texture_map)) == recorded_map,
+        'actions_replayed': input_backend.cursor,
+        'actions_recorded': len(input_backend.actions),
+        'action_divergences': input_backend.divergences,
+        'queries_checked': query_checker.checked,
+        'query_mismatches': query_checker.mismatches,
+        'frames_cropped': capture_backend.crops,
+        'frames_missing': capture_backend.misses,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded automation session headless.")
+    parser.add_argument('session', help="Path to a session .zip recorded with RECORD_SESSIONS enabled.")
+    parser.add_argument('--assets', default=os.path.join('assets', 'templates'), help="Template assets folder.")
+    parser.add_argument('--report', help="Write the replay report to this JSON file.")
+    args = parser.parse_args(argv)
+    report = replay_session(args.session, args.assets)
+    print(f"Replay finished with status {report['status']} (recorded: {report['recorded_status']}).")
+    print(f"  - Texture map matches recording: {report['texture_map_matches']}")
+    print(f"  - Actions: {report['actions_replayed']}/{report['actions_recorded']}, {len(report['action_divergences'])} divergence(s)")
+    print(f"  - Queries: {report['queries_checked']} checked, {len(report['query_mismatches'])} mismatch(es)")
+    print(f"  - Frames: {report['frames_cropped']} cropped, {report['frames_missing']} missing")
+    
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=4)
+    is_faithful = not report['action_divergences'] and not report['query_mismatches'] and report['texture_map_matches']
+    return 0 if is_faithful else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
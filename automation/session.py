@@ -0,0 +1,235 @@
+import functools
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+import numpy as np
+from PIL import Image
+from utils.image_digest import compute_pixel_digest
+SESSION_FORMAT_VERSION = 1
+SESSION_INDEX_NAME = 'session.json'
+FRAME_DIR_NAME = 'frames'
+MAX_SESSION_FILES = 20
+
+
+def to_jsonable(value):
+    """
+    Converts query arguments and results (points, boxes, images, arrays) into values
+    that can be stored in a session file.
+    """
+    
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    
+    if isinstance(value, (np.integer, np.floating)):
+        return value.item()
+    
+    if isinstance(value, Image.Image):
+        return f"<image {value.size[0]}x{value.size[1]}>"
+    
+    if isinstance(value, np.ndarray):
+        return f"<array {'x'.join(str(d) for d in value.shape)}>"
+    
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    return repr(value)
+
+
+class SessionRecorder:
+    """
+    Records a run to a compact session file: every captured frame (stored once per
+    distinct pixel content), every Vision query with its result and every input action,
+    in the order they happened. The file is a zip holding a JSON index and the frames
+    as PNGs, and can be replayed offline with the replay backends.
+    """
+    
+    def __init__(self, session_dir='sessions', log_callback=print):
+        self.session_dir = session_dir
+        self.log = log_callback
+        self.lock = threading.Lock()
+        self.archive = None
+        self.path = None
+        self.header = {}
+        self.events = []
+        self.frame_ids = set()
+        self.start_time = 0.0
+        self.query_depth = threading.local()
+    
+    @property
+    def is_recording(self):
+        return self.archive is not None
+    
+    def start(self, run_name, header=None):
+        """
+        Opens a new session file for a run. The header describes the job and the window
+        geometry the run started from, so a replay can reproduce it.
+        """
+        
+        if self.is_recording:
+            self.stop()
+        try:
+            os.makedirs(self.session_dir, exist_ok=True)
+            self.path = os.path.join(self.session_dir, f"{run_name}.zip")
+            self.archive = zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_STORED)
+        except (IOError, OSError) as e:
+            self.log(f"Error: Could not create session file in {self.session_dir}. Error: {e}")
+            self.archive = None
+            return False
+        self.header = to_jsonable(dict(header or {}, version=SESSION_FORMAT_VERSION, run=run_name))
+        self.events = []
+        self.frame_ids = set()
+        self.start_time = time.perf_counter()
+        self.log(f"Recording session to {self.path}")
+        return True
+    
+    def _append(self, event):
+        event['t'] = round(time.perf_counter() - self.start_time, 4)
+        self.events.append(event)
+    
+    def record_frame(self, region, image):
+        """
+        Records a captured frame. Identical frames are stored once and referenced by id.
+        """
+        
+        if not self.is_recording or image is None:
+            return
+        frame_id = compute_pixel_digest(image)
+        
+        with self.lock:
+            if not self.is_recording:
+                return
+            
+            if frame_id not in self.frame_ids:
+                buffer = io.BytesIO()
+                image.save(buffer, format='PNG', compress_level=1)
+                self.archive.writestr(f"{FRAME_DIR_NAME}/{frame_id}.png", buffer.getvalue())
+                self.frame_ids.add(frame_id)
+            self._append({'type': 'frame', 'region': to_jsonable(region), 'frame': frame_id})
+    
+    def record_query(self, name, args, kwargs, result):
+        """
+        Records a Vision query with its arguments and result.
+        """
+        
+        if not self.is_recording:
+            return
+        
+        with self.lock:
+            self._append({
+                'type': 'query', 'name': name, 'args': to_jsonable(args),
+                'kwargs': to_jsonable(kwargs), 'result': to_jsonable(result),
+            })
+    
+    def record_action(self, name, *args):
+        """
+        Records an input action with its arguments.
+        """
+        
+        if not self.is_recording:
+            return
+        
+        with self.lock:
+            self._append({'type': 'action', 'name': name, 'args': to_jsonable(args)})
+    
+    def stop(self, result=None):
+        """
+        Writes the index and closes the session file. Returns its path, or None if no
+        session was being recorded.
+        """
+        
+        with self.lock:
+            if not self.is_recording:
+                return None
+            index = {'header': self.header, 'result': to_jsonable(result), 'events': self.events}
+            path = self.path
+            try:
+                self.archive.writestr(SESSION_INDEX_NAME, json.dumps(index))
+                self.archive.close()
+            except (IOError, OSError) as e:
+                self.log(f"Error: Could not write session file {path}. Error: {e}")
+                path = None
+            self.archive = None
+            frame_count = len(self.frame_ids)
+            event_count = len(self.events)
+        
+        if path:
+            self.log(f"Session saved to {path} ({event_count} events, {frame_count} distinct frames)")
+            self._prune()
+        return path
+    
+    def _prune(self):
+        """
+        Deletes the oldest session files beyond MAX_SESSION_FILES.
+        """
+        try:
+            files = sorted(
+                (os.path.join(self.session_dir, f) for f in os.listdir(self.session_dir) if f.endswith('.zip')),
+                key=os.path.getmtime
+            )
+            
+            for path in files[:-MAX_SESSION_FILES]:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+class Session:
+    """
+    A recorded session loaded from disk. Frames are decoded on first use.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.archive = zipfile.ZipFile(path, 'r')
+        index = json.loads(self.archive.read(SESSION_INDEX_NAME))
+        self.header = index.get('header', {})
+        self.result = index.get('result')
+        self.events = index.get('events', [])
+        self.frame_cache = {}
+    
+    def events_of_type(self, event_type):
+        return [e for e in self.events if e['type'] == event_type]
+    
+    def load_frame(self, frame_id):
+        """
+        Returns the recorded frame with the given id as an RGB PIL Image.
+        """
+        
+        if frame_id not in self.frame_cache:
+            data = self.archive.read(f"{FRAME_DIR_NAME}/{frame_id}.png")
+            self.frame_cache[frame_id] = Image.open(io.BytesIO(data)).convert('RGB')
+        return self.frame_cache[frame_id]
+    
+    def close(self):
+        self.archive.close()
+
+
+def recorded_query(func):
+    """
+    Decorates a Vision method so each call and its result are recorded on the instance's
+    session recorder, if it has one. Queries made from inside another query are not
+    recorded separately.
+    """
+    
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        recorder = getattr(self, 'session_recorder', None)
+        
+        if recorder is None or not recorder.is_recording:
+            return func(self, *args, **kwargs)
+        depth = getattr(recorder.query_depth, 'value', 0)
+        recorder.query_depth.value = depth + 1
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            recorder.query_depth.value = depth
+        
+        if depth == 0:
+            recorder.record_query(func.__name__, args, kwargs, result)
+        return result
+    return wrapper
@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import sys
+import time
+from automation.automation_config import AutomationSettings
+from automation.backends import CreatorSimulator, SimulatorCaptureBackend, SimulatorInputBackend
+from automation.workflows import WorkflowManager
+DEFAULT_SCENARIO = {
+    'groups': [
+        {'name': 'Hair', 'expanded': False, 'textures': ['previous/hair_a.png', 'previous/hair_b.png']},
+        {'name': 'Body', 'expanded': True, 'textures': ['previous/body.png']},
+        {'name': 'Accessories', 'expanded': False, 'textures': []},
+    ],
+    'slots': [
+        {'group': 'Hair', 'image_path': 'textures/hair.png', 'values': {'size': 0.75, 'angle': 15.0}},
+        {'group': 'Body', 'image_path': 'textures/body.png', 'values': {'opacity': 0.6, 'h_repeat': True}},
+        {'group': 'Accessories', 'image_path': 'textures/hat.png', 'values': {'x_position': 0.25, 'y_position': 0.8, 'h_flip': True}},
+    ],
+}
+
+
+def build_slots_data(scenario):
+    """
+    Expands the scenario's slots into the slot dicts the automation receives from the UI.
+    """
+    slots_data = []
+    
+    for slot_id, slot in enumerate(scenario['slots']):
+        values = dict(AutomationSettings.DEFAULT_TEXTURE_VALUES, h_flip=False, v_flip=False)
+        values.update(slot.get('values', {}))
+        slots_data.append({
+            'slot_id': slot_id,
+            'mode': slot.get('mode', 'Managed'),
+            'group': slot['group'],
+            'image_path': slot.get('image_path', ''),
+            'values': values,
+            'is_updated': True,
+        })
+    return slots_data
+
+
+def check_panel_state(simulator, slots_data):
+    """
+    Compares the simulated panel after a Full Apply with the slots. Returns a list of
+    problems; an empty list means every Managed slot was uploaded once with its settings.
+    """
+    problems = []
+    panel = simulator.snapshot()
+    
+    for slot in slots_data:
+        if slot['mode'] != 'Managed':
+            continue
+        textures = panel.get(slot['group'], [])
+        uploads = [t for t in textures if t['path'] == os.path.realpath(slot['image_path'])]
+        
+        if len(uploads) != 1:
+            problems.append(f"Slot {slot['slot_id'] + 1}: expected one upload in '{slot['group']}', found {len(uploads)}.")
+            continue
+        
+        for key, expected in slot['values'].items():
+            actual = uploads[0]['values'].get(key)
+            
+            if isinstance(expected, bool) or actual is None:
+                is_match = bool(actual) == bool(expected)
+            else:
+                is_match = abs(actual - round(expected, 3)) < 1e-6
+            
+            if not is_match:
+                problems.append(f"Slot {slot['slot_id'] + 1}: '{key}' is {actual}, expected {expected}.")
+    
+    for group_name in {s['group'] for s in slots_data}:
+        expected_count = sum(1 for s in slots_data if s['group'] == group_name and s['mode'] in ['Managed', 'Ignored'])
+        
+        if len(panel.get(group_name, [])) != expected_count:
+            problems.append(f"Group '{group_name}' holds {len(panel.get(group_name, []))} textures, expected {expected_count}.")
+    return problems
+
+
+def run_simulation(scenario, assets_path, runs=1, ui_latency=0.0, log_callback=print):
+    """
+    Runs Full Applies of a scenario against a simulated Creator panel, headless, and
+    returns their status, duration and the problems found in the resulting panel.
+    """
+    simulator = CreatorSimulator(assets_path, groups=scenario['groups'], ui_latency=ui_latency)
+    manager = WorkflowManager(
+        assets_path, capture_backend=SimulatorCaptureBackend(simulator), input_backend=SimulatorInputBackend(simulator)
+    )
+    manager.set_log_callbacks(log_callback)
+    manager.vision.initialize_dependencies()
+    
+    if not manager.find_app_window_and_set_region():
+        raise RuntimeError("The simulated app anchor was not found.")
+    texture_map = {}
+    results = []
+    
+    for run_index in range(runs):
+        slots_data = build_slots_data(scenario)
+        start_time = time.perf_counter()
+        status, texture_map = manager.run(slots_data, texture_map, True, log_callback)
+        duration = time.perf_counter() - start_time
+        problems = check_panel_state(simulator, slots_data)
+        results.append({'run': run_index + 1, 'status': status, 'seconds': round(duration, 3), 'problems': problems})
+    return {'runs': results, 'texture_map': texture_map, 'panel': simulator.snapshot()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Full Applies headless against a simulated Creator panel.")
+    parser.add_argument('--scenario', help="JSON file with 'groups' and 'slots' (defaults to a built-in scenario).")
+    parser.add_argument('--assets', default=os.path.join('assets', 'templates'), help="Template assets folder.")
+    parser.add_argument('--runs', type=int, default=1, help="Number of consecutive Full Applies.")
+    parser.add_argument('--ui-latency', type=float, default=0.0, help="Seconds before menus and dialogs appear.")
+    parser.add_argument('--report', help="Write the results to this JSON file.")
+    parser.add_argument('--verbose', action='store_true', help="Print the automation log.")
+    args = parser.parse_args(argv)
+    scenario = DEFAULT_SCENARIO
+    
+    if args.scenario:
+        with open(args.scenario, 'r') as f:
+            scenario = json.load(f)
+    log_callback = print if args.verbose else (lambda message: None)
+    report = run_simulation(scenario, args.assets, runs=args.runs, ui_latency=args.ui_latency, log_callback=log_callback)
+    
+    for result in report['runs']:
+        print(f"Run {result['run']}: status {result['status']} in {result['seconds']:.2f}s, {len(result['problems'])} problem(s)")
+        
+        for problem in result['problems']:
+            print(f"  - {problem}")
+    
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=4)
+    is_success = all(r['status'] is True and not r['problems'] for r in report['runs'])
+    return 0 if is_success else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+import time
+import threading
+from .tracing import traced
+
+
+class Sleeper:
+    """
+    Interruptible sleeps shared by the WorkflowManager and the Controller.
+    A sleep is a wait on the stop event, so it lasts exactly as long as requested and
+    ends at once when a stop is requested. Time slept is accounted per phase.
+    """
+    def __init__(self, stop_event=None):
+        self.stop_event = stop_event or threading.Event()
+        self.phase = 'idle'
+        self.slept_by_phase = {}
+        self.lock = threading.Lock()
+        self.tracer = None
+    
+    def reset(self):
+        """
+        Clears the accounting at the start of a run.
+        """
+        
+        with self.lock:
+            self.phase = 'idle'
+            self.slept_by_phase = {}
+    
+    def set_phase(self, phase):
+        """
+        Sets the phase that following sleeps are accounted to.
+        """
+        self.phase = phase
+    
+    @traced('sleep')
+    def sleep(self, duration):
+        """
+        Waits for the duration or until the stop event is set.
+        Returns True if the sleep was interrupted by a stop.
+        """
+        
+        if duration <= 0:
+            return self.stop_event.is_set()
+        start_time = time.monotonic()
+        stopped = self.stop_event.wait(duration)
+        slept = time.monotonic() - start_time
+        
+        with self.lock:
+            self.slept_by_phase[self.phase] = self.slept_by_phase.get(self.phase, 0.0) + slept
+        return stopped
+    
+    def get_summary(self):
+        """
+        Returns {phase: seconds slept} for the current run.
+        """
+        
+        with self.lock:
+            return dict(self.slept_by_phase)
@@ -0,0 +1,45 @@
+from automation.operation_history import OperationHistory
+AUTO_SETTING_SOURCES = {
+    'MENU_TIMEOUT': ('menu_open', 'timeout'),
+    'DIALOG_TIMEOUT': ('dialog_open', 'timeout'),
+    'CHOOSE_FILE_TIMEOUT': ('choose_file_open', 'timeout'),
+    'GENERIC_ELEMENT_TIMEOUT': ('element_appear', 'timeout'),
+    'SCROLL_DELAY': ('scroll_settle', 'delay'),
+}
+
+
+class TimingProfile(OperationHistory):
+    """
+    Rolling record of the UI latencies observed on this machine (how long menus, dialogs
+    and elements took to appear, and how long the panel took to settle after a scroll).
+    Delays and timeouts for settings set to "auto" are derived from its percentiles.
+    """
+    MAX_SAMPLES = 100
+    MIN_SAMPLES = 5
+    DELAY_PERCENTILE = 95
+    DELAY_MARGIN = 1.25
+    TIMEOUT_PERCENTILE = 99
+    TIMEOUT_MARGIN = 3.0
+    MIN_TIMEOUT = 1.0
+    
+    def __init__(self, history_path='timing_profile.json', log_callback=print):
+        super().__init__(history_path=history_path, log_callback=log_callback)
+    
+    def derive(self, setting_name, default):
+        """
+        Derives a value for a setting from the observed latencies, with a safety margin.
+        Delays use the 95th percentile, timeouts a wider margin over the 99th and never
+        go below MIN_TIMEOUT. Returns the default until enough samples were seen.
+        """
+        
+        if setting_name not in AUTO_SETTING_SOURCES:
+            return default
+        operation, kind = AUTO_SETTING_SOURCES[setting_name]
+        
+        if self.count(operation) < self.MIN_SAMPLES:
+            return default
+        
+        if kind == 'delay':
+            return round(self.percentile(operation, self.DELAY_PERCENTILE) * self.DELAY_MARGIN, 3)
+        timeout = self.percentile(operation, self.TIMEOUT_PERCENTILE) * self.TIMEOUT_MARGIN
+        return round(max(self.MIN_TIMEOUT, timeout), 3)
@@ -0,0 +1,141 @@
+import os
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class Tracer:
+    """
+    Records nested timing spans (phases, groups, slots, captures, template searches, OCR,
+    sleeps and input) during a run and exports them in the Chrome trace event format,
+    which can be opened in chrome://tracing or Perfetto.
+    """
+    MAX_TRACE_FILES = 20
+    
+    def __init__(self, trace_dir='traces', log_callback=print):
+        self.trace_dir = trace_dir
+        self.log = log_callback
+        self.enabled = True
+        self.events = []
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+    
+    def reset(self):
+        """
+        Discards recorded spans and restarts the trace clock, at the start of a run.
+        """
+        
+        with self.lock:
+            self.events = []
+            self.origin = time.perf_counter()
+    
+    @contextmanager
+    def span(self, name, category, **args):
+        """
+        Records the enclosed block as a span. Spans opened inside it nest below it.
+        """
+        
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, **args)
+    
+    def record(self, name, category, start, end=None, **args):
+        """
+        Records a span between two time.perf_counter() values; end defaults to now.
+        """
+        
+        if not self.enabled:
+            return
+        end = time.perf_counter() if end is None else end
+        event = {
+            'name': str(name), 'cat': category, 'ph': 'X',
+            'ts': round((start - self.origin) * 1e6, 1),
+            'dur': round((end - start) * 1e6, 1),
+            'pid': self.pid, 'tid': threading.get_ident(),
+        }
+        
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+        
+        with self.lock:
+            self.events.append(event)
+    
+    def export(self, run_name=None):
+        """
+        Writes the recorded spans to a trace file in trace_dir and prunes old trace files.
+        Returns the file path, or None if nothing was recorded or writing failed.
+        """
+        
+        with self.lock:
+            events = list(self.events)
+        
+        if not events:
+            return None
+        run_name = run_name or datetime.now().strftime("run_%Y%m%d_%H%M%S")
+        path = os.path.join(self.trace_dir, f"{run_name}.json")
+        try:
+            os.makedirs(self.trace_dir, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        except IOError as e:
+            self.log(f"Error: Could not save trace to {path}. Error: {e}")
+            return None
+        self._prune()
+        return path
+    
+    def _prune(self):
+        prune_old_files(self.trace_dir, '.json', self.MAX_TRACE_FILES)
+
+
+def prune_old_files(directory, extension, keep):
+    """
+    Deletes all but the newest keep files with the given extension in a directory.
+    """
+    try:
+        paths = sorted(
+            (os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(extension)),
+            key=os.path.getmtime
+        )
+    except OSError:
+        return
+    
+    for old_path in paths[:-keep]:
+        try:
+            os.remove(old_path)
+        except OSError:
+            pass
+
+
+def traced(category, name=None):
+    """
+    Decorates a method so each call is recorded as a span on the instance's tracer, if it
+    has one. The first positional argument (e.g. a template name) is kept as detail.
+    """
+    
+    def decorator(func):
+        span_name = name or func.__name__
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(self, 'tracer', None)
+            
+            if tracer is None or not tracer.enabled:
+                return func(self, *args, **kwargs)
+            
+            if args and isinstance(args[0], (str, int, float, tuple)):
+                with tracer.span(span_name, category, target=str(args[0])[:80]):
+                    return func(self, *args, **kwargs)
+            
+            with tracer.span(span_name, category):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
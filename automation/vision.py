@@ -1,19 +1,24 @@
-import pyautogui
 import cv2
 from pyscreeze import Box
 import numpy as np
 import pyscreeze
 import os
-import threading
-import mss
+import time
 from PIL import Image
 from PIL import Image, ImageDraw
-import screeninfo
 from .ocr import OCR
+from .metrics import RunMetrics
+from .debug_writer import DebugImageWriter
+from .tracing import traced
+from .session import recorded_query
+from .backends import MSSCaptureBackend, Point
+from .exceptions import CaptureError
+from .log import get_logger
+logger = get_logger(__name__)
 
 
 class Vision:
-    def __init__(self, assets_path):
+    def __init__(self, assets_path, capture_backend=None):
         self.assets_path = assets_path
         self.language = 'en'
         self.app_region = None
@@ -21,30 +26,21 @@ class Vision:
         self.debug_mode = False
         self.ocr = OCR()
         self.ocr.log = self.log
-        self.thread_local = threading.local()
-    
-    @property
-    def sct(self):
-        """
-        Lazy-loads the MSS screenshot utility instance for the current thread.
-        """
-        
-        if not hasattr(self.thread_local, 'sct') or self.thread_local.sct is None:
-            self.log(f"Initializing MSS for thread {threading.get_ident()}...")
-            try:
-                self.thread_local.sct = mss.mss()
-                self.log("MSS initialized for this thread.")
-            except Exception as e:
-                self.log(f"CRITICAL: Failed to initialize MSS for this thread. Error: {e}")
-                self.thread_local.sct = None
-        return self.thread_local.sct
+        self.tracer = None
+        self.metrics = RunMetrics()
+        self.ocr.metrics = self.metrics
+        self.session_recorder = None
+        self.template_cache = {}
+        project_root = os.path.abspath(os.path.join(self.assets_path, "..", ".."))
+        self.debug_writer = DebugImageWriter(os.path.join(project_root, 'debug'))
+        self.capture_backend = capture_backend or MSSCaptureBackend(log_callback=lambda message: self.log(message))
     
     def initialize_dependencies(self):
         """
-        Initializes thread-sensitive libraries like MSS and EasyOCR.
+        Initializes thread-sensitive libraries like the capture backend and EasyOCR.
         """
         self.log("Initializing Vision dependencies for this thread...")
-        _ = self.sct
+        self.capture_backend.initialize()
         _ = self.ocr.reader
         self.log("Vision dependencies initialized.")
     
@@ -58,6 +54,21 @@ class Vision:
         if enabled:
             self.log("Debug mode enabled. Saving diagnostic images.")
     
+    def _read_template(self, template_path, flags):
+        """
+        Reads a template image once and keeps it for later searches and runs. The cached
+        array is read-only. Returns None if the file cannot be read.
+        """
+        key = (template_path, flags)
+        
+        if key not in self.template_cache:
+            image = cv2.imread(template_path, flags)
+            
+            if image is not None:
+                image.setflags(write=False)
+            self.template_cache[key] = image
+        return self.template_cache[key]
+    
     def get_localized_template_path(self, template_name):
         """
         Constructs a path to a localized template if it exists, otherwise falls back to the base template.
@@ -78,30 +89,26 @@ class Vision:
                 return localized_path
         return os.path.join(self.assets_path, template_name)
     
+    @traced('capture')
     def screenshot(self, region=None):
         """
-        Public method to take a screenshot using the configured backend (MSS).
+        Public method to take a screenshot using the configured capture backend.
         Returns a PIL Image.
         """
         
-        if not self.sct:
-            self.log("CRITICAL: Screenshot utility not initialized.")
+        if region and (region[2] <= 0 or region[3] <= 0):
+            self.log(f"  - ERROR: Invalid screenshot region with non-positive dimensions: {region}")
             return None
         try:
-            if region:
-                if region[2] <= 0 or region[3] <= 0:
-                    self.log(f"  - ERROR: Invalid screenshot region with non-positive dimensions: {region}")
-                    return None
-                monitor = {'top': int(region[1]), 'left': int(region[0]), 'width': int(region[2]), 'height': int(region[3])}
-                sct_img = self.sct.grab(monitor)
-                return Image.frombytes('RGB', sct_img.size, sct_img.bgra, 'raw', 'BGRX')
-            else:
-                sct_img = self.sct.grab(self.sct.monitors[0])
-                return Image.frombytes('RGB', sct_img.size, sct_img.bgra, 'raw', 'BGRX')
-        except mss.exception.ScreenShotError as e:
-            self.log(f"  - ERROR: MSS failed to take screenshot for region {region}. Error: {e}")
+            image = self.capture_backend.grab(region)
+        except CaptureError as e:
+            self.log(f"  - ERROR: Failed to take screenshot for region {region}. Error: {e}")
             return None
+        self.metrics.record_screenshot(*image.size)
+        return image
     
+    @recorded_query
+    @traced('find_image')
     def find_image(self, template_name, region=None, confidence=0.8):
         """
         Finds the first occurrence of a template image and returns its center point.
@@ -120,42 +127,38 @@ class Vision:
         elif self.app_region:
             search_regions.append(self.app_region)
         else:
-            self.log("  - No region specified. Searching all monitors for center.")
+            logger.debug("  - No region specified. Searching all monitors for center.")
             
-            for m in screeninfo.get_monitors():
+            for m in self.capture_backend.monitors():
                 search_regions.append((m.x, m.y, m.width, m.height))
-        debug_dir = None
-        
-        if self.debug_mode:
-            project_root = os.path.abspath(os.path.join(self.assets_path, "..", ".."))
-            debug_dir = os.path.join(project_root, 'debug')
-            os.makedirs(debug_dir, exist_ok=True)
         
         for i, current_region in enumerate(search_regions):
-            self.log(f"  - Analyzing region: {current_region}")
+            logger.debug("  - Analyzing region: %s", current_region)
             try:
                 haystack_image = self.screenshot(region=current_region)
                 
                 if self.debug_mode:
-                    haystack_image.save(os.path.join(debug_dir, f"haystack_color_{display_name}_region_{i}.png"))
-            except (mss.exception.ScreenShotError, AttributeError) as e:
+                    self.debug_writer.submit(f"haystack_color_{display_name}_region_{i}.png", haystack_image)
+            except (CaptureError, AttributeError) as e:
                 self.log(f"  - ERROR: Failed to take screenshot for region {current_region}: {e}")
                 continue
             
             left, top, _, _ = current_region
             try:
+                match_start = time.perf_counter()
                 location_box = pyscreeze.locate(template_path, haystack_image, confidence=confidence)
+                self.metrics.record_template_match(display_name, latency=time.perf_counter() - match_start)
                 
                 if location_box:
                     center_x = location_box.left + location_box.width / 2
                     center_y = location_box.top + location_box.height / 2
                     abs_x = center_x + left
                     abs_y = center_y + top
-                    location = pyautogui.Point(int(abs_x), int(abs_y))
-                    self.log(f"  - Found '{display_name}' at {location} in region {current_region}")
+                    location = Point(int(abs_x), int(abs_y))
+                    logger.debug("  - Found '%s' at %s in region %s", display_name, location, current_region)
                     return location
             except pyscreeze.ImageNotFoundException:
-                self.log(f"  - PyAutoGUI: '{display_name}' center not found in this region.")
+                logger.debug("  - PyAutoGUI: '%s' center not found in this region.", display_name)
             except Exception as e:
                 self.log(f"  - PyAutoGUI error on cropped image for region {current_region}: {e}. Trying OpenCV.")
             
@@ -163,8 +166,8 @@ class Vision:
                 haystack_gray = cv2.cvtColor(np.array(haystack_image), cv2.COLOR_RGB2GRAY)
                 
                 if self.debug_mode:
-                    cv2.imwrite(os.path.join(debug_dir, f"haystack_gray_{display_name}_region_{i}.png"), haystack_gray)
-                original_template_color = cv2.imread(template_path, cv2.IMREAD_COLOR)
+                    self.debug_writer.submit(f"haystack_gray_{display_name}_region_{i}.png", haystack_gray)
+                original_template_color = self._read_template(template_path, cv2.IMREAD_COLOR)
                 
                 if original_template_color is None: continue
                 scales_to_try = [1.0, 1.25, 0.75, 1.5]
@@ -183,11 +186,13 @@ class Vision:
                     template_gray = cv2.cvtColor(template_color, cv2.COLOR_BGR2GRAY)
                     
                     if self.debug_mode:
-                        cv2.imwrite(os.path.join(debug_dir, f"template_{display_name}_scale_{scale:.2f}.png"), template_gray)
+                        self.debug_writer.submit(f"template_{display_name}_scale_{scale:.2f}.png", template_gray)
                     
                     if template_gray.shape[0] > haystack_gray.shape[0] or template_gray.shape[1] > haystack_gray.shape[1]:
                         continue
+                    match_start = time.perf_counter()
                     res = cv2.matchTemplate(haystack_gray, template_gray, cv2.TM_CCOEFF_NORMED)
+                    self.metrics.record_template_match(display_name, scale, latency=time.perf_counter() - match_start)
                     _, max_val, _, max_loc = cv2.minMaxLoc(res)
                     
                     if max_val > best_confidence_in_region:
@@ -195,22 +200,26 @@ class Vision:
                         
                         if max_val >= confidence:
                             best_match_info = (max_val, max_loc, template_gray.shape, scale)
-                self.log(f"  - OpenCV: Max confidence for '{display_name}' center in this region is {best_confidence_in_region:.3f}.")
+                logger.debug("  - OpenCV: Max confidence for '%s' center in this region is %.3f.", display_name, best_confidence_in_region)
                 
                 if best_match_info:
                     max_val, max_loc, shape, scale = best_match_info
-                    self.log(f"  - OpenCV: Found match for '{display_name}' center with scale {scale:.2f} (confidence: {max_val:.3f}).")
+                    logger.debug("  - OpenCV: Found match for '%s' center with scale %.2f (confidence: %.3f).", display_name, scale, max_val)
                     w, h = shape[1], shape[0]
                     center_x = max_loc[0] + w // 2 + left
                     center_y = max_loc[1] + h // 2 + top
-                    return pyautogui.Point(int(center_x), int(center_y))
+                    return Point(int(center_x), int(center_y))
             except Exception as e:
                 self.log(f"  - OpenCV error finding image in region {current_region}: {e}")
         return None
     
-    def find_all_images(self, template_name, region=None, confidence=0.8):
+    @recorded_query
+    @traced('find_image')
+    def find_all_images(self, template_name, region=None, confidence=0.8, haystack_image=None):
         """
         Finds all occurrences of a template image within a region using OpenCV.
+        If a haystack image already captured from that region is given, it is searched
+        instead of taking a new screenshot.
         Returns a list of center points.
         """
         template_path = self.get_localized_template_path(template_name)
@@ -228,14 +237,15 @@ class Vision:
             self.log(f"  - ERROR in find_all_images: No search region provided for '{display_name}'.")
             return []
         try:
-            haystack_image = self.screenshot(region=search_region)
+            if haystack_image is None:
+                haystack_image = self.screenshot(region=search_region)
             
             if not haystack_image:
                 self.log(f"  - ERROR in find_all_images: Failed to get screenshot for region {search_region}.")
                 return []
             left, top, width, height = search_region
             screenshot_cv = cv2.cvtColor(np.array(haystack_image), cv2.COLOR_RGB2BGR)
-            template = cv2.imread(template_path, cv2.IMREAD_COLOR)
+            template = self._read_template(template_path, cv2.IMREAD_COLOR)
             
             if template is None: return []
             
@@ -243,14 +253,16 @@ class Vision:
                  self.log(f"  - WARNING in find_all_images: Template '{display_name}' is larger than the screenshot of region {search_region}. This may be a DPI scaling issue.")
                  return []
             w, h = template.shape[1], template.shape[0]
+            match_start = time.perf_counter()
             res = cv2.matchTemplate(screenshot_cv, template, cv2.TM_CCOEFF_NORMED)
+            self.metrics.record_template_match(display_name, latency=time.perf_counter() - match_start)
             locs = np.where(res >= confidence)
             points = []
             
             for pt in zip(*locs[::-1]):
                 center_x = pt[0] + w // 2 + left
                 center_y = pt[1] + h // 2 + top
-                points.append(pyautogui.Point(int(center_x), int(center_y)))
+                points.append(Point(int(center_x), int(center_y)))
             
             if not points:
                 return []
@@ -263,12 +275,82 @@ class Vision:
                     filtered_points.append(pt)
             
             if filtered_points:
-                self.log(f"  - Found {len(filtered_points)} instances of '{display_name}'.")
+                logger.debug("  - Found %s instances of '%s'.", len(filtered_points), display_name)
             return filtered_points
         except Exception as e:
             self.log(f"  - An unexpected error occurred in find_all_images: {e}")
             return []
     
+    @recorded_query
+    @traced('find_image')
+    def match_templates(self, template_names, region=None, confidence=0.8, haystack_image=None, max_candidates=3):
+        """
+        Matches several templates against a single capture of a region, converting it to
+        grayscale once. Each template is tried at its natural scale first and at the
+        fallback scales only if that fails.
+        Returns {template_name: [{'point', 'score', 'width', 'height'}, ...]} with up to
+        max_candidates matches per template, best first.
+        """
+        search_region = region or self.app_region
+        results = {name: [] for name in template_names}
+        
+        if search_region is None:
+            self.log("  - ERROR in match_templates: No search region provided.")
+            return results
+        
+        if haystack_image is None:
+            haystack_image = self.screenshot(region=search_region)
+        
+        if not haystack_image:
+            self.log(f"  - ERROR in match_templates: Failed to get screenshot for region {search_region}.")
+            return results
+        left, top, _, _ = search_region
+        haystack_gray = cv2.cvtColor(np.array(haystack_image), cv2.COLOR_RGB2GRAY)
+        
+        for template_name in template_names:
+            template_path = self.get_localized_template_path(template_name)
+            original_template_gray = self._read_template(template_path, cv2.IMREAD_GRAYSCALE)
+            
+            if original_template_gray is None:
+                self.log(f"  - ERROR: Template image not found at {template_path}")
+                continue
+            
+            for scale in [1.0, 1.25, 0.75, 1.5]:
+                if scale == 1.0:
+                    template_gray = original_template_gray
+                else:
+                    width = int(original_template_gray.shape[1] * scale)
+                    height = int(original_template_gray.shape[0] * scale)
+                    
+                    if width < 1 or height < 1: continue
+                    template_gray = cv2.resize(original_template_gray, (width, height), interpolation=cv2.INTER_AREA)
+                h, w = template_gray.shape
+                
+                if h > haystack_gray.shape[0] or w > haystack_gray.shape[1]:
+                    continue
+                match_start = time.perf_counter()
+                res = cv2.matchTemplate(haystack_gray, template_gray, cv2.TM_CCOEFF_NORMED)
+                self.metrics.record_template_match(os.path.basename(template_path), scale, latency=time.perf_counter() - match_start)
+                candidates = []
+                
+                while len(candidates) < max_candidates:
+                    _, max_val, _, max_loc = cv2.minMaxLoc(res)
+                    
+                    if max_val < confidence:
+                        break
+                    center = Point(int(max_loc[0] + w // 2 + left), int(max_loc[1] + h // 2 + top))
+                    candidates.append({'point': center, 'score': float(max_val), 'width': w, 'height': h})
+                    x0, y0 = max(0, max_loc[0] - w // 2), max(0, max_loc[1] - h // 2)
+                    res[y0:max_loc[1] + h // 2 + 1, x0:max_loc[0] + w // 2 + 1] = -1.0
+                
+                if candidates:
+                    logger.debug("  - Matched '%s' %s time(s) at scale %.2f (best: %.3f).", os.path.basename(template_path), len(candidates), scale, candidates[0]['score'])
+                    results[template_name] = candidates
+                    break
+        return results
+    
+    @recorded_query
+    @traced('find_image')
     def find_image_box(self, template, region=None, confidence=0.8):
         """
         Finds an image and returns its bounding box (left, top, width, height).
@@ -294,40 +376,36 @@ class Vision:
         elif self.app_region:
             search_regions.append(self.app_region)
         else:
-            self.log("  - No region specified. Searching all monitors individually.")
+            logger.debug("  - No region specified. Searching all monitors individually.")
             
-            for m in screeninfo.get_monitors():
+            for m in self.capture_backend.monitors():
                 search_regions.append((m.x, m.y, m.width, m.height))
-        debug_dir = None
-        
-        if self.debug_mode:
-            project_root = os.path.abspath(os.path.join(self.assets_path, "..", ".."))
-            debug_dir = os.path.join(project_root, 'debug')
-            os.makedirs(debug_dir, exist_ok=True)
         
         for i, current_region in enumerate(search_regions):
-            self.log(f"  - Analyzing region: {current_region}")
+            logger.debug("  - Analyzing region: %s", current_region)
             try:
                 haystack_image = self.screenshot(region=current_region)
                 
                 if self.debug_mode:
-                    haystack_image.save(os.path.join(debug_dir, f"haystack_color_{display_name}_region_{i}.png"))
-            except (mss.exception.ScreenShotError, AttributeError) as e:
+                    self.debug_writer.submit(f"haystack_color_{display_name}_region_{i}.png", haystack_image)
+            except (CaptureError, AttributeError) as e:
                 self.log(f"  - ERROR: Failed to take screenshot for region {current_region}: {e}")
                 continue
             
             left, top, _, _ = current_region
             try:
+                match_start = time.perf_counter()
                 location = pyscreeze.locate(image_to_find, haystack_image, confidence=confidence)
+                self.metrics.record_template_match(display_name, latency=time.perf_counter() - match_start)
                 
                 if location:
                     abs_left = location.left + left
                     abs_top = location.top + top
                     box = (abs_left, abs_top, location.width, location.height)
-                    self.log(f"  - Found '{display_name}' box at {Box(*box)} in region {current_region}")
+                    logger.debug("  - Found '%s' box at %s in region %s", display_name, Box(*box), current_region)
                     return box
             except pyscreeze.ImageNotFoundException:
-                self.log(f"  - PyAutoGUI: '{display_name}' box not found in this region.")
+                logger.debug("  - PyAutoGUI: '%s' box not found in this region.", display_name)
             except Exception as e:
                 self.log(f"  - PyAutoGUI error on cropped image for region {current_region}: {e}. Trying OpenCV.")
             
@@ -335,10 +413,10 @@ class Vision:
                 haystack_gray = cv2.cvtColor(np.array(haystack_image), cv2.COLOR_RGB2GRAY)
                 
                 if self.debug_mode:
-                    cv2.imwrite(os.path.join(debug_dir, f"haystack_gray_{display_name}_region_{i}.png"), haystack_gray)
+                    self.debug_writer.submit(f"haystack_gray_{display_name}_region_{i}.png", haystack_gray)
                 
                 if isinstance(template, str):
-                    original_template_color = cv2.imread(template_path, cv2.IMREAD_COLOR)
+                    original_template_color = self._read_template(template_path, cv2.IMREAD_COLOR)
                 else:
                     original_template_color = cv2.cvtColor(np.array(template), cv2.COLOR_RGB2BGR)
                 
@@ -359,11 +437,13 @@ class Vision:
                     template_gray = cv2.cvtColor(template_color, cv2.COLOR_BGR2GRAY)
                     
                     if self.debug_mode:
-                        cv2.imwrite(os.path.join(debug_dir, f"template_{display_name}_scale_{scale:.2f}.png"), template_gray)
+                        self.debug_writer.submit(f"template_{display_name}_scale_{scale:.2f}.png", template_gray)
                     
                     if template_gray.shape[0] > haystack_gray.shape[0] or template_gray.shape[1] > haystack_gray.shape[1]:
                         continue
+                    match_start = time.perf_counter()
                     res = cv2.matchTemplate(haystack_gray, template_gray, cv2.TM_CCOEFF_NORMED)
+                    self.metrics.record_template_match(display_name, scale, latency=time.perf_counter() - match_start)
                     _, max_val, _, max_loc = cv2.minMaxLoc(res)
                     
                     if max_val > best_confidence_in_region:
@@ -371,11 +451,11 @@ class Vision:
                         
                         if max_val >= confidence:
                              best_match_info = (max_val, max_loc, template_gray.shape, scale)
-                self.log(f"  - OpenCV: Max confidence for '{display_name}' box in this region is {best_confidence_in_region:.3f}.")
+                logger.debug("  - OpenCV: Max confidence for '%s' box in this region is %.3f.", display_name, best_confidence_in_region)
                 
                 if best_match_info:
                     max_val, max_loc, shape, scale = best_match_info
-                    self.log(f"  - OpenCV: Found match for '{display_name}' box with scale {scale:.2f} (confidence: {max_val:.3f}).")
+                    logger.debug("  - OpenCV: Found match for '%s' box with scale %.2f (confidence: %.3f).", display_name, scale, max_val)
                     w, h = shape[1], shape[0]
                     abs_left = int(max_loc[0] + left)
                     abs_top = int(max_loc[1] + top)
@@ -384,6 +464,8 @@ class Vision:
                 self.log(f"  - OpenCV error finding image box in region {current_region}: {e}")
         return None
     
+    @recorded_query
+    @traced('ocr')
     def get_text_from_region(self, region):
         """
         Reads text from a specific region of the screen.
@@ -396,15 +478,36 @@ class Vision:
                 return ""
             screenshot_np = np.array(screenshot)
             return self.ocr.get_text_from_image(screenshot_np)
-        except (mss.exception.ScreenShotError, AttributeError, Exception) as e:
+        except (CaptureError, AttributeError, Exception) as e:
             self.log(f"An error occurred during OCR: {e}")
             return ""
     
+    @recorded_query
+    @traced('ocr')
+    def read_text_boxes(self, region, haystack_image=None):
+        """
+        Reads every piece of text in a region in a single OCR pass.
+        Returns a list of {'bbox', 'text', 'prob'} dicts in screen coordinates.
+        """
+        try:
+            if haystack_image is None:
+                haystack_image = self.screenshot(region=region)
+            
+            if not haystack_image:
+                self.log(f"An error occurred during read_text_boxes: Failed to get screenshot for region {region}.")
+                return []
+            return self.ocr.read_text_boxes(np.array(haystack_image), (region[0], region[1]))
+        except (CaptureError, AttributeError, Exception) as e:
+            self.log(f"An error occurred during read_text_boxes: {e}")
+            return []
+    
+    @recorded_query
+    @traced('ocr')
     def find_text_on_screen(self, text_to_find, region=None):
         """
         Finds text on screen by taking a screenshot and passing it to the OCR module.
         """
-        self.log(f"Reading text from region: {region or 'Full Screen'}")
+        logger.debug("Reading text from region: %s", region or 'Full Screen')
         try:
             screenshot = self.screenshot(region=region)
             
@@ -417,10 +520,10 @@ class Vision:
             
             if matches:
                 return matches
-            self.log(f"  - No direct match for '{text_to_find}'. Trying progressive redaction strategy.")
+            logger.debug("  - No direct match for '%s'. Trying progressive redaction strategy.", text_to_find)
             
             if not non_candidates:
-                self.log("  - No non-candidates to redact. Aborting strategy.")
+                logger.debug("  - No non-candidates to redact. Aborting strategy.")
                 return []
             non_candidates.sort(key=lambda x: x['prob'])
             num_steps = 5
@@ -439,22 +542,19 @@ class Vision:
                 for item in redaction_chunk:
                     (tl, tr, br, bl) = item['bbox']
                     draw.polygon([tuple(tl), tuple(tr), tuple(br), tuple(bl)], fill='black')
-                self.log(f"  - Redaction attempt {i+1}/{num_steps}: Redacted {len(redaction_chunk)} non-candidate texts.")
+                logger.debug("  - Redaction attempt %s/%s: Redacted %s non-candidate texts.", i+1, num_steps, len(redaction_chunk))
                 
                 if self.debug_mode:
-                    project_root = os.path.abspath(os.path.join(self.assets_path, "..", ".."))
-                    debug_dir = os.path.join(project_root, 'debug')
-                    os.makedirs(debug_dir, exist_ok=True)
                     safe_text = "".join(c for c in text_to_find if c.isalnum())
-                    modified_screenshot_pil.save(os.path.join(debug_dir, f"redacted_{safe_text}_step_{i+1}.png"))
+                    self.debug_writer.submit(f"redacted_{safe_text}_step_{i+1}.png", modified_screenshot_pil.copy())
                 modified_screenshot_np = np.array(modified_screenshot_pil)
                 matches, _ = self.ocr.find_text_in_image(modified_screenshot_np, text_to_find, region_offset)
                 
                 if matches:
-                    self.log(f"  - Found match for '{text_to_find}' after redaction.")
+                    logger.debug("  - Found match for '%s' after redaction.", text_to_find)
                     return matches
-            self.log("  - Progressive redaction failed to find a match.")
+            logger.debug("  - Progressive redaction failed to find a match.")
             return []
-        except (mss.exception.ScreenShotError, AttributeError, Exception) as e:
+        except (CaptureError, AttributeError, Exception) as e:
             self.log(f"An error occurred during find_text_on_screen: {e}")
             return []
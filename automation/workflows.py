@@ -1,27 +1,68 @@
 import time
 import threading
-import screeninfo
+from contextlib import contextmanager
+from datetime import datetime
 from pyscreeze import Box
 import numpy as np
 from automation.vision import Vision
-from automation.controller import Controller
+from automation.controller import Controller, MOTION_MODES
 from automation.automation_config import AutomationSettings
+from automation.panel_model import PanelModel
+from automation import planner
+from automation import log
+from automation.operation_history import OperationHistory
+from automation.timing_profile import TimingProfile
+from automation.sleeper import Sleeper
+from automation.tracing import Tracer
+from automation.metrics import RunMetrics
+from automation.session import SessionRecorder
+from automation.profiling import RunProfiler
+from automation.backends import RecordingCaptureBackend, RecordingInputBackend
 from .exceptions import AutomationStoppedError, UIVisibilityError, FastApplyError
 from .actions import group_actions, removal_actions, state_actions, texture_actions, ui_helpers
 
 
 class WorkflowManager:
-    def __init__(self, assets_path):
+    ANCHOR_RECHECK_MARGIN = 20
+    
+    def __init__(self, assets_path, capture_backend=None, input_backend=None):
         self.assets_path = assets_path
-        self.vision = Vision(assets_path)
-        self.controller = Controller()
+        self.vision = Vision(assets_path, capture_backend=capture_backend)
+        self.controller = Controller(input_backend=input_backend)
         self.stop_event = threading.Event()
+        self.sleeper = Sleeper(self.stop_event)
+        self.tracer = Tracer()
+        self.vision.tracer = self.tracer
+        self.vision.ocr.tracer = self.tracer
+        self.controller.tracer = self.tracer
+        self.sleeper.tracer = self.tracer
+        self.metrics = RunMetrics()
+        self.vision.metrics = self.metrics
+        self.vision.ocr.metrics = self.metrics
+        self.session_recorder = SessionRecorder()
+        self.vision.session_recorder = self.session_recorder
+        self.profiler = RunProfiler()
         self.ui_cache = {}
         self.group_header_cache = {}
+        self.group_header_positions = {}
         self.anchor_box = None
+        self.app_monitor = None
         self.group_x_positions = []
+        self.panel = PanelModel(self)
+        self.operation_history = OperationHistory()
+        self.operation_costs = self.operation_history.get_costs(planner.DEFAULT_OPERATION_COSTS)
+        self.timing_profile = TimingProfile()
     
-    def find_app_window_and_set_region(self):
+    def find_app_window_and_set_region(self, reuse_anchor=False):
+        """
+        Finds the app anchor and sets the automation region to its monitor. With
+        reuse_anchor, the anchor found by the previous run is only re-checked in place.
+        Returns the monitor, or None if the anchor was not found.
+        """
+        
+        if reuse_anchor and self._is_anchor_unchanged():
+            self.vision.log(f"App anchor unchanged at {self.anchor_box}. Reusing the automation region.")
+            return self.app_monitor
         self.vision.log("Attempting to find app anchor 'app_anchor.png'...")
         anchor_box_tuple = self.vision.find_image_box('app_anchor.png', confidence=0.8)
         
@@ -29,12 +70,13 @@ class WorkflowManager:
             self.vision.log("ERROR: App anchor image not found on any screen.")
             self.vision.app_region = None
             self.anchor_box = None
+            self.app_monitor = None
             return None
         self.anchor_box = Box(*anchor_box_tuple)
         anchor_center_x = self.anchor_box.left + self.anchor_box.width // 2
         anchor_center_y = self.anchor_box.top + self.anchor_box.height // 2
         self.vision.log(f"Found anchor box at {self.anchor_box}")
-        monitors = screeninfo.get_monitors()
+        monitors = self.vision.capture_backend.monitors()
         
         for monitor in monitors:
             if monitor.x <= anchor_center_x < monitor.x + monitor.width and \
@@ -42,75 +84,304 @@ class WorkflowManager:
                 self.vision.app_region = (monitor.x, monitor.y, monitor.width, monitor.height)
                 self.controller.action_region = self.vision.app_region
                 self.vision.log(f"Set automation region to: {self.vision.app_region}")
+                self.app_monitor = monitor
                 return monitor
         self.vision.log("ERROR: Could not determine monitor for the anchor.")
+        self.app_monitor = None
         return None
     
+    def _is_anchor_unchanged(self):
+        """
+        Checks whether the app anchor is still where the last search found it, searching
+        only a small region around it.
+        """
+        
+        if not self.anchor_box or not self.app_monitor or not self.vision.app_region:
+            return False
+        margin = self.ANCHOR_RECHECK_MARGIN
+        region_x, region_y, region_width, region_height = self.vision.app_region
+        left = max(self.anchor_box.left - margin, region_x)
+        top = max(self.anchor_box.top - margin, region_y)
+        right = min(self.anchor_box.left + self.anchor_box.width + margin, region_x + region_width)
+        bottom = min(self.anchor_box.top + self.anchor_box.height + margin, region_y + region_height)
+        region = (left, top, right - left, bottom - top)
+        box = self.vision.find_image_box('app_anchor.png', region=region, confidence=0.8)
+        return bool(box) and abs(box[0] - self.anchor_box.left) <= 2 and abs(box[1] - self.anchor_box.top) <= 2
+    
     def request_stop(self):
         self.stop_event.set()
     
+    def clear_stop(self):
+        """
+        Clears a previous stop request. Called before a job is submitted, so a stop
+        requested while the job is being set up still halts it.
+        """
+        self.stop_event.clear()
+    
     def set_language(self, lang_code):
         self.vision.set_language(lang_code)
     
     def set_debug_mode(self, enabled):
         self.vision.set_debug_mode(enabled)
     
+    def set_log_callbacks(self, log_callback, verbose_log_callback=None):
+        """
+        Routes automation messages to log_callback, and debug-level details from the
+        automation loggers to verbose_log_callback (log_callback if not given).
+        """
+        self.vision.log = log_callback
+        self.vision.ocr.log = log_callback
+        log.set_callbacks(log_callback, verbose_log_callback)
+    
+    def set_verbose_logging(self, enabled):
+        log.set_verbose(enabled)
+    
+    def set_log_levels(self, levels):
+        """
+        Applies per-module log levels, e.g. {'automation.vision': 'DEBUG'}.
+        """
+        try:
+            log.set_levels(levels)
+        except ValueError as e:
+            self.vision.log(f"Warning: Invalid log level setting. {e}")
+    
+    def set_profiling(self, enabled, profile_main_thread=False):
+        self.profiler.enabled = enabled
+        self.profiler.profile_main_thread = profile_main_thread
+    
+    def record_operation(self, operation, start_time):
+        """
+        Records how long an operation that started at start_time (time.monotonic()) took.
+        """
+        self.operation_history.record(operation, time.monotonic() - start_time)
+    
+    def record_latency(self, operation, latency):
+        """
+        Records an observed UI latency (in seconds) in the timing profile.
+        """
+        self.timing_profile.record(operation, latency)
+    
+    def plan_run(self, texture_slots_data, old_texture_map, is_full_run):
+        """
+        Computes the operations a run would perform, without touching the mouse or the screen,
+        and estimates its duration from the recorded per-operation latencies.
+        """
+        self.operation_costs = self.operation_history.get_costs(planner.DEFAULT_OPERATION_COSTS)
+        
+        if is_full_run:
+            plan = planner.plan_full_apply(old_texture_map, texture_slots_data, self.operation_costs)
+        else:
+            plan = planner.plan_fast_apply(old_texture_map, texture_slots_data, self.operation_costs)
+        num_removals, num_uploads = planner.count_operations(plan)
+        return {
+            'is_full_run': is_full_run,
+            'plan': plan,
+            'removals': num_removals,
+            'uploads': num_uploads,
+            'estimated_seconds': plan['cost'],
+            'is_noop': not is_full_run and not plan['groups'],
+        }
+    
     def _check_for_stop(self):
         if self.stop_event.is_set():
             raise AutomationStoppedError("Automation stopped by user.")
     
-    def run(self, texture_slots_data, old_texture_map, is_full_run, log_callback=print):
-        self.stop_event.clear()
+    def run(self, texture_slots_data, old_texture_map, is_full_run, log_callback=print, verify_texture_map=False, verbose_log_callback=None, keep_caches=False):
+        """
+        Runs the automation workflow, under the profiler if profiling is enabled.
+        Debug messages from the automation loggers go to verbose_log_callback
+        (log_callback if not given). keep_caches keeps the group header images of the
+        previous run even for a Full Apply, for jobs run back to back.
+        Returns (status, texture map).
+        """
+        run_name = datetime.now().strftime("run_%Y%m%d_%H%M%S")
+        self.profiler.log = log_callback
+        is_profiling = self.profiler.start_run()
+        try:
+            return self._run(texture_slots_data, old_texture_map, is_full_run, log_callback, verify_texture_map, verbose_log_callback, keep_caches, run_name)
+        finally:
+            if is_profiling:
+                self.profiler.finish_run(run_name)
+    
+    def _run(self, texture_slots_data, old_texture_map, is_full_run, log_callback, verify_texture_map, verbose_log_callback, keep_caches, run_name):
         self.group_x_positions.clear()
-        self.vision.log = log_callback
+        self.group_header_positions.clear()
+        self.panel.invalidate()
+        self.set_log_callbacks(log_callback, verbose_log_callback)
         self.controller.log = log_callback
         self.controller.stop_event = self.stop_event
+        self.controller.sleeper = self.sleeper
+        self._configure_controller()
+        self.sleeper.reset()
+        self.tracer.reset()
+        self.metrics.reset()
+        self.metrics.log = log_callback
+        self.vision.debug_writer.log = log_callback
+        self.vision.debug_writer.start_run(run_name)
+        is_recording = self._start_session_recording(run_name, texture_slots_data, old_texture_map, is_full_run, verify_texture_map, log_callback)
+        result = (False, old_texture_map)
+        run_start_time = time.monotonic()
+        trace_start = time.perf_counter()
         
-        if is_full_run:
+        if is_full_run and not keep_caches:
             log_callback("Full Apply detected. Clearing group header image cache.")
             self.group_header_cache.clear()
         log_callback("Starting automation workflow...")
         try:
             removed_slots_by_group = {}
             
-            if is_full_run:
-                removal_actions.process_removals_full(self, texture_slots_data)
-            else:
-                removed_slots_by_group = removal_actions.process_removals_fast(self, texture_slots_data, old_texture_map)
+            if verify_texture_map and not is_full_run:
+                log_callback("Verifying the saved texture map against the Creator...")
+                
+                with self._phase('verify'):
+                    is_verified = state_actions.verify_texture_map(self, old_texture_map, texture_slots_data)
+                
+                if not is_verified:
+                    log_callback("Saved texture map does not match the Creator. Falling back to a Full Apply.")
+                    is_full_run = True
+                    
+                    for s in texture_slots_data:
+                        s['is_updated'] = True
+            
+            with self._phase('removals'):
+                if is_full_run:
+                    removal_actions.process_removals_full(self, texture_slots_data)
+                    slots_to_manage = [s for s in texture_slots_data if s['mode'] == 'Managed' and s.get('is_updated', False)]
+                else:
+                    plan = self.plan_run(texture_slots_data, old_texture_map, is_full_run=False)['plan']
+                    log_callback("Fast Apply plan:")
+                    
+                    for line in planner.describe_plan(plan):
+                        log_callback(line)
+                    removed_slots_by_group = removal_actions.process_removals_fast(self, texture_slots_data, old_texture_map, plan)
+                    skipped_groups = set(plan['removals']) - set(removed_slots_by_group)
+                    slots_to_manage = [
+                        s for s in texture_slots_data
+                        if s['slot_id'] in plan['uploads'] and (s.get('group') not in skipped_groups or s.get('is_updated', False))
+                    ]
             self._check_for_stop()
-            slots_to_manage = [s for s in texture_slots_data if s['mode'] == 'Managed' and s.get('is_updated', False)]
-            uploaded_slots_by_group = texture_actions.manage_textures(self, slots_to_manage)
+            
+            with self._phase('uploads'):
+                uploaded_slots_by_group = texture_actions.manage_textures(self, slots_to_manage)
             
             if is_full_run:
                 new_texture_map = state_actions.compute_new_texture_map_from_ui(self, texture_slots_data)
             else:
                 new_texture_map = state_actions.compute_new_texture_map_from_ops(self, old_texture_map, removed_slots_by_group, uploaded_slots_by_group)
             log_callback("\nAutomation workflow finished successfully.")
-            return (True, new_texture_map)
+            result = (True, new_texture_map)
+            return result
         except FastApplyError as e:
             log_callback(f"--- Fast Apply failed: {e} ---")
-            return ('FAST_APPLY_FAILED', old_texture_map)
+            result = ('FAST_APPLY_FAILED', old_texture_map)
+            return result
         except (AutomationStoppedError, UIVisibilityError) as e:
             log_callback(f"--- Automation halted: {e} ---")
-            return (False, old_texture_map)
+            return result
         except Exception as e:
             log_callback(f"--- An unexpected error occurred: {type(e).__name__}: {e} ---")
             import traceback
             traceback.print_exc()
-            return (False, old_texture_map)
+            return result
+        finally:
+            self.operation_history.save()
+            self.timing_profile.save()
+            self._log_sleep_summary(time.monotonic() - run_start_time, log_callback)
+            self.tracer.record('run', 'phase', trace_start, full_run=is_full_run)
+            trace_path = self.tracer.export(run_name)
+            
+            if trace_path:
+                log_callback(f"Trace saved to {trace_path}")
+            
+            for line in self.metrics.format_summary():
+                log_callback(line)
+            self.vision.debug_writer.finish_run()
+            metrics_path = self.metrics.export(run_name)
+            
+            if metrics_path:
+                log_callback(f"Run metrics saved to {metrics_path}")
+            
+            if is_recording:
+                self._stop_session_recording(result)
     
-    def _interruptible_sleep(self, duration):
+    def _start_session_recording(self, run_name, texture_slots_data, old_texture_map, is_full_run, verify_texture_map, log_callback):
         """
-        A sleep that can be interrupted by the stop event in small intervals.
+        Starts recording the run to a session file if RECORD_SESSIONS is enabled, routing
+        the capture and input backends through the recorder for its duration.
         """
-        end_time = time.time() + duration
         
-        while time.time() < end_time:
-            self._check_for_stop()
-            remaining = end_time - time.time()
-            
-            if remaining > 0:
-                time.sleep(min(0.05, remaining))
+        if not AutomationSettings.RECORD_SESSIONS:
+            return False
+        self.session_recorder.log = log_callback
+        header = {
+            'slots_data': texture_slots_data,
+            'texture_map': old_texture_map,
+            'is_full_run': is_full_run,
+            'verify_texture_map': verify_texture_map,
+            'language': self.vision.language,
+            'anchor_box': tuple(self.anchor_box) if self.anchor_box else None,
+            'app_region': self.vision.app_region,
+        }
+        
+        if not self.session_recorder.start(run_name, header):
+            return False
+        self.vision.capture_backend = RecordingCaptureBackend(self.vision.capture_backend, self.session_recorder)
+        self.controller.input_backend = RecordingInputBackend(self.controller.input_backend, self.session_recorder)
+        return True
+    
+    def _stop_session_recording(self, result):
+        self.vision.capture_backend = self.vision.capture_backend.backend
+        self.controller.input_backend = self.controller.input_backend.backend
+        self.session_recorder.stop(result)
+    
+    @contextmanager
+    def _phase(self, name):
+        """
+        Runs a block as a named phase: its sleeps are accounted to it and it is traced as a span.
+        """
+        self.sleeper.set_phase(name)
+        
+        with self.tracer.span(name, 'phase'):
+            yield
+    
+    def _configure_controller(self):
+        """
+        Applies the input settings (text entry, pointer motion and per-action pauses)
+        to the controller for this run.
+        """
+        controller = self.controller
+        controller.text_entry_mode = AutomationSettings.TEXT_ENTRY_MODE
+        controller.motion_mode = AutomationSettings.POINTER_MOTION_MODE
+        controller.pointer_speed = float(AutomationSettings.POINTER_SPEED)
+        controller.max_move_duration = AutomationSettings.POINTER_MAX_MOVE_DURATION
+        controller.hover_duration = AutomationSettings.POINTER_HOVER_DURATION
+        controller.action_pauses = {
+            'move': AutomationSettings.MOVE_PAUSE,
+            'click': AutomationSettings.CLICK_PAUSE,
+            'key': AutomationSettings.KEY_PAUSE,
+            'scroll': AutomationSettings.SCROLL_PAUSE,
+        }
+        
+        if controller.motion_mode not in MOTION_MODES:
+            self.vision.log(f"Unknown pointer motion mode '{controller.motion_mode}'. Using 'fixed'.")
+            controller.motion_mode = 'fixed'
+    
+    def _log_sleep_summary(self, run_duration, log_callback):
+        """
+        Logs how much of the run was spent in deliberate waits, per phase.
+        """
+        slept_by_phase = self.sleeper.get_summary()
+        total_slept = sum(slept_by_phase.values())
+        phases = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in slept_by_phase.items())
+        log_callback(f"Time spent waiting: {total_slept:.2f}s of {run_duration:.2f}s ({phases or 'none'}).")
+    
+    def _interruptible_sleep(self, duration):
+        """
+        A sleep that ends early, raising AutomationStoppedError, when a stop is requested.
+        """
+        self._check_for_stop()
+        self.sleeper.sleep(duration)
+        self._check_for_stop()
     
     def _find_image_with_cache(self, template_name, cache_key, region=None, confidence=0.8):
         """
@@ -127,10 +398,10 @@ class WorkflowManager:
             return None
         return ui_helpers.select_best_group_match(self, matches)
     
-    def _wait_for_element(self, template_name, timeout, cache_key=None, region=None, confidence=0.8):
+    def _wait_for_element(self, template_name, timeout, cache_key=None, region=None, confidence=0.8, latency_key=None):
         """
         Waits for a UI element to appear by repeatedly searching for it until a timeout is reached.
         Returns the element's coordinates or raises UIVisibilityError.
         """
-        start_time = time.time()
-        return ui_helpers.wait_for_element(self, template_name, timeout, start_time, cache_key, region, confidence)
+        start_time = time.monotonic()
+        return ui_helpers.wait_for_element(self, template_name, timeout, start_time, cache_key, region, confidence, latency_key)
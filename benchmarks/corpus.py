@@ -0,0 +1,110 @@
+import json
+import os
+from PIL import Image
+from automation.backends import CreatorSimulator
+CORPUS_FILE_NAME = 'corpus.json'
+RESOLUTIONS = ((1280, 800), (1920, 1080))
+UI_SCALES = (1.0, 1.25)
+GROUP_NAMES = ['Hair', 'Body', 'Accessories', 'Outfit', 'Eyes', 'Background']
+
+
+def _scene_groups(expanded, textures_per_group=2, group_count=4):
+    return [
+        {
+            'name': name,
+            'expanded': expanded,
+            'textures': [f"corpus/{name.lower()}_{i}.png" for i in range(textures_per_group)],
+        }
+        for name in GROUP_NAMES[:group_count]
+    ]
+
+
+def _collapsed(simulator):
+    pass
+
+
+def _selected(simulator):
+    simulator.selected = simulator.groups[0]['textures'][-1]
+    simulator.adjust_expanded = True
+    simulator.repeat_expanded = True
+
+
+def _menu_open(simulator):
+    _selected(simulator)
+    simulator.menu_for = simulator.selected
+
+
+def _confirm_dialog(simulator):
+    _selected(simulator)
+    simulator.dialog = 'confirm'
+
+
+def _scrolled(simulator):
+    simulator.move_to(200, simulator.LIST_TOP + 100)
+    simulator.scroll(-400)
+
+
+SCENES = {
+    'collapsed': (lambda: _scene_groups(False), _collapsed),
+    'expanded': (lambda: _scene_groups(True), _collapsed),
+    'selected': (lambda: _scene_groups(True), _selected),
+    'menu_open': (lambda: _scene_groups(True, textures_per_group=1), _menu_open),
+    'confirm_dialog': (lambda: _scene_groups(True, textures_per_group=1), _confirm_dialog),
+    'scrolled': (lambda: _scene_groups(True, textures_per_group=3, group_count=6), _scrolled),
+}
+
+
+def _scale_labels(labels, scale):
+    def _scale_box(box):
+        return [int(round(v * scale)) for v in box]
+    return {
+        'templates': {name: [_scale_box(box) for box in boxes] for name, boxes in labels['templates'].items()},
+        'headers': {name: _scale_box(box) for name, box in labels['headers'].items()},
+    }
+
+
+def generate_corpus(corpus_dir, assets_path, resolutions=RESOLUTIONS, scales=UI_SCALES, log_callback=print):
+    """
+    Renders every scene with the Creator simulator at each resolution, scales the capture
+    to each UI scale and stores it with its ground-truth labels. Real captures can be
+    added to the corpus by hand in the same format.
+    """
+    os.makedirs(corpus_dir, exist_ok=True)
+    cases = []
+    
+    for scene_name, (make_groups, prepare) in SCENES.items():
+        for width, height in resolutions:
+            simulator = CreatorSimulator(assets_path, groups=make_groups(), screen_size=(width, height))
+            prepare(simulator)
+            labels = simulator.ground_truth()
+            screen = simulator.render()
+            
+            for scale in scales:
+                case_name = f"{scene_name}_{width}x{height}_{int(scale * 100)}"
+                image = screen if scale == 1.0 else screen.resize((int(width * scale), int(height * scale)), Image.Resampling.LANCZOS)
+                image.save(os.path.join(corpus_dir, f"{case_name}.png"))
+                cases.append({
+                    'name': case_name,
+                    'image': f"{case_name}.png",
+                    'resolution': [width, height],
+                    'scale': scale,
+                    'labels': _scale_labels(labels, scale),
+                })
+    
+    with open(os.path.join(corpus_dir, CORPUS_FILE_NAME), 'w') as f:
+        json.dump({'version': 1, 'cases': cases}, f, indent=4)
+    log_callback(f"Generated {len(cases)} corpus cases in {corpus_dir}")
+    return cases
+
+
+def load_corpus(corpus_dir):
+    """
+    Returns the cases of a corpus, each with its image path resolved.
+    """
+    
+    with open(os.path.join(corpus_dir, CORPUS_FILE_NAME), 'r') as f:
+        cases = json.load(f)['cases']
+    
+    for case in cases:
+        case['image_path'] = os.path.join(corpus_dir, case['image'])
+    return cases
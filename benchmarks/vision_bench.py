@@ -0,0 +1,285 @@
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from PIL import Image
+from pyscreeze import Box
+from automation.backends import CaptureBackend, Monitor
+from automation.workflows import WorkflowManager
+from benchmarks.corpus import generate_corpus, load_corpus
+PRIMITIVES = ('find_image', 'find_image_box', 'find_all_images', 'find_text_on_screen', 'resolve_group')
+MULTI_INSTANCE_TEMPLATES = ('group_expanded.png', 'group_collapsed.png', 'texture_item.png', 'group_upload_button.png')
+POINT_TOLERANCE = 3
+MIN_BOX_IOU = 0.5
+
+
+class CorpusCaptureBackend(CaptureBackend):
+    """
+    Serves the current corpus image as the screen.
+    """
+    
+    def __init__(self):
+        self.image = None
+    
+    def grab(self, region=None):
+        if region is None:
+            return self.image.copy()
+        left, top, width, height = (int(v) for v in region)
+        return self.image.crop((left, top, left + width, top + height))
+    
+    def monitors(self):
+        return [Monitor(0, 0, self.image.width, self.image.height, 'corpus')]
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    
+    if not values:
+        return None
+    rank = (len(values) - 1) * q / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def _contains(box, point, tolerance):
+    return (
+        box[0] - tolerance <= point[0] <= box[0] + box[2] + tolerance and
+        box[1] - tolerance <= point[1] <= box[1] + box[3] + tolerance
+    )
+
+
+def _iou(a, b):
+    left, top = max(a[0], b[0]), max(a[1], b[1])
+    right, bottom = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+    
+    if right <= left or bottom <= top:
+        return 0.0
+    intersection = (right - left) * (bottom - top)
+    return intersection / float(a[2] * a[3] + b[2] * b[3] - intersection)
+
+
+def _box_center(box):
+    return (box[0] + box[2] / 2, box[1] + box[3] / 2)
+
+
+class VisionBenchmark:
+    """
+    Times the Vision primitives and group resolution on every corpus case and scores
+    their results against the case's labels. Templates absent from a case are queried
+    as well, so false positives count against accuracy. Multi-instance searches are
+    limited to the panel region, as the workflows do.
+    """
+    
+    def __init__(self, assets_path, iterations=1, primitives=PRIMITIVES, log_callback=print):
+        self.iterations = iterations
+        self.primitives = primitives
+        self.log = log_callback
+        self.backend = CorpusCaptureBackend()
+        self.manager = WorkflowManager(assets_path, capture_backend=self.backend)
+        self.vision = self.manager.vision
+        self.manager.set_log_callbacks(lambda message: None)
+        self.vision.tracer = None
+        self.vision.ocr.tracer = None
+        self.samples = []
+    
+    def _measure(self, primitive, case, target, call, is_correct):
+        for _ in range(self.iterations):
+            self.vision.metrics.reset()
+            start_time = time.perf_counter()
+            result = call()
+            latency = time.perf_counter() - start_time
+            self.samples.append({
+                'primitive': primitive,
+                'case': case['name'],
+                'scale': case['scale'],
+                'target': target,
+                'seconds': latency,
+                'frames': self.vision.metrics.counters.get('screenshots', 0),
+                'correct': bool(is_correct(result)),
+            })
+        return result
+    
+    def run_case(self, case, all_templates):
+        self.backend.image = Image.open(case['image_path']).convert('RGB')
+        self.vision.app_region = (0, 0, self.backend.image.width, self.backend.image.height)
+        labels = case['labels']
+        tolerance = POINT_TOLERANCE * case['scale']
+        anchor_boxes = labels['templates'].get('app_anchor.png')
+        self.manager.anchor_box = Box(*anchor_boxes[0]) if anchor_boxes else None
+        panel_region, _ = self.manager.panel._compute_regions()
+        
+        for template_name in all_templates:
+            boxes = labels['templates'].get(template_name, [])
+            
+            if 'find_image' in self.primitives:
+                self._measure(
+                    'find_image', case, template_name,
+                    lambda: self.vision.find_image(template_name),
+                    lambda p: any(_contains(b, p, tolerance) for b in boxes) if p else not boxes
+                )
+            
+            if 'find_image_box' in self.primitives:
+                self._measure(
+                    'find_image_box', case, template_name,
+                    lambda: self.vision.find_image_box(template_name),
+                    lambda r: any(_iou(b, r) >= MIN_BOX_IOU for b in boxes) if r else not boxes
+                )
+            
+            if 'find_all_images' in self.primitives and template_name in MULTI_INSTANCE_TEMPLATES and panel_region:
+                def _all_found(points):
+                    unmatched = list(boxes)
+                    
+                    for point in points:
+                        match = next((b for b in unmatched if _contains(b, point, tolerance)), None)
+                        
+                        if match is None:
+                            return False
+                        unmatched.remove(match)
+                    return not unmatched
+                self._measure(
+                    'find_all_images', case, template_name,
+                    lambda: self.vision.find_all_images(
+                        template_name, region=panel_region,
+                        confidence=0.99 if 'texture_item' in template_name else 0.8
+                    ),
+                    _all_found
+                )
+        
+        for group_name, header_box in labels['headers'].items():
+            if 'find_text_on_screen' in self.primitives:
+                self._measure(
+                    'find_text_on_screen', case, group_name,
+                    lambda: self.vision.find_text_on_screen(group_name, region=self.vision.app_region),
+                    lambda m: bool(m) and _contains(header_box, _box_center(m[0]['bbox']), tolerance)
+                )
+            
+            if 'resolve_group' in self.primitives and self.manager.anchor_box:
+                def _resolve():
+                    self.manager.panel.invalidate()
+                    return self.manager.panel.find_group([group_name])
+                self._measure(
+                    'resolve_group', case, group_name, _resolve,
+                    lambda g: bool(g) and _contains(header_box, _box_center(g['header_bbox']), tolerance)
+                )
+    
+    def run(self, cases):
+        all_templates = sorted({name for case in cases for name in case['labels']['templates']})
+        
+        for i, case in enumerate(cases):
+            self.log(f"[{i + 1}/{len(cases)}] {case['name']}")
+            self.run_case(case, all_templates)
+        return self.summarize()
+    
+    def _summarize_samples(self, samples):
+        latencies = [s['seconds'] * 1000.0 for s in samples]
+        return {
+            'calls': len(samples),
+            'latency_ms': {
+                'p50': round(_percentile(latencies, 50), 2),
+                'p90': round(_percentile(latencies, 90), 2),
+                'p99': round(_percentile(latencies, 99), 2),
+                'mean': round(sum(latencies) / len(latencies), 2),
+                'max': round(max(latencies), 2),
+            },
+            'frames_per_call': round(sum(s['frames'] for s in samples) / len(samples), 2),
+            'accuracy': round(sum(1 for s in samples if s['correct']) / len(samples), 4),
+        }
+    
+    def summarize(self):
+        """
+        Aggregates the samples per primitive, and per primitive and UI scale.
+        """
+        summary = {}
+        
+        for primitive in self.primitives:
+            samples = [s for s in self.samples if s['primitive'] == primitive]
+            
+            if not samples:
+                continue
+            summary[primitive] = self._summarize_samples(samples)
+            summary[primitive]['by_scale'] = {
+                f"{scale:.2f}": self._summarize_samples([s for s in samples if s['scale'] == scale])
+                for scale in sorted({s['scale'] for s in samples})
+            }
+            summary[primitive]['failures'] = sorted({
+                f"{s['case']}: {s['target']}" for s in samples if not s['correct']
+            })
+        return summary
+
+
+def compare_results(results, baseline):
+    """
+    Returns lines comparing the p50 latency and accuracy of each primitive with a baseline.
+    """
+    lines = []
+    
+    for primitive, summary in results['primitives'].items():
+        base = baseline.get('primitives', {}).get(primitive)
+        
+        if not base:
+            continue
+        p50, base_p50 = summary['latency_ms']['p50'], base['latency_ms']['p50']
+        change = (p50 - base_p50) / base_p50 * 100.0 if base_p50 else 0.0
+        lines.append(
+            f"  - {primitive}: p50 {base_p50:.1f}ms -> {p50:.1f}ms ({change:+.1f}%), "
+            f"accuracy {base['accuracy']:.3f} -> {summary['accuracy']:.3f}"
+        )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Vision primitives over a corpus of labelled screens.")
+    parser.add_argument('--corpus', default=os.path.join('benchmarks', 'corpus'), help="Corpus folder holding corpus.json.")
+    parser.add_argument('--assets', default=os.path.join('assets', 'templates'), help="Template assets folder.")
+    parser.add_argument('--generate', action='store_true', help="(Re)generate the corpus with the Creator simulator first.")
+    parser.add_argument('--iterations', type=int, default=1, help="Timed calls per query.")
+    parser.add_argument('--primitives', nargs='+', choices=PRIMITIVES, default=list(PRIMITIVES))
+    parser.add_argument('--cases', help="Only run cases whose name contains this text.")
+    parser.add_argument('--output', help="Results JSON path (defaults to benchmarks/results/vision_<timestamp>.json).")
+    parser.add_argument('--baseline', help="Results JSON of an earlier run to compare against.")
+    args = parser.parse_args(argv)
+    
+    if args.generate or not os.path.exists(os.path.join(args.corpus, 'corpus.json')):
+        generate_corpus(args.corpus, args.assets)
+    cases = load_corpus(args.corpus)
+    
+    if args.cases:
+        cases = [case for case in cases if args.cases in case['name']]
+    benchmark = VisionBenchmark(args.assets, iterations=args.iterations, primitives=args.primitives)
+    benchmark.vision.initialize_dependencies()
+    results = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'corpus': args.corpus,
+        'cases': len(cases),
+        'iterations': args.iterations,
+        'primitives': benchmark.run(cases),
+    }
+    
+    for primitive, summary in results['primitives'].items():
+        latency = summary['latency_ms']
+        print(
+            f"{primitive}: {summary['calls']} calls, p50 {latency['p50']:.1f}ms, p90 {latency['p90']:.1f}ms, "
+            f"p99 {latency['p99']:.1f}ms, {summary['frames_per_call']:.2f} frames/call, accuracy {summary['accuracy']:.3f}"
+        )
+    output_path = args.output or os.path.join('benchmarks', 'results', datetime.now().strftime("vision_%Y%m%d_%H%M%S.json"))
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    
+    with open(output_path, 'w') as f:
+        json.dump(results, f, indent=4)
+    print(f"Results saved to {output_path}")
+    
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        print("Compared to baseline:")
+        
+        for line in compare_results(results, baseline):
+            print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
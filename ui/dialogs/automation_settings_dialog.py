@@ -3,6 +3,7 @@ import json
 import inspect
 import pyperclip
 from tkinter import messagebox
+from utils.config_manager import AUTO_VALUE
 from .base_dialog import BaseDialog
 
 
@@ -26,7 +27,7 @@ class AutomationSettingsDialog(BaseDialog):
     def _body(self, master):
         master.grid_columnconfigure(0, weight=1)
         master.grid_rowconfigure(0, weight=1)
-        scrollable_frame = ctk.CTkScrollableFrame(master, label_text="Delays and Timeouts (seconds)")
+        scrollable_frame = ctk.CTkScrollableFrame(master, label_text=f"Delays and Timeouts (seconds, or \"{AUTO_VALUE}\" where supported)")
         scrollable_frame.grid(row=0, column=0, sticky="nsew", pady=5, padx=5)
         scrollable_frame.grid_columnconfigure(1, weight=1)
         configurable_settings = self._get_configurable_settings()
@@ -35,7 +36,7 @@ class AutomationSettingsDialog(BaseDialog):
             label = ctk.CTkLabel(scrollable_frame, text=name)
             label.grid(row=i, column=0, padx=10, pady=(5,10), sticky="w")
             entry = ctk.CTkEntry(scrollable_frame)
-            entry.insert(0, str(value))
+            entry.insert(0, AUTO_VALUE if name in self.config_manager.auto_settings else str(value))
             entry.grid(row=i, column=1, padx=10, pady=(5,10), sticky="ew")
             self.settings_fields[name] = entry
         extra_button_frame = ctk.CTkFrame(master, fg_color="transparent")
@@ -80,6 +81,19 @@ class AutomationSettingsDialog(BaseDialog):
     def _apply(self):
         try:
             for name, entry in self.settings_fields.items():
+                is_auto = entry.get().strip().lower() == AUTO_VALUE
+                
+                if is_auto and name not in self.config_manager.auto_capable_settings:
+                    raise ValueError(f"{name} cannot be set to '{AUTO_VALUE}'.")
+                self.config_manager.set_auto(name, is_auto)
+                
+                if is_auto:
+                    setattr(self.config_manager.settings_class, name, self.config_manager.defaults[name])
+                    continue
+                
+                if isinstance(self.config_manager.defaults.get(name), str):
+                    setattr(self.config_manager.settings_class, name, entry.get().strip())
+                    continue
                 value = float(entry.get())
                 
                 if value.is_integer(): value = int(value)
@@ -0,0 +1,41 @@
+import customtkinter as ctk
+from automation import planner
+from .base_dialog import BaseDialog
+
+
+class PlanPreviewDialog(BaseDialog):
+    """
+    Shows what a Fast Apply and a Full Apply would do for the current slots,
+    with their estimated durations, before anything is run.
+    """
+    def __init__(self, parent, i18n, previews, **kwargs):
+        self.previews = previews
+        super().__init__(parent, title_key='plan_preview_dialog_title', i18n=i18n, **kwargs)
+    
+    def _summary_line(self, key, preview):
+        if preview is None:
+            return self.i18n.t('plan_preview_fast_unavailable')
+        
+        if preview['is_noop']:
+            return self.i18n.t('plan_preview_noop')
+        return self.i18n.t(
+            key, removals=preview['removals'], uploads=preview['uploads'],
+            seconds=f"{preview['estimated_seconds']:.0f}"
+        )
+    
+    def _body(self, master):
+        master.grid_columnconfigure(0, weight=1)
+        master.grid_rowconfigure(0, weight=1)
+        lines = []
+        
+        for key, preview_key in (('plan_preview_fast', 'fast'), ('plan_preview_full', 'full')):
+            preview = self.previews.get(preview_key)
+            lines.append(self._summary_line(key, preview))
+            
+            if preview and not preview['is_noop']:
+                lines.extend(planner.describe_plan(preview['plan']))
+            lines.append("")
+        textbox = ctk.CTkTextbox(master, wrap="word", width=560, height=300)
+        textbox.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        textbox.insert("1.0", "\n".join(lines))
+        textbox.configure(state="disabled")
@@ -0,0 +1,103 @@
+from collections import deque
+DRAIN_INTERVAL_MS = 50
+
+
+class _Channel:
+    """
+    A queue-like endpoint that posts everything put into it as one kind of message.
+    """
+    
+    def __init__(self, dispatcher, kind):
+        self.dispatcher = dispatcher
+        self.kind = kind
+    
+    def put(self, payload):
+        self.dispatcher.post(self.kind, payload)
+
+
+class Dispatcher:
+    """
+    Delivers messages posted from any thread (automation results, status updates, log
+    lines, image refreshes) to handlers on the Tk thread. Posting only appends to a deque,
+    so producers never touch Tcl or wait on the UI, even before the main loop runs. The
+    Tk thread drains everything queued every DRAIN_INTERVAL_MS. Kinds registered with
+    max_pending (e.g. log lines) keep at most that many undelivered messages, dropping
+    the oldest.
+    """
+    
+    def __init__(self, root, interval_ms=DRAIN_INTERVAL_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.queue = deque()
+        self.bounded_queues = {}
+        self.handlers = {}
+        self.drain_callbacks = []
+        self.is_closed = False
+        self.drain_id = root.after(interval_ms, self._drain_loop)
+    
+    def register(self, kind, handler, max_pending=None):
+        """
+        Calls handler(payload) on the Tk thread for every message of this kind.
+        """
+        self.handlers[kind] = handler
+        
+        if max_pending:
+            self.bounded_queues[kind] = deque(maxlen=max_pending)
+    
+    def on_drained(self, callback):
+        """
+        Calls callback() on the Tk thread after each batch of messages is handled.
+        """
+        self.drain_callbacks.append(callback)
+    
+    def channel(self, kind):
+        """
+        Returns an object with a queue-like put() that posts messages of this kind.
+        """
+        return _Channel(self, kind)
+    
+    def post(self, kind, payload=None):
+        """
+        Queues a message for the Tk thread. Safe to call from any thread; never blocks.
+        """
+        bounded_queue = self.bounded_queues.get(kind)
+        
+        if bounded_queue is not None:
+            bounded_queue.append(payload)
+        else:
+            self.queue.append((kind, payload))
+    
+    def close(self):
+        self.is_closed = True
+        
+        if self.drain_id:
+            self.root.after_cancel(self.drain_id)
+            self.drain_id = None
+    
+    def _drain_loop(self):
+        self.drain_id = None
+        
+        if self.is_closed:
+            return
+        try:
+            self._drain()
+        finally:
+            if not self.is_closed:
+                self.drain_id = self.root.after(self.interval_ms, self._drain_loop)
+    
+    def _drain(self):
+        for kind, bounded_queue in self.bounded_queues.items():
+            handler = self.handlers[kind]
+            
+            for _ in range(len(bounded_queue)):
+                handler(bounded_queue.popleft())
+        
+        for _ in range(len(self.queue)):
+            kind, payload = self.queue.popleft()
+            handler = self.handlers.get(kind)
+            
+            if handler:
+                handler(payload)
+        
+        for callback in self.drain_callbacks:
+            callback()
@@ -1,16 +1,23 @@
 import keyboard
+import json
 import os
 from utils.file_watcher import normalize_path
+from utils.image_digest import compute_file_digest
+JOB_NOT_STARTED_STATUSES = ('NO_UPDATES', 'ANCHOR_NOT_FOUND')
 
 
 def automation_worker(app):
     """
     A long-running worker thread that waits for and processes automation jobs.
     Initializes its own instances of thread-sensitive libraries (via Vision properties).
+    Everything a job does off the widgets (planning, anchor search and the run itself)
+    happens here; progress and the result go back to the UI through the dispatcher.
+    Jobs queued behind another one continue from the texture map it left behind.
     """
     app.log_to_console_safe("Automation worker: Initializing libraries...")
     app.workflow_manager.vision.initialize_dependencies()
     app.log_to_console_safe("Automation worker: Libraries initialized. Ready for jobs.")
+    chain = {}
     
     while True:
         job = app.automation_job_queue.get()
@@ -18,21 +25,155 @@ def automation_worker(app):
         if job is None:
             app.log_to_console_safe("Automation worker thread shutting down.")
             break
-        slots_data, texture_map, is_full_run, log_callback = job
-        result = app.workflow_manager.run(slots_data, texture_map, is_full_run, log_callback)
-        app.automation_result_queue.put(result)
+        take_image_digests(job)
+        
+        if not job['queued_behind'] or not chain:
+            chain = {
+                'item_key': job['item_key'],
+                'texture_map': job['texture_map'],
+                'slot_states': job['slot_states'],
+                'needs_verification': job['verify_texture_map'],
+                'is_first_apply': job['is_first_apply'],
+            }
+        else:
+            chain_job(app, job, chain)
+        result = run_job(app, job)
+        slot_states = update_chain(app, job, result, chain)
+        app.dispatcher.post('automation_result', {
+            'result': result, 'slots_data': job['slots_data'], 'slot_states': slot_states,
+            'updated_image_paths': job['updated_image_paths']
+        })
 
 
-def run_automation_thread(app, full_run=False):
-    app.log_to_console("Finding application window anchor...")
-    app.workflow_manager.set_language(app.i18n.language)
-    monitor = app.workflow_manager.find_app_window_and_set_region()
+def take_image_digests(job):
+    """
+    Records the digest of each Managed slot's image as the job starts, on the worker, so
+    the apply state stores the content that was uploaded and not what the file holds
+    once the run has finished.
+    """
+    
+    for slot_data in job['slots_data']:
+        if slot_data['mode'] == 'Managed' and slot_data.get('image_path'):
+            slot_data['digest'] = compute_file_digest(slot_data['image_path'])
+
+
+def item_key(slots_data):
+    """
+    Identifies the Creator item a job targets by the template parts its Managed slots
+    use. The open item itself cannot be read from the Creator.
+    """
+    return tuple(sorted({s['group'] for s in slots_data if s['mode'] == 'Managed'}))
+
+
+def chain_job(app, job, chain):
+    """
+    Re-plans a job queued behind others against the state the previous job left: the
+    slots it already applied are no longer updates for this job. A job for another item
+    verifies that state against the Creator first, and falls back to a Full Apply if it
+    does not match.
+    """
+    job['texture_map'] = chain['texture_map']
+    job['verify_texture_map'] = chain['needs_verification']
+    job['is_first_apply'] = chain['is_first_apply']
+    
+    if job['item_key'] != chain['item_key']:
+        job['log_callback']("Queued job targets other template parts. Verifying the texture map before applying.")
+        job['verify_texture_map'] = True
+        job['is_item_changed'] = True
+        chain['item_key'] = job['item_key']
+    has_updatable_action = False
+    
+    for slot_data in job['slots_data']:
+        if slot_data['mode'] != 'Managed':
+            continue
+        norm_path = normalize_path(slot_data['image_path'])
+        applied_state = chain['slot_states'].get(slot_data['slot_id']) or {}
+        is_changed_on_disk = (
+            norm_path in job['updated_image_paths'] and
+            applied_state.get('digest') != slot_data.get('digest')
+        )
+        slot_data['is_updated'] = (
+            job['full_run'] or job['is_first_apply'] or is_changed_on_disk or
+            slot_data['slot_id'] not in chain['texture_map'].get(slot_data['group'], []) or
+            applied_state.get('image_path') != norm_path
+        )
+        has_updatable_action = has_updatable_action or slot_data['is_updated']
+    job['has_updatable_action'] = has_updatable_action
+
+
+def update_chain(app, job, result, chain):
+    """
+    Carries the result of a job over to the next queued one. Returns the applied slot
+    states after a successful run, or None.
+    """
+    status, texture_map = result
+    
+    if status is True:
+        applied_slots = [
+            s for s in job['slots_data']
+            if any(s['slot_id'] in slot_ids for slot_ids in texture_map.values())
+        ]
+        slot_states = app.apply_state_store.build_slot_states(applied_slots)
+        chain.update(texture_map=texture_map, slot_states=slot_states, needs_verification=False, is_first_apply=False)
+        return slot_states
+    
+    if status not in JOB_NOT_STARTED_STATUSES:
+        chain['needs_verification'] = True
+    return None
+
+
+def post_status(app, text_key, level='info', **kwargs):
+    """
+    Queues a status bar update from the automation worker for the UI thread.
+    """
+    app.dispatcher.post('status', (text_key, level, kwargs))
+
+
+def run_job(app, job):
+    """
+    Plans a job, locates the app window and runs the workflow, on the automation worker.
+    Returns the (status, texture map) result; jobs that never start the workflow return
+    'NO_UPDATES' or 'ANCHOR_NOT_FOUND' as their status.
+    """
+    slots_data, texture_map, log_callback = job['slots_data'], job['texture_map'], job['log_callback']
+    manager = app.workflow_manager
+    manager.set_log_callbacks(log_callback, app.log_verbose)
+    is_full_run = job['is_first_apply'] or job['full_run']
+    preview = manager.plan_run(slots_data, texture_map, is_full_run)
+    
+    if not job['full_run'] and not job['is_item_changed'] and (not job['has_updatable_action'] or preview['is_noop']):
+        log_callback(app.i18n.t('status_no_updates'))
+        return ('NO_UPDATES', texture_map)
+    log_callback("Finding application window anchor...")
+    manager.set_language(job['language'])
+    monitor = manager.find_app_window_and_set_region(reuse_anchor=job['queued_behind'])
     
     if not monitor:
-        app.status_bar.set_status('status_error_anchor', level='error')
-        return
-    app.status_bar.set_status('status_found_anchor', level='info', monitor_name=monitor.name)
-    app.log_to_console("App window located successfully.")
+        return ('ANCHOR_NOT_FOUND', texture_map)
+    
+    if manager.stop_event.is_set():
+        log_callback("--- Automation halted: Automation stopped by user. ---")
+        return (False, texture_map)
+    post_status(app, 'status_found_anchor', monitor_name=monitor.name)
+    log_callback("App window located successfully.")
+    log_callback(f"Planned {preview['removals']} removal(s) and {preview['uploads']} upload(s), estimated {preview['estimated_seconds']:.0f}s.")
+    post_status(app, 'status_running_eta', level='running', seconds=f"{preview['estimated_seconds']:.0f}")
+    resolved_settings = app.automation_config_manager.resolve_auto_settings(manager.timing_profile.derive)
+    
+    if resolved_settings:
+        log_callback(f"Auto timing settings for this run: {resolved_settings}")
+    return manager.run(
+        slots_data, texture_map, is_full_run, log_callback,
+        verify_texture_map=job['verify_texture_map'], verbose_log_callback=app.log_verbose,
+        keep_caches=job['queued_behind']
+    )
+
+
+def collect_slots_data(app, full_run=False):
+    """
+    Reads and validates the slots for a run. Returns (slots_data, has_updatable_action),
+    or (None, False) after reporting the problem in the status bar.
+    """
     slots_data = []
     has_updatable_action = False
     
@@ -42,10 +183,15 @@ def run_automation_thread(app, full_run=False):
             slot_data['group'] and
             slot_data['slot_id'] not in app.texture_map.get(slot_data['group'], [])
         )
+        applied_state = app.applied_slot_states.get(slot_data['slot_id'])
+        is_replaced = (
+            applied_state is not None and
+            applied_state.get('image_path') != normalize_path(slot.image_path)
+        )
         is_updated = (
             app.is_first_apply or full_run or
             (normalize_path(slot.image_path) in app.updated_image_paths) or
-            (slot_data['mode'] == 'Managed' and is_new_to_group)
+            (slot_data['mode'] == 'Managed' and (is_new_to_group or is_replaced))
         )
         slot_data['is_updated'] = is_updated
         
@@ -55,60 +201,183 @@ def run_automation_thread(app, full_run=False):
         if slot_data['mode'] == 'Managed':
             if not slot_data['image_path']:
                 app.status_bar.set_status('status_warn_no_image', level='warning', slot_id=slot_data['slot_id']+1)
-                return
+                return None, False
             
             if not slot_data['group']:
                 app.status_bar.set_status('status_warn_no_group', level='warning', slot_id=slot_data['slot_id']+1)
                 app.log_to_console(f"Aborting: Slot {slot_data['slot_id']+1} is Managed but has no group name.")
-                return
+                return None, False
             
             if not slot.is_512x512:
                  app.status_bar.set_status('status_warn_not_512', level='warning', slot_id=slot_data['slot_id']+1)
-                 return
+                 return None, False
         slots_data.append(slot_data)
+    return slots_data, has_updatable_action
+
+
+def job_key(slots_data, full_run):
+    """
+    Returns the key under which identical apply requests are coalesced.
+    """
+    return json.dumps([full_run, [
+        (s['slot_id'], s['mode'], s['group'], normalize_path(s['image_path']), s.get('values', {}))
+        for s in slots_data
+    ]], sort_keys=True, default=str)
+
+
+def run_automation_thread(app, full_run=False):
+    """
+    Reads the slots and hands the job to the automation worker. Only the widget reads
+    happen on the UI thread, so the window stays responsive while the worker plans,
+    searches for the app window and runs. While a job is running, further jobs are
+    queued behind it, and a request identical to one still waiting is merged into it.
+    """
+    slots_data, has_updatable_action = collect_slots_data(app, full_run)
     
-    if not full_run and not has_updatable_action:
-        app.status_bar.set_status('status_no_updates')
-        app.log_to_console(app.i18n.t('status_no_updates'))
+    if slots_data is None:
+        return
+    
+    if app.is_automation_running and app.workflow_manager.stop_event.is_set():
+        app.log_to_console("Automation is stopping. Apply request not queued.")
+        return
+    
+    if not app.is_automation_running:
+        app.workflow_manager.clear_stop()
+    job = {
+        'slots_data': slots_data,
+        'texture_map': app.texture_map,
+        'slot_states': dict(app.applied_slot_states),
+        'full_run': full_run,
+        'has_updatable_action': has_updatable_action,
+        'verify_texture_map': app.texture_map_needs_verification,
+        'is_first_apply': app.is_first_apply,
+        'item_key': item_key(slots_data),
+        'is_item_changed': False,
+        'updated_image_paths': set(app.updated_image_paths),
+        'queued_behind': app.is_automation_running,
+        'language': app.i18n.language,
+        'log_callback': app.log_to_console,
+    }
+    
+    if not app.automation_job_queue.put(job, key=job_key(slots_data, full_run)):
+        app.log_to_console("Identical apply request already queued. Merged into it.")
+        app.status_bar.set_status('status_job_coalesced', level='running')
+        return
+    app.queued_job_count += 1
+    
+    if app.is_automation_running:
+        app.log_to_console(f"{'Full' if full_run else 'Fast'} Apply queued behind the running job.")
+        app.status_bar.set_status('status_job_queued', level='running', count=app.queued_job_count - 1)
         return
     app.is_automation_running = True
-    app.fast_apply_button.configure(state="disabled", text=app.i18n.t('apply_button_running'))
-    app.full_apply_button.configure(state="disabled")
+    app.job_chain_failure = None
+    app.fast_apply_button.configure(text=app.i18n.t('queue_fast_apply_button'))
+    app.full_apply_button.configure(text=app.i18n.t('queue_full_apply_button'))
     app.status_bar.set_status('status_running', level='running')
     app.stop_hotkey_id = keyboard.add_hotkey('esc', app.emergency_stop)
-    is_full_run = app.is_first_apply or full_run
-    job = (slots_data, app.texture_map, is_full_run, app.log_to_console)
-    app.automation_job_queue.put(job)
-    app.monitor_automation_thread()
+    app.workflow_manager.profiler.start_main_thread()
+
+
+def preview_automation_plan(app):
+    """
+    Computes the Fast and Full Apply plans for the current slots without running them.
+    Returns a dict of previews keyed by 'fast' and 'full', or None if the slots are invalid.
+    """
+    slots_data, _ = collect_slots_data(app, full_run=False)
+    
+    if slots_data is None:
+        return None
+    previews = {'fast': None}
+    
+    if not app.is_first_apply:
+        previews['fast'] = app.workflow_manager.plan_run(slots_data, app.texture_map, is_full_run=False)
+    full_slots_data, _ = collect_slots_data(app, full_run=True)
+    previews['full'] = app.workflow_manager.plan_run(full_slots_data, app.texture_map, is_full_run=True)
+    return previews
+
+
+def apply_status(app, payload):
+    text_key, level, kwargs = payload
+    app.status_bar.set_status(text_key, level=level, **kwargs)
 
 
-def monitor_automation_thread(app):
-    if not app.automation_result_queue.empty():
-        result_tuple = app.automation_result_queue.get()
-        status = result_tuple[0] if result_tuple else False
+def on_automation_result(app, payload):
+    """
+    Records the result of a finished job, and restores the UI once no more jobs are
+    queued. Dispatched from the automation worker.
+    """
+    result = payload['result']
+    status = result[0] if result else False
+    
+    if status is True:
+        app.is_first_apply = False
+        clear_applied_updates(app, payload['updated_image_paths'], payload['slot_states'])
+        app.texture_map = result[1]
+        app.texture_map_needs_verification = False
+        app.applied_slot_states = payload['slot_states']
+        app.apply_state_store.save(app.texture_map, app.applied_slot_states)
+    elif status not in JOB_NOT_STARTED_STATUSES:
+        app.texture_map_needs_verification = True
+    
+    if status not in (True, 'NO_UPDATES') and app.job_chain_failure is None:
+        app.job_chain_failure = status
+    app.queued_job_count = max(app.queued_job_count - 1, 0)
+    
+    if app.queued_job_count:
+        app.log_to_console(f"Job finished. {app.queued_job_count} queued job(s) remaining.")
+        return
+    app.automation_finished(status=app.job_chain_failure or status)
+
+
+def clear_applied_updates(app, job_updated_paths, slot_states):
+    """
+    Unmarks the images a job saw as updated, except those the watcher has seen change
+    again since the job was built.
+    """
+    applied_digests = {state['image_path']: state['digest'] for state in slot_states.values()}
+    
+    for norm_path in job_updated_paths:
+        record = app.image_digests.get(norm_path)
         
-        if status is True:
-            app.is_first_apply = False
-            app.updated_image_paths.clear()
-            app.texture_map = result_tuple[1]
-        app.automation_finished(status=status)
-    else:
-        app.after(100, app.monitor_automation_thread)
+        if norm_path in applied_digests and record and record['digest'] != applied_digests[norm_path]:
+            continue
+        app.updated_image_paths.discard(norm_path)
+
+
+def on_jobs_cancelled(app, count):
+    """
+    Drops cancelled jobs from the queued count. Dispatched after an emergency stop.
+    """
+    
+    if not count:
+        return
+    app.log_to_console(f"Cancelled {count} queued job(s).")
+    app.queued_job_count = max(app.queued_job_count - count, 0)
+    
+    if not app.queued_job_count and app.is_automation_running:
+        app.automation_finished(status=False)
 
 
 def emergency_stop(app):
     if app.is_automation_running:
         app.log_to_console("EMERGENCY STOP received.")
+        app.dispatcher.post('jobs_cancelled', app.automation_job_queue.cancel_pending())
         app.workflow_manager.request_stop()
 
 
 def automation_finished(app, status=True):
     app.is_automation_running = False
+    app.workflow_manager.profiler.finish_main_thread()
     app.ui_handler.validate_slots_and_update_ui(app)
     app.fast_apply_button.configure(text=app.i18n.t('fast_apply_button'))
+    app.full_apply_button.configure(text=app.i18n.t('full_apply_button'))
     
     if status is True:
         app.status_bar.set_status('status_finished', level='success')
+    elif status == 'NO_UPDATES':
+        app.status_bar.set_status('status_no_updates')
+    elif status == 'ANCHOR_NOT_FOUND':
+        app.status_bar.set_status('status_error_anchor', level='error')
     elif status == 'FAST_APPLY_FAILED':
         app.status_bar.set_status('status_fast_apply_failed', level='error')
     else:
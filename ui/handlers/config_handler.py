@@ -21,6 +21,12 @@ def load_config(app):
                 app.user_agreed = config.get("user_agreement", False)
                 app.debug_mode_var.set(config.get("debug_mode", False))
                 app.workflow_manager.set_debug_mode(app.debug_mode_var.get())
+                app.profile_runs_var.set(config.get("profile_runs", False))
+                app.profile_ui_thread_var.set(config.get("profile_ui_thread", False))
+                app.ui_handler.toggle_profiling(app)
+                app.verbose_log_var.set(config.get("verbose_log", False))
+                app.ui_handler.toggle_verbose_log(app)
+                app.workflow_manager.set_log_levels(config.get("log_levels", {}))
                 return not app.user_agreed
     except (json.JSONDecodeError, FileNotFoundError): pass
     
@@ -29,6 +35,22 @@ def load_config(app):
     return True
 
 
+def restore_apply_state(app):
+    """
+    Restores the texture map and applied slot states saved by the last session, so the
+    first apply can be a Fast Apply. The map is verified on screen before it is trusted.
+    """
+    texture_map, slot_states = app.apply_state_store.load()
+    
+    if not texture_map:
+        return
+    app.texture_map = texture_map
+    app.applied_slot_states = slot_states
+    app.is_first_apply = False
+    app.texture_map_needs_verification = True
+    app.log_to_console_safe(f"Restored texture map from the last session: {texture_map}. It will be verified on the next apply.")
+
+
 def center_and_set_default_geometry(app):
     width, height = 950, 950
     screen_width = app.winfo_screenwidth()
@@ -51,6 +73,9 @@ def save_config(app):
         config["clip_watch_layer_name"] = app.clip_watch_layer_name
         config["user_agreement"] = app.user_agreed
         config["debug_mode"] = app.debug_mode_var.get()
+        config["profile_runs"] = app.profile_runs_var.get()
+        config["profile_ui_thread"] = app.profile_ui_thread_var.get()
+        config["verbose_log"] = app.verbose_log_var.get()
         with open('config.json', 'w') as f: json.dump(config, f, indent=4)
     except IOError:
         app.log_to_console("Error: Could not save configuration.")
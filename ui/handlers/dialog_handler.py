@@ -2,7 +2,8 @@ from ui.dialogs import (
     PresetManagerDialog,
     UserAgreementDialog,
     AutomationSettingsDialog,
-    ClipWatchSettingsDialog
+    ClipWatchSettingsDialog,
+    PlanPreviewDialog
 )
 from utils.clip_watcher import DOWNSCALING_METHODS
 
@@ -26,3 +27,12 @@ def open_preset_manager(app):
 def open_automation_settings(app):
     dialog = AutomationSettingsDialog(app, i18n=app.i18n, config_manager=app.automation_config_manager)
     app.wait_window(dialog)
+
+
+def open_plan_preview(app):
+    previews = app.automation_handler.preview_automation_plan(app)
+    
+    if previews is None:
+        return
+    dialog = PlanPreviewDialog(app, i18n=app.i18n, previews=previews)
+    app.wait_window(dialog)
@@ -1,5 +1,6 @@
 import os
 from utils.file_watcher import normalize_path
+from utils.image_digest import compute_file_digest, compute_image_digest, make_thumbnail
 
 
 def move_slot(app, index, direction):
@@ -24,7 +25,7 @@ def on_slot_image_changed(app, image_path, image_obj=None, removed=False):
     if removed:
         app.updated_image_paths.discard(norm_path)
         
-        if norm_path in app.image_cache: del app.image_cache[norm_path]
+        if norm_path in app.image_digests: del app.image_digests[norm_path]
         app.log_to_console(f"'{os.path.basename(image_path)}' unmarked as updated.")
         return False
     else:
@@ -32,21 +33,50 @@ def on_slot_image_changed(app, image_path, image_obj=None, removed=False):
             app.updated_image_paths.add(norm_path)
             app.log_to_console(f"'{os.path.basename(image_path)}' marked as updated for next apply (no image data for comparison).")
             return True
-        old_img = app.image_cache.get(norm_path)
-        content_is_different = not old_img or old_img.tobytes() != image_obj.tobytes()
+        old_record = app.image_digests.get(norm_path)
+        digest = compute_image_digest(image_path, image_obj)
+        
+        if not old_record and matches_applied_digest(app, norm_path, digest):
+            app.log_to_console(f"Content matches the last applied version of: {os.path.basename(image_path)}. Skipping update mark.")
+            app.image_digests[norm_path] = {'digest': digest, 'thumbnail': make_thumbnail(image_obj)}
+            return False
+        content_is_different = not old_record or old_record['digest'] != digest
         
         if content_is_different:
             app.log_to_console(f"Content changed for: {os.path.basename(image_path)}. Marking for update.")
-            app.image_cache[norm_path] = image_obj
+            app.image_digests[norm_path] = {'digest': digest, 'thumbnail': make_thumbnail(image_obj)}
             app.updated_image_paths.add(norm_path)
             return True
         else:
             app.log_to_console(f"Content is identical for: {os.path.basename(image_path)}. Skipping update mark.")
-            
-            if norm_path not in app.image_cache: app.image_cache[norm_path] = image_obj
             return False
 
 
+def is_content_unchanged(app, image_path):
+    """
+    Checks a file's bytes against its recorded digest without decoding it, so unchanged
+    files reported by the watcher can be skipped cheaply.
+    """
+    record = app.image_digests.get(normalize_path(image_path))
+    
+    if not record:
+        return False
+    return compute_file_digest(image_path) == record['digest']
+
+
+def matches_applied_digest(app, norm_path, digest):
+    """
+    Checks whether a file's current content is exactly what was last applied from it.
+    """
+    
+    if not digest:
+        return False
+    return any(
+        state.get('image_path') == norm_path and state.get('digest') == digest
+        for state in app.applied_slot_states.values()
+    )
+
+
 def on_slot_mode_changed(app, slot_id):
     slot = app.texture_slots[slot_id]
     
@@ -14,8 +14,13 @@ def retranslate_ui(app):
     app.import_button.configure(text=app.i18n.t('import_images_button'))
     app.scrollable_frame.configure(label_text=app.i18n.t('texture_slots_label'))
     app.console_label.configure(text=app.i18n.t('console_title'))
-    app.fast_apply_button.configure(text=app.i18n.t('fast_apply_button') if not app.is_automation_running else app.i18n.t('apply_button_running'))
-    app.full_apply_button.configure(text=app.i18n.t('full_apply_button'))
+    
+    if app.is_automation_running:
+        app.fast_apply_button.configure(text=app.i18n.t('queue_fast_apply_button'))
+        app.full_apply_button.configure(text=app.i18n.t('queue_full_apply_button'))
+    else:
+        app.fast_apply_button.configure(text=app.i18n.t('fast_apply_button'))
+        app.full_apply_button.configure(text=app.i18n.t('full_apply_button'))
     
     for slot in app.texture_slots:
         slot.retranslate()
@@ -37,10 +42,20 @@ def toggle_console(app):
         app.grid_rowconfigure(4, weight=0)
 
 
+def toggle_verbose_log(app):
+    app.console_log.set_level('debug' if app.verbose_log_var.get() else 'info')
+    app.workflow_manager.set_verbose_logging(app.verbose_log_var.get())
+
+
 def toggle_debug_mode(app):
     app.workflow_manager.set_debug_mode(app.debug_mode_var.get())
 
 
+def toggle_profiling(app):
+    app.workflow_manager.profiler.log = app.log_to_console_safe
+    app.workflow_manager.set_profiling(app.profile_runs_var.get(), app.profile_ui_thread_var.get())
+
+
 def on_menu_action(app, action):
     app.menu_bar._close_active_menu()
     action()
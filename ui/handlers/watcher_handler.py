@@ -55,18 +55,22 @@ def update_monitoring_list(app):
     app.ui_handler.validate_slots_and_update_ui(app)
 
 
-def process_image_refresh_queue(app):
-    while not app.image_refresh_queue.empty():
-        image_path = app.image_refresh_queue.get()
-        norm_path = normalize_path(image_path)
-        try:
-            new_img = Image.open(image_path); new_img.load()
-        except Exception as e:
-            app.log_to_console(f"Error loading changed file {os.path.basename(image_path)}: {e}")
-            continue
-        
-        if app.slot_handler.on_slot_image_changed(app, image_path, image_obj=new_img, removed=False):
-            for slot in app.texture_slots:
-                if slot.image_path and normalize_path(slot.image_path) == norm_path:
-                    slot.refresh_preview(new_img)
-    app.after(500, lambda: process_image_refresh_queue(app))
+def on_image_changed(app, image_path):
+    """
+    Handles a change to a watched image, dispatched from the file watcher thread.
+    """
+    norm_path = normalize_path(image_path)
+    
+    if app.slot_handler.is_content_unchanged(app, image_path):
+        app.log_to_console(f"Content is identical for: {os.path.basename(image_path)}. Skipping update mark.")
+        return
+    try:
+        new_img = Image.open(image_path); new_img.load()
+    except Exception as e:
+        app.log_to_console(f"Error loading changed file {os.path.basename(image_path)}: {e}")
+        return
+    
+    if app.slot_handler.on_slot_image_changed(app, image_path, image_obj=new_img, removed=False):
+        for slot in app.texture_slots:
+            if slot.image_path and normalize_path(slot.image_path) == norm_path:
+                slot.refresh_preview(new_img)
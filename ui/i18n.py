@@ -7,7 +7,10 @@ class I18N:
                 'menu_view': "View",
                 'menu_automation': "Automation",
                 'menu_debug_mode': "Enable Debug Images",
+                'menu_profile_runs': "Profile Apply Runs",
+                'menu_profile_ui_thread': "Also Profile UI Thread",
                 'menu_show_console': "Show Console",
+                'menu_verbose_log': "Show Detailed Search Logs",
                 'watch_map_button': "Watch Map File...",
                 'stop_watching_map_button': "Stop Watching '{filename}'",
                 'watch_clip_button': "Watch .clip File...",
@@ -23,6 +26,9 @@ class I18N:
                 'status_warn_no_image_managed': "Warning: Slot {slot_id} is Managed but has no image. Apply is disabled.",
                 'status_no_updates': "Fast Apply: No textures updated. Make sure you've saved/exported.",
                 'status_running': "Automation running... Press ESC to stop.",
+                'status_running_eta': "Automation running (about {seconds}s)... Press ESC to stop.",
+                'status_job_queued': "Apply queued ({count} waiting). Press ESC to stop all.",
+                'status_job_coalesced': "The same apply is already queued.",
                 'status_finished': "Automation finished.",
                 'status_halted': "Automation halted.",
                 'status_fast_apply_failed': "Fast Apply failed: state unknown. Please use Full Apply.",
@@ -33,6 +39,8 @@ class I18N:
                 'fast_apply_button': "Fast Apply",
                 'full_apply_button': "Full Apply",
                 'apply_button_running': "Running...",
+                'queue_fast_apply_button': "Queue Fast Apply",
+                'queue_full_apply_button': "Queue Full Apply",
                 'console_title': "Console Log",
                 'slot_mode': "Apply Mode:",
                 'slot_group': "Template Part:",
@@ -89,6 +97,12 @@ class I18N:
                 'agreement_dialog_close_app': "Close Application",
                 'menu_control_settings': "Control Settings...",
                 'automation_settings_dialog_title': "Automation Control Settings",
+                'menu_preview_plan': "Preview Apply Plan...",
+                'plan_preview_dialog_title': "Apply Plan Preview",
+                'plan_preview_fast': "Fast Apply: {removals} removal(s), {uploads} upload(s), about {seconds}s.",
+                'plan_preview_full': "Full Apply: {removals} removal(s), {uploads} upload(s), about {seconds}s.",
+                'plan_preview_fast_unavailable': "Fast Apply: not available until a Full Apply has been run.",
+                'plan_preview_noop': "Fast Apply: nothing to do.",
                 'reset_to_defaults_button': "Reset to Defaults",
                 'copy_settings_button': "Copy Settings",
                 'paste_settings_button': "Paste Settings",
@@ -106,7 +120,10 @@ class I18N:
                 'menu_view': "表示 (View)",
                 'menu_automation': "自動化 (Automation)",
                 'menu_debug_mode': "デバッグ画像を有効にする",
+                'menu_profile_runs': "適用処理をプロファイルする",
+                'menu_profile_ui_thread': "UIスレッドもプロファイルする",
                 'menu_show_console': "コンソール表示",
+                'menu_verbose_log': "詳細な検索ログを表示",
                 'watch_map_button': "マップファイル監視...",
                 'stop_watching_map_button': "'{filename}'の監視を停止",
                 'watch_clip_button': ".clipファイル監視...",
@@ -122,6 +139,9 @@ class I18N:
                 'status_warn_no_image_managed': "警告: スロット {slot_id} は管理対象ですが画像がありません。適用は無効です。",
                 'status_no_updates': "高速適用: 更新されたテクスチャはありません。何もすることはありません。",
                 'status_running': "自動化実行中... ESCキーで停止。",
+                'status_running_eta': "自動化実行中（約{seconds}秒）... ESCキーで停止。",
+                'status_job_queued': "適用をキューに追加しました（待機中: {count}）。ESCですべて停止します。",
+                'status_job_coalesced': "同じ適用がすでにキューにあります。",
                 'status_finished': "自動化が完了しました。",
                 'status_halted': "自動化が停止しました。",
                 'status_fast_apply_failed': "高速適用に失敗しました: 状態が不明です。完全適用を使用してください。",
@@ -132,6 +152,8 @@ class I18N:
                 'fast_apply_button': "高速適用",
                 'full_apply_button': "完全適用",
                 'apply_button_running': "実行中...",
+                'queue_fast_apply_button': "高速適用を予約",
+                'queue_full_apply_button': "完全適用を予約",
                 'console_title': "コンソールログ",
                 'slot_mode': "モード:",
                 'slot_group': "グループ:",
@@ -188,6 +210,12 @@ class I18N:
                 'agreement_dialog_close_app': "アプリを終了",
                 'menu_control_settings': "コントロール設定...",
                 'automation_settings_dialog_title': "自動化コントロール設定",
+                'menu_preview_plan': "適用プランのプレビュー...",
+                'plan_preview_dialog_title': "適用プランのプレビュー",
+                'plan_preview_fast': "高速適用: 削除 {removals} 件、アップロード {uploads} 件、約{seconds}秒。",
+                'plan_preview_full': "完全適用: 削除 {removals} 件、アップロード {uploads} 件、約{seconds}秒。",
+                'plan_preview_fast_unavailable': "高速適用: 完全適用を一度実行するまで利用できません。",
+                'plan_preview_noop': "高速適用: 実行する操作はありません。",
                 'reset_to_defaults_button': "デフォルトにリセット",
                 'copy_settings_button': "設定をコピー",
                 'paste_settings_button': "設定を貼り付け",
@@ -1,23 +1,28 @@
 import customtkinter as ctk
 import tkinter
 import threading
-from queue import Queue
 from ui.texture_slot import TextureSlotFrame
 from ui.i18n import I18N
 from ui.custom_menu import CustomMenuBar
 from ui.widgets.status_bar import StatusBar
+from ui.widgets.console_log import ConsoleLog
+from ui.dispatcher import Dispatcher
+from automation.job_queue import ApplyJobQueue
 from ui.handlers import (automation_handler, config_handler, dialog_handler,
                        slot_handler, ui_handler, watcher_handler)
 from utils.file_watcher import FileWatcher
 from utils.process_watcher import ProcessWatcher
 from utils.clip_watcher import ClipWatcher, DOWNSCALING_METHODS
 from automation.automation_config import AutomationSettings
+from automation.timing_profile import AUTO_SETTING_SOURCES
 from utils.config_manager import AutomationConfigManager
+from utils.apply_state_store import ApplyStateStore
 
 
 class App(ctk.CTk):
     def __init__(self, preset_manager, workflow_manager):
         super().__init__()
+        self.dispatcher = Dispatcher(self)
         self.preset_manager = preset_manager
         self.workflow_manager = workflow_manager
         self.i18n = I18N()
@@ -28,18 +33,32 @@ class App(ctk.CTk):
         self.ui_handler = ui_handler
         self.watcher_handler = watcher_handler
         self.console = None
-        self.automation_config_manager = AutomationConfigManager(AutomationSettings, log_callback=self.log_to_console_safe)
+        self.console_log = ConsoleLog()
+        self._register_dispatch_handlers()
+        self.automation_config_manager = AutomationConfigManager(
+            AutomationSettings, log_callback=self.log_to_console_safe,
+            auto_capable_settings=AUTO_SETTING_SOURCES.keys()
+        )
         self.clip_watch_layer_name = "full-export-merge"
         self.automation_config_manager.load_settings()
         self.lang_var = ctk.StringVar(value="en")
         self.show_console_var = ctk.BooleanVar(value=False)
+        self.verbose_log_var = ctk.BooleanVar(value=False)
         self.debug_mode_var = ctk.BooleanVar(value=False)
+        self.profile_runs_var = ctk.BooleanVar(value=False)
+        self.profile_ui_thread_var = ctk.BooleanVar(value=False)
         self.user_agreed = False
         self.updated_image_paths = set()
         self.is_first_apply = True
         self.texture_map = {}
-        self.image_cache = {}
+        self.image_digests = {}
+        self.applied_slot_states = {}
+        self.texture_map_needs_verification = False
+        self.queued_job_count = 0
+        self.job_chain_failure = None
+        self.apply_state_store = ApplyStateStore(log_callback=self.log_to_console_safe)
         show_agreement = self.config_handler.load_config(self)
+        self.config_handler.restore_apply_state(self)
         self.bind_all("<KeyPress-Alt_L>", lambda e: self.ui_handler.on_alt_press(self, e))
         self.bind_all("<KeyPress-Alt_R>", lambda e: self.ui_handler.on_alt_press(self, e))
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -49,14 +68,12 @@ class App(ctk.CTk):
         self.texture_slots = []
         self.is_automation_running = False
         self.stop_hotkey_id = None
-        self.image_refresh_queue = Queue()
-        self.automation_job_queue = Queue()
-        self.automation_result_queue = Queue()
+        self.image_refresh_queue = self.dispatcher.channel('image_refresh')
+        self.automation_job_queue = ApplyJobQueue()
         self.file_watcher = FileWatcher(self.image_refresh_queue, self.log_to_console)
         self.process_watcher = ProcessWatcher(self.log_to_console)
         self.clip_watcher = ClipWatcher(self.log_to_console)
         self._create_widgets()
-        self.watcher_handler.process_image_refresh_queue(self)
         self.ui_handler.retranslate_ui(self)
         self.automation_worker_thread = threading.Thread(target=lambda: self.automation_handler.automation_worker(self), daemon=True)
         self.automation_worker_thread.start()
@@ -67,12 +84,24 @@ class App(ctk.CTk):
     def _on_closing(self):
         if self.user_agreed:
             self.config_handler.save_config(self)
-        self.automation_job_queue.put(None)
+        self.automation_job_queue.close()
+        self.dispatcher.close()
         self.file_watcher.stop()
         self.process_watcher.stop()
         self.clip_watcher.stop()
         self.destroy()
     
+    def _register_dispatch_handlers(self):
+        """
+        Routes messages posted by the worker and watcher threads to their UI handlers.
+        """
+        self.dispatcher.register('log', self.console_log.append, max_pending=self.console_log.max_lines)
+        self.dispatcher.on_drained(self.console_log.flush)
+        self.dispatcher.register('status', lambda payload: self.automation_handler.apply_status(self, payload))
+        self.dispatcher.register('automation_result', lambda payload: self.automation_handler.on_automation_result(self, payload))
+        self.dispatcher.register('jobs_cancelled', lambda count: self.automation_handler.on_jobs_cancelled(self, count))
+        self.dispatcher.register('image_refresh', lambda image_path: self.watcher_handler.on_image_changed(self, image_path))
+    
     def _create_widgets(self):
         self._create_menu()
         top_frame = ctk.CTkFrame(self)
@@ -117,6 +146,7 @@ class App(ctk.CTk):
         self.console_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
         self.console = ctk.CTkTextbox(self.console_frame, wrap="word", state="disabled")
         self.console.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
+        self.console_log.attach(self.console)
     
     def _create_menu(self):
         self.menu_bar = CustomMenuBar(self, i18n=self.i18n)
@@ -127,20 +157,36 @@ class App(ctk.CTk):
         view_menu = self.menu_bar.add_cascade('menu_view')
         view_menu.add_checkbutton(text=self.i18n.t('menu_show_console'), text_key='menu_show_console',
                                   variable=self.show_console_var, command=lambda: self.ui_handler.on_menu_action(self, lambda: self.ui_handler.toggle_console(self)))
+        view_menu.add_checkbutton(text=self.i18n.t('menu_verbose_log'), text_key='menu_verbose_log',
+                                  variable=self.verbose_log_var, command=lambda: self.ui_handler.on_menu_action(self, lambda: self.ui_handler.toggle_verbose_log(self)))
         automation_menu = self.menu_bar.add_cascade('menu_automation')
         automation_menu.add_command(text=self.i18n.t('menu_control_settings'), text_key='menu_control_settings',
                                   command=lambda: self.ui_handler.on_menu_action(self, lambda: self.dialog_handler.open_automation_settings(self)))
+        automation_menu.add_command(text=self.i18n.t('menu_preview_plan'), text_key='menu_preview_plan',
+                                  command=lambda: self.ui_handler.on_menu_action(self, lambda: self.dialog_handler.open_plan_preview(self)))
+        automation_menu.add_checkbutton(text=self.i18n.t('menu_debug_mode'), text_key='menu_debug_mode',
+                                  variable=self.debug_mode_var, command=lambda: self.ui_handler.on_menu_action(self, lambda: self.ui_handler.toggle_debug_mode(self)))
+        automation_menu.add_checkbutton(text=self.i18n.t('menu_profile_runs'), text_key='menu_profile_runs',
+                                  variable=self.profile_runs_var, command=lambda: self.ui_handler.on_menu_action(self, lambda: self.ui_handler.toggle_profiling(self)))
+        automation_menu.add_checkbutton(text=self.i18n.t('menu_profile_ui_thread'), text_key='menu_profile_ui_thread',
+                                  variable=self.profile_ui_thread_var, command=lambda: self.ui_handler.on_menu_action(self, lambda: self.ui_handler.toggle_profiling(self)))
     
     def _switch_language(self, lang_code):
         self.lang_var.set(lang_code)
         self.i18n.set_language(lang_code)
         self.ui_handler.retranslate_ui(self)
     
-    def log_to_console(self, message):
-        self.console.configure(state="normal")
-        self.console.insert("end", message + "\n")
-        self.console.configure(state="disabled")
-        self.console.see("end")
+    def log_to_console(self, message, level='info'):
+        """
+        Queues a message for the console. Safe to call from any thread; messages below
+        the console level are dropped here, the rest are written in batches on the Tk thread.
+        """
+        
+        if self.console_log.is_enabled_for(level):
+            self.dispatcher.post('log', message)
+    
+    def log_verbose(self, message):
+        self.log_to_console(message, 'debug')
     
     def import_images(self):
         self.ui_handler.import_images(self)
@@ -148,12 +194,9 @@ class App(ctk.CTk):
     def log_to_console_safe(self, message):
         """
         A version of log_to_console that can be called before the UI is fully built.
+        Messages logged before then are shown once the console exists.
         """
-        
-        if self.console:
-            self.log_to_console(message)
-        else:
-            print(message)
+        self.log_to_console(message)
     
     def select_clip_file_to_watch(self):
         self.watcher_handler.select_clip_file_to_watch(self)
@@ -164,9 +207,6 @@ class App(ctk.CTk):
     def run_automation_thread(self, full_run=False):
         self.automation_handler.run_automation_thread(self, full_run)
     
-    def monitor_automation_thread(self):
-        self.automation_handler.monitor_automation_thread(self)
-    
     def emergency_stop(self):
         self.automation_handler.emergency_stop(self)
     
@@ -2,6 +2,7 @@ import customtkinter as ctk
 from tkinter import filedialog
 from PIL import Image
 import os
+from utils.image_digest import make_thumbnail
 
 
 class TextureSlotFrame(ctk.CTkFrame):
@@ -199,8 +200,8 @@ class TextureSlotFrame(ctk.CTkFrame):
         else:
             self.hide_warning()
             self.is_512x512 = True
-        self.pil_image_preview = image_obj
-        self.ctk_image_preview = ctk.CTkImage(light_image=image_obj, dark_image=image_obj, size=(128, 128))
+        self.pil_image_preview = make_thumbnail(image_obj)
+        self.ctk_image_preview = ctk.CTkImage(light_image=self.pil_image_preview, dark_image=self.pil_image_preview, size=(128, 128))
         self.image_label.configure(image=self.ctk_image_preview, text="")
     
     def show_warning(self, message):
@@ -0,0 +1,59 @@
+from collections import deque
+LOG_LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40}
+
+
+class ConsoleLog:
+    """
+    Writes console messages to a textbox in batches: messages are appended on the Tk
+    thread as they are dispatched and written with one insert per batch. Messages
+    below the current level are dropped before they are queued, and the textbox keeps
+    at most max_lines lines.
+    """
+    MAX_LINES = 2000
+    
+    def __init__(self, level='info', max_lines=MAX_LINES):
+        self.level = LOG_LEVELS[level]
+        self.max_lines = max_lines
+        self.pending = deque(maxlen=max_lines)
+        self.textbox = None
+        self.line_count = 0
+    
+    def set_level(self, level):
+        self.level = LOG_LEVELS[level]
+    
+    def is_enabled_for(self, level):
+        return LOG_LEVELS.get(level, LOG_LEVELS['info']) >= self.level
+    
+    def append(self, message):
+        """
+        Adds a message to the next batch. Called on the Tk thread.
+        """
+        self.pending.append(message)
+    
+    def attach(self, textbox):
+        """
+        Starts writing batches into a textbox, beginning with the messages logged
+        before it existed.
+        """
+        self.textbox = textbox
+        self.flush()
+    
+    def flush(self):
+        """
+        Writes the pending batch to the textbox and trims it to max_lines.
+        """
+        
+        if self.textbox is None or not self.pending:
+            return
+        text = "\n".join(self.pending) + "\n"
+        self.pending.clear()
+        self.textbox.configure(state="normal")
+        self.textbox.insert("end", text)
+        self.line_count += text.count("\n")
+        excess = self.line_count - self.max_lines
+        
+        if excess > 0:
+            self.textbox.delete("1.0", f"{excess + 1}.0")
+            self.line_count -= excess
+        self.textbox.configure(state="disabled")
+        self.textbox.see("end")
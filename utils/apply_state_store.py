@@ -0,0 +1,80 @@
+import json
+import os
+from utils.image_digest import compute_file_digest
+from utils.file_watcher import normalize_path
+
+
+class ApplyStateStore:
+    """
+    Persists what the last successful apply left in the Creator: the per-group texture map,
+    and for each applied slot its image path, content digest, group and parameter values.
+    This lets the first apply after a restart be a Fast Apply when nothing has changed.
+    """
+    def __init__(self, state_path='apply_state.json', log_callback=print):
+        self.state_path = state_path
+        self.log = log_callback
+    
+    def load(self):
+        """
+        Loads the saved state. Returns (texture_map, slot_states), both empty if there is
+        no usable saved state.
+        """
+        
+        if not os.path.exists(self.state_path):
+            return {}, {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            texture_map = {
+                group_name: [int(slot_id) for slot_id in slot_ids]
+                for group_name, slot_ids in data.get('texture_map', {}).items()
+            }
+            slot_states = {int(slot_id): state for slot_id, state in data.get('slots', {}).items()}
+            return texture_map, slot_states
+        except (json.JSONDecodeError, IOError, ValueError, TypeError, AttributeError) as e:
+            self.log(f"Could not load saved apply state: {e}")
+            return {}, {}
+    
+    def build_slot_states(self, slots_data):
+        """
+        Builds the per-slot record of what was applied for the given slots. The digest
+        taken when the job started (the image that was uploaded) is recorded, so a
+        file changed during the run is still seen as changed afterwards.
+        """
+        slot_states = {}
+        
+        for s in slots_data:
+            if s['mode'] != 'Managed' or not s.get('image_path'):
+                continue
+            slot_states[s['slot_id']] = {
+                'image_path': normalize_path(s['image_path']),
+                'digest': s['digest'] if 'digest' in s else compute_file_digest(s['image_path']),
+                'group': s.get('group'),
+                'values': s.get('values', {}),
+            }
+        return slot_states
+    
+    def save(self, texture_map, slot_states):
+        """
+        Saves the texture map and per-slot states to the JSON file.
+        """
+        data = {
+            'texture_map': texture_map,
+            'slots': {str(slot_id): state for slot_id, state in slot_states.items()},
+        }
+        try:
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=4)
+        except IOError as e:
+            self.log(f"Error: Could not save apply state to {self.state_path}. Error: {e}")
+    
+    def clear(self):
+        """
+        Removes the saved state, e.g. after a run that left the Creator in an unknown state.
+        """
+        
+        if os.path.exists(self.state_path):
+            try:
+                os.remove(self.state_path)
+            except OSError as e:
+                self.log(f"Error: Could not remove apply state {self.state_path}. Error: {e}")
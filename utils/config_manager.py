@@ -1,6 +1,7 @@
 import json
 import os
 import inspect
+AUTO_VALUE = "auto"
 
 
 class AutomationConfigManager:
@@ -8,11 +9,13 @@ class AutomationConfigManager:
     Manages loading and saving of automation settings to a JSON file,
     while using a settings class for defaults.
     """
-    def __init__(self, settings_class, config_path='automation_config.json', log_callback=print):
+    def __init__(self, settings_class, config_path='automation_config.json', log_callback=print, auto_capable_settings=()):
         self.settings_class = settings_class
         self.config_path = config_path
         self.log = log_callback
         self.defaults = self._get_class_defaults()
+        self.auto_capable_settings = set(auto_capable_settings)
+        self.auto_settings = set()
     
     def _get_class_defaults(self):
         """
@@ -40,17 +43,47 @@ class AutomationConfigManager:
                 pass
         final_settings = self.defaults.copy()
         final_settings.update(loaded_settings)
+        self.auto_settings = set()
         
         for key, value in final_settings.items():
+            if value == AUTO_VALUE and key in self.auto_capable_settings:
+                self.auto_settings.add(key)
+                value = self.defaults[key]
             setattr(self.settings_class, key, value)
     
     def save_settings(self):
         """
         Saves the current state of the settings class to the JSON file.
         """
-        settings_to_save = {name: getattr(self.settings_class, name) for name in self.defaults}
+        settings_to_save = {
+            name: AUTO_VALUE if name in self.auto_settings else getattr(self.settings_class, name)
+            for name in self.defaults
+        }
         try:
             with open(self.config_path, 'w') as f:
                 json.dump(settings_to_save, f, indent=4)
         except IOError as e:
             self.log(f"Error: Could not save automation configuration to {self.config_path}. Error: {e}")
+    
+    def set_auto(self, name, enabled):
+        """
+        Marks a setting as derived automatically ("auto") or manually set.
+        """
+        
+        if enabled and name in self.auto_capable_settings:
+            self.auto_settings.add(name)
+        else:
+            self.auto_settings.discard(name)
+    
+    def resolve_auto_settings(self, derive):
+        """
+        Sets every "auto" setting on the live settings class to the value returned by
+        derive(name, default). Returns {name: value} for the resolved settings.
+        """
+        resolved = {}
+        
+        for name in sorted(self.auto_settings):
+            value = derive(name, self.defaults[name])
+            setattr(self.settings_class, name, value)
+            resolved[name] = value
+        return resolved
@@ -0,0 +1,57 @@
+import hashlib
+from PIL import Image
+CHUNK_SIZE = 1 << 16
+PIXEL_BAND_ROWS = 64
+THUMBNAIL_SIZE = (128, 128)
+
+
+def compute_file_digest(path):
+    """
+    Computes a digest of a file's contents, reading it in chunks so the file is never
+    held in memory at once. Returns None if the file cannot be read.
+    """
+    
+    if not path:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+    except (IOError, OSError):
+        return None
+    return digest.hexdigest()
+
+
+def compute_pixel_digest(image_obj):
+    """
+    Computes a digest of a decoded image's pixels, hashing it in horizontal bands so no
+    full byte copy of the image is made.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image_obj.mode}:{image_obj.size}".encode())
+    width, height = image_obj.size
+    
+    for top in range(0, height, PIXEL_BAND_ROWS):
+        band = image_obj.crop((0, top, width, min(height, top + PIXEL_BAND_ROWS)))
+        digest.update(band.tobytes())
+    return digest.hexdigest()
+
+
+def compute_image_digest(path, image_obj=None):
+    """
+    Returns a digest of an image's file bytes, falling back to a pixel digest of the
+    decoded image if the file cannot be read (e.g. it is being rewritten).
+    """
+    digest = compute_file_digest(path)
+    
+    if digest is None and image_obj is not None:
+        return f"pixels:{compute_pixel_digest(image_obj)}"
+    return digest
+
+
+def make_thumbnail(image_obj, size=THUMBNAIL_SIZE):
+    """
+    Returns a small copy of an image for previews, so the decoded original can be released.
+    """
+    return image_obj.resize(size, Image.Resampling.LANCZOS)